@@ -31,6 +31,7 @@ from src.routes.points import points_bp
 from src.db import metadata, kid_db
 from src.db.shared_deck_db import init_shared_decks_database, get_shared_decks_connection, rebuild_shared_decks_database
 from src.startup_backfills import ensure_kid_db_schema
+from src.json_provider import OrjsonJSONProvider
 from src.audio_cleanup import start_kid_audio_cleanup_scheduler
 from src.security_rate_limit import (
     LOGIN_RATE_LIMITER,
@@ -45,6 +46,8 @@ DATA_DIR = os.path.join(BACKEND_DIR, 'data')
 FAMILIES_ROOT = os.path.join(DATA_DIR, 'families')
 SESSION_AUTH_TOKEN_KEY = 'auth_token'
 PERMANENT_SESSION_DAYS = 3650
+_PUBLIC_STATIC_ASSET_SUFFIXES = ('.css', '.js', '.png', '.jpg', '.jpeg', '.svg', '.ico', '.webmanifest')
+_PUBLIC_FRONTEND_PATHS = frozenset({'/', '/index.html', '/family-login.html', '/family-register.html'})
 
 
 def _require_secret_key():
@@ -62,6 +65,7 @@ def create_app():
     # === 1. App config + auth helper closures
     # =================================================================
     app = Flask(__name__)
+    app.json = OrjsonJSONProvider(app)
     CORS(app, origins=os.environ.get('CORS_ORIGINS', 'http://localhost:5001').split(','))
     app.config['SECRET_KEY'] = _require_secret_key()
     app.config['SESSION_COOKIE_HTTPONLY'] = True
@@ -160,24 +164,16 @@ def create_app():
         # whole metadata file under a process-wide lock, and a single page load
         # pulls in ~15 of these assets. Skipping it here is the bulk of the win.
         if (
-            path.endswith('.css')
-            or path.endswith('.js')
-            or path.endswith('.png')
-            or path.endswith('.jpg')
-            or path.endswith('.jpeg')
-            or path.endswith('.svg')
-            or path.endswith('.ico')
-            or path.endswith('.webmanifest')
+            path.endswith(_PUBLIC_STATIC_ASSET_SUFFIXES)
             or path.startswith('/fonts/')
             or path == '/robots.txt'
         ):
             return None
 
-        public_frontend_paths = {'/', '/index.html', '/family-login.html', '/family-register.html'}
         if not is_family_authenticated():
             if path.startswith('/api/'):
                 return jsonify({'error': 'Family login required'}), 401
-            if path in public_frontend_paths:
+            if path in _PUBLIC_FRONTEND_PATHS:
                 return None
             next_path = request.full_path if request.query_string else request.path
             if next_path.endswith('?'):
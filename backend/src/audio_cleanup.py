@@ -168,7 +168,8 @@ def cleanup_old_kid_audio(logger=None, *, now=None, retention_days=KID_AUDIO_RET
             newer_existing_cards = set()
             conn = None
             try:
-                conn = kid_db.get_kid_connection_by_path(db_file_path)
+                # Unpooled: a sweep over every kid should not evict hot request handles.
+                conn = kid_db.get_unpooled_kid_connection_by_path(db_abs_path)
                 rows = conn.execute(_AUDIO_ROWS_SQL).fetchall()
 
                 for row in rows:
@@ -15,7 +15,7 @@ Layout (search for `# === N. ` banner markers to jump between sections):
     4. Family lookup + auth (list, get, by-username, register, authenticate,
        verify password, is_super_family, trusted browsers)
     5. Family lifecycle (delete, update password)
-    6. Family settings (timezone get/set)
+    6. Family settings (timezone get/set + TTL cache)
 """
 import json
 import os
@@ -23,6 +23,7 @@ import hashlib
 import secrets
 import tempfile
 import threading
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 import fcntl
@@ -534,7 +535,9 @@ def delete_family(family_id: str) -> Dict:
         data['kids'] = next_kids
         return {'deleted': True, 'family': target_family, 'kids': deleted_kids}
 
-    return _mutate_metadata(_op)
+    result = _mutate_metadata(_op)
+    invalidate_family_timezone_cache(family_id)
+    return result
 
 
 def update_family_password(family_id: str, current_password: str, new_password: str) -> bool:
@@ -569,12 +572,43 @@ def update_family_password(family_id: str, current_password: str, new_password:
 # =====================================================================
 # === 6. Family settings (timezone)
 # =====================================================================
+# Most parent/kid reads need the family timezone, and each lookup would
+# otherwise re-read kids.json under the file lock. Writers below drop the
+# cached entry; the generation guards against caching a read that raced
+# with one of them.
+_FAMILY_TIMEZONE_CACHE_TTL = 60
+_family_timezone_cache: Dict[str, tuple] = {}
+_family_timezone_cache_generation = 0
+_family_timezone_cache_lock = threading.Lock()
+
+
+def invalidate_family_timezone_cache(family_id: Optional[str] = None):
+    """Drop one family's cached timezone, or every entry when family_id is None."""
+    global _family_timezone_cache_generation
+    with _family_timezone_cache_lock:
+        _family_timezone_cache_generation += 1
+        if family_id is None:
+            _family_timezone_cache.clear()
+        else:
+            _family_timezone_cache.pop(str(family_id), None)
+
+
 def get_family_timezone(family_id: str) -> str:
     """Get the configured family timezone."""
-    family = get_family_by_id(str(family_id or ''))
+    family_key = str(family_id or '')
+    cached = _family_timezone_cache.get(family_key)
+    if cached is not None and time.monotonic() - cached[0] < _FAMILY_TIMEZONE_CACHE_TTL:
+        return cached[1]
+
+    generation = _family_timezone_cache_generation
+    family = get_family_by_id(family_key)
     if not family:
         raise KeyError(f'Family not found: {family_id}')
-    return _validate_family_timezone(family.get('familyTimezone'))
+    timezone_name = _validate_family_timezone(family.get('familyTimezone'))
+    with _family_timezone_cache_lock:
+        if _family_timezone_cache_generation == generation:
+            _family_timezone_cache[family_key] = (time.monotonic(), timezone_name)
+    return timezone_name
 
 
 def update_family_timezone(family_id: str, family_timezone: str) -> bool:
@@ -594,4 +628,6 @@ def update_family_timezone(family_id: str, family_timezone: str) -> bool:
             return True
         return False
 
-    return _mutate_metadata(_op)
+    updated = _mutate_metadata(_op)
+    invalidate_family_timezone_cache(family_id)
+    return updated
@@ -134,5 +134,6 @@ CREATE INDEX IF NOT EXISTS idx_cards_deck_id ON cards(deck_id);
 CREATE INDEX IF NOT EXISTS idx_sessions_type_completed ON sessions(type, completed_at);
 CREATE INDEX IF NOT EXISTS idx_session_results_session_id ON session_results(session_id);
 CREATE INDEX IF NOT EXISTS idx_session_results_card_id ON session_results(card_id);
+CREATE INDEX IF NOT EXISTS idx_lesson_reading_audio_file_name ON lesson_reading_audio(file_name);
 CREATE INDEX IF NOT EXISTS idx_pending_off_app_chore_rule ON pending_off_app_chore(rule_id);
 CREATE INDEX IF NOT EXISTS idx_point_event_rule_created ON point_event(rule_id, created_at);
@@ -0,0 +1,65 @@
+"""orjson-backed Flask JSON provider.
+
+`jsonify`, `request.get_json` and the blueprint error handlers all go through
+`app.json`. This provider swaps the stdlib encoder for orjson while keeping
+Flask's encoding of non-native values (dates as HTTP dates, Decimal/UUID as
+strings, dataclasses as dicts, `__html__` objects). Calls orjson can't honor
+(pretty-printing, custom `json.dumps` kwargs, ints wider than 64 bits) fall
+back to the stdlib provider.
+"""
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _orjson_default(value):
+    """Encode the non-native types the same way Flask's default provider does."""
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, '__html__'):
+        return str(value.__html__())
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def orjson_dumps(obj, *, sort_keys=False):
+    """Serialize `obj` to compact JSON bytes with the provider's encoding rules."""
+    option = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+    return orjson.dumps(obj, default=_orjson_default, option=option)
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        if set(kwargs) - {'sort_keys'}:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson_dumps(obj, sort_keys=kwargs.get('sort_keys', self.sort_keys)).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson_dumps(obj, sort_keys=self.sort_keys)
+        except orjson.JSONEncodeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
@@ -6,16 +6,17 @@ import tempfile
 from datetime import datetime
 import shutil
 import json
-from src.db import metadata
+from src.db import metadata, kid_db
+from src.services.kid_daily_progress import invalidate_today_session_rows_cache
 
 backup_bp = Blueprint('backup', __name__)
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
 FULL_BACKUP_MANIFEST = 'full_manifest.json'
-EXCLUDED_BACKUP_REL_PATHS = {
+EXCLUDED_BACKUP_REL_PATHS = frozenset({
     'debug.ipynb',
     'kids.json.lock',
-}
+})
 
 
 def _normalize_rel_path(path_value):
@@ -123,6 +124,8 @@ def download_backup():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         temp_dir = tempfile.mkdtemp()
         zip_path = os.path.join(temp_dir, f'kids_learning_full_backup_{timestamp}.zip')
+        # Let pooled kid DBs close (and checkpoint their WAL) before copying.
+        kid_db.release_kid_db_handles()
         files_to_include = _iter_data_files()
 
         manifest = {
@@ -208,6 +211,7 @@ def restore_backup():
                 with zipf.open(rel_path) as src, open(target_abs, 'wb') as dst:
                     shutil.copyfileobj(src, dst)
 
+        kid_db.release_kid_db_handles()
         _clear_directory_contents(DATA_DIR)
         for root, _, files in os.walk(stage_data_dir):
             for file_name in files:
@@ -218,6 +222,8 @@ def restore_backup():
                 shutil.copy2(src_abs, target_abs)
 
         metadata.ensure_metadata_file()
+        metadata.invalidate_family_timezone_cache()
+        invalidate_today_session_rows_cache()
 
         return jsonify({
             'success': True,
@@ -3,7 +3,9 @@
 Layout (search for `# ===` markers to jump between sections):
 
     1. Imports (stdlib, services, sibling-route-module helpers)
-    2. Module state — `_SHARED_DECK_MUTATION_LOCK` + small helpers
+    2. Module state — `_SHARED_DECK_MUTATION_LOCK`, blueprint error
+       handlers (ValueError → 400, anything else → 500),
+       `json_array_stream_response` + small helpers
     3. Shared-deck scope dispatch — scope/op constants + CATEGORY_CONFIG
     4. Type-specific cards handlers — `get_shared_type<N>_cards`
     5. Request-parsing helpers — Flask `request.*` extractors
@@ -17,18 +19,19 @@ Most logic now lives in `src/services/*`; this file holds Flask-level
 plumbing (auth, request parsing, response framing, mutation lock) and
 the dispatch table that wires URL scopes to handlers.
 """
-from flask import Blueprint, request, jsonify, send_from_directory, send_file
+from flask import Blueprint, Response, request, jsonify, send_from_directory, send_file
 from datetime import datetime, timezone
 from collections import defaultdict
 import json
 import os
 import shutil
-import subprocess
 import uuid
 import time
 import threading
 import mimetypes
 from io import BytesIO
+import orjson
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
 from src.chinese_character_meanings import (
     get_character_bank_pinyin,
@@ -36,6 +39,7 @@ from src.chinese_character_meanings import (
     is_single_chinese_character,
 )
 from src.db import metadata, kid_db
+from src.json_provider import orjson_dumps
 from src.db.shared_deck_db import get_shared_decks_connection
 from src.type4_generator_preview import preview_type4_generator, run_type4_generator, test_type4_validate
 from src.routes.kids_constants import *  # noqa: F401,F403
@@ -69,11 +73,50 @@ from src.services.shared_deck_queries import (
 # 2. Module state
 #   `_SHARED_DECK_MUTATION_LOCK` serializes opt-in/opt-out across kids
 #   (acquired by handlers below before mutating per-kid DBs).
+#   Blueprint error handlers frame uncaught route errors as JSON, so
+#   routes don't need a whole-body try/except of their own.
 # ====================================================================
 
 _SHARED_DECK_MUTATION_LOCK = threading.RLock()
 
 
+@kids_bp.errorhandler(ValueError)
+def handle_kids_value_error(e):
+    """Map an uncaught ValueError (bad caller input) to a JSON 400."""
+    return jsonify({'error': str(e)}), 400
+
+
+@kids_bp.errorhandler(Exception)
+def handle_kids_unexpected_error(e):
+    """Map any other uncaught route error to a JSON error response.
+
+    Routes without their own try/except rely on this instead of wrapping
+    the whole body; HTTP errors keep their status code.
+    """
+    if isinstance(e, HTTPException):
+        return jsonify({'error': e.description}), e.code
+    return jsonify({'error': str(e)}), 500
+
+
+def json_array_stream_response(payload, array_key, items):
+    """Stream `payload` as a JSON object whose `array_key` list is encoded item by item.
+
+    `items` is consumed lazily while the body is sent, so the caller keeps
+    whatever backs it (e.g. a DB cursor) open until the response closes —
+    register the cleanup with `response.call_on_close(...)`.
+    """
+    def _generate():
+        head = orjson_dumps(payload)
+        yield head[:-1] + (b',' if payload else b'') + orjson.dumps(array_key) + b':['
+        separator = b''
+        for item in items:
+            yield separator + orjson_dumps(item)
+            separator = b','
+        yield b']}'
+
+    return Response(_generate(), mimetype='application/json')
+
+
 def get_family_root(family_id):
     """Return filesystem root for one family."""
     return os.path.join(FAMILIES_ROOT, f'family_{family_id}')
@@ -86,6 +129,7 @@ def encode_retry_recovered_session_result(existing_retry_count):
 
 
 from src.services.writing_audio import (
+    add_writing_prompt_audio_to_cards,
     build_shared_type1_prompt_audio_file_name,
     build_shared_writing_audio_file_name,
     build_type_i_chinese_prompt_audio_payload,
@@ -251,31 +295,26 @@ def dispatch_shared_deck_scope_operation(scope, operation, kid_id, card_id=None)
 
 def get_shared_type1_cards(kid_id):
     """Get merged cards across opted-in type-I decks and orphan deck."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+    conn = get_kid_connection_for(kid, read_only=True)
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-        conn = get_kid_connection_for(kid, read_only=True)
-        try:
-            category_key, _ = resolve_kid_type_i_category_with_mode(
-                kid,
-                request.args.get('categoryKey'),
-                conn=conn,
-            )
-            payload = build_type_i_shared_cards_payload(
-                kid,
-                category_key,
-                include_practiced_from_other=parse_include_practiced_from_other_arg(),
-                conn=conn,
-            )
-            payload.update(build_kid_daily_progress_section(kid, category_key, conn=conn))
-        finally:
-            conn.close()
-        return jsonify(payload), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        category_key, _ = resolve_kid_type_i_category_with_mode(
+            kid,
+            request.args.get('categoryKey'),
+            conn=conn,
+        )
+        payload = build_type_i_shared_cards_payload(
+            kid,
+            category_key,
+            include_practiced_from_other=parse_include_practiced_from_other_arg(),
+            conn=conn,
+        )
+        payload.update(build_kid_daily_progress_section(kid, category_key, conn=conn))
+    finally:
+        conn.close()
+    return jsonify(payload), 200
 
 
 # ====================================================================
@@ -288,6 +327,24 @@ def parse_include_practiced_from_other_arg():
     return raw in {'1', 'true', 'yes', 'on'}
 
 
+def parse_complete_payload():
+    """Parse a practice-complete JSON body with orjson (empty body → `{}`).
+
+    Reads the raw body uncached and skips Werkzeug's content-type sniffing;
+    a malformed or non-object body raises ValueError (→ 400).
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        payload = orjson.loads(raw) or {}
+    except orjson.JSONDecodeError:
+        raise ValueError('Request body must be valid JSON') from None
+    if not isinstance(payload, dict):
+        raise ValueError('Request body must be a JSON object')
+    return payload
+
+
 def parse_shared_card_skip_update_request(card_id):
     """Parse shared-card skip update payload and return (card_id_int, skipped)."""
     try:
@@ -918,280 +975,262 @@ def run_shared_deck_scope_operation(operation, kid_id, category, *, card_id=None
 
 def get_shared_type3_cards(kid_id):
     """Get merged cards across opted-in type-III decks and orphan deck."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-        category_key, _ = resolve_kid_type_iii_category_with_mode(
-            kid,
-            request.args.get('categoryKey'),
-        )
-        payload = build_type_i_shared_cards_payload(
-            kid,
-            category_key,
-            include_practiced_from_other=parse_include_practiced_from_other_arg(),
-        )
-        payload.update(build_kid_daily_progress_section(kid, category_key))
-        return jsonify(payload), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+    category_key, _ = resolve_kid_type_iii_category_with_mode(
+        kid,
+        request.args.get('categoryKey'),
+    )
+    payload = build_type_i_shared_cards_payload(
+        kid,
+        category_key,
+        include_practiced_from_other=parse_include_practiced_from_other_arg(),
+    )
+    payload.update(build_kid_daily_progress_section(kid, category_key))
+    return jsonify(payload), 200
 
 
 def get_shared_type4_cards(kid_id):
     """Get representative cards across opted-in type-IV decks."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-        category_key, _ = resolve_kid_type_iv_category_with_mode(
-            kid,
-            request.args.get('categoryKey'),
-        )
-        payload = build_type_iv_shared_cards_payload(
-            kid,
-            category_key,
-        )
-        payload.update(build_kid_daily_progress_section(kid, category_key))
-        return jsonify(payload), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+    category_key, _ = resolve_kid_type_iv_category_with_mode(
+        kid,
+        request.args.get('categoryKey'),
+    )
+    payload = build_type_iv_shared_cards_payload(
+        kid,
+        category_key,
+    )
+    payload.update(build_kid_daily_progress_section(kid, category_key))
+    return jsonify(payload), 200
 
 
 def get_shared_type2_cards(kid_id):
     """Get merged cards across opted-in type-II decks and orphan deck."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        request.args.get('categoryKey'),
+    )
+    category_display_name = get_deck_category_display_name(
+        category_key,
+        get_shared_deck_category_meta_by_key(),
+    )
+
+    conn = get_kid_connection_for(kid, read_only=True)
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        sources = get_shared_merged_source_decks_for_kid(
+            conn,
             kid,
-            request.args.get('categoryKey'),
-        )
-        category_display_name = get_deck_category_display_name(
             category_key,
-            get_shared_deck_category_meta_by_key(),
         )
-
-        conn = get_kid_connection_for(kid, read_only=True)
-        try:
-            sources = get_shared_merged_source_decks_for_kid(
+        bank_sources = [
+            src for src in sources
+            if int(src.get('card_count') or 0) > 0 and bool(src.get('included_in_bank', True))
+        ]
+        bank_deck_ids = [int(src['local_deck_id']) for src in bank_sources]
+        practice_sources = [src for src in sources if bool(src.get('included_in_queue'))]
+        practice_source_ids = [
+            int(src['local_deck_id'])
+            for src in practice_sources
+            if int(src.get('active_card_count') or 0) > 0
+        ]
+
+        pending_card_ids = []
+        pending_card_set = set()
+        candidate_rows = []
+        candidate_card_ids = []
+        candidate_card_set = set()
+        candidate_reason_by_card = {}
+        if has_chinese_specific_logic:
+            pending_card_ids = get_pending_writing_card_ids(conn)
+            pending_card_set = set(pending_card_ids)
+            candidate_rows = get_writing_candidate_rows(
                 conn,
-                kid,
+                bank_deck_ids,
                 category_key,
+                excluded_card_ids=pending_card_ids,
             )
-            bank_sources = [
-                src for src in sources
-                if int(src.get('card_count') or 0) > 0 and bool(src.get('included_in_bank', True))
-            ]
-            bank_deck_ids = [int(src['local_deck_id']) for src in bank_sources]
-            practice_sources = [src for src in sources if bool(src.get('included_in_queue'))]
-            practice_source_ids = [
-                int(src['local_deck_id'])
+            for row in candidate_rows:
+                card_id = int(row[0])
+                candidate_card_ids.append(card_id)
+                if row[3] is None:
+                    candidate_reason_by_card[card_id] = ('never_seen', 'Newly added')
+                else:
+                    candidate_reason_by_card[card_id] = ('last_failed', 'Last failed')
+            candidate_card_set = set(candidate_card_ids)
+        special_ready_payload = build_special_session_ready_payload(
+            conn,
+            kid,
+            category_key,
+            source_by_deck_id={
+                int(src['local_deck_id']): src
                 for src in practice_sources
                 if int(src.get('active_card_count') or 0) > 0
-            ]
-
-            pending_card_ids = []
-            pending_card_set = set()
-            candidate_rows = []
-            candidate_card_ids = []
-            candidate_card_set = set()
-            candidate_reason_by_card = {}
-            preview_excluded_ids = []
-            if has_chinese_specific_logic:
-                pending_card_ids = get_pending_writing_card_ids(conn)
-                pending_card_set = set(pending_card_ids)
-                preview_excluded_ids = list(pending_card_set)
-                candidate_rows = get_writing_candidate_rows(
-                    conn,
-                    bank_deck_ids,
-                    category_key,
-                    excluded_card_ids=pending_card_ids,
-                )
-                candidate_card_ids = [int(row[0]) for row in candidate_rows]
-                candidate_card_set = set(candidate_card_ids)
-                for row in candidate_rows:
-                    card_id = int(row[0])
-                    latest_correct = int(row[3]) if row[3] is not None else None
-                    if latest_correct is None:
-                        candidate_reason_by_card[card_id] = ('never_seen', 'Newly added')
-                    else:
-                        candidate_reason_by_card[card_id] = ('last_failed', 'Last failed')
-            special_ready_payload = build_special_session_ready_payload(
+            },
+            source_deck_ids=practice_source_ids,
+            excluded_card_ids=pending_card_ids,
+        )
+
+        preview_order = {}
+        practice_priority_preview_by_card_id = {}
+        practice_priority_subject_baseline = {
+            'p50_correct_time': None,
+            'p95_correct_time': None,
+            'correct_sample_count': 0,
+        }
+        if practice_source_ids:
+            priority_preview = build_practice_priority_preview_for_decks(
                 conn,
-                kid,
+                practice_source_ids,
                 category_key,
-                source_by_deck_id={
-                    int(src['local_deck_id']): src
-                    for src in practice_sources
-                    if int(src.get('active_card_count') or 0) > 0
-                },
-                source_deck_ids=practice_source_ids,
+                get_session_behavior_type(category_key),
                 excluded_card_ids=pending_card_ids,
             )
-
-            preview_order = {}
-            practice_priority_preview_by_card_id = {}
-            practice_priority_subject_baseline = {
-                'p50_correct_time': None,
-                'p95_correct_time': None,
-                'correct_sample_count': 0,
-            }
-            if practice_source_ids:
-                priority_preview = build_practice_priority_preview_for_decks(
-                    conn,
-                    practice_source_ids,
-                    category_key,
-                    get_session_behavior_type(category_key),
-                    excluded_card_ids=preview_excluded_ids,
-                )
-                preview_order = priority_preview['order_by_card_id']
-                practice_priority_preview_by_card_id = priority_preview['details_by_card_id']
-                practice_priority_subject_baseline = priority_preview['subject_baseline']
-
-            orphan_deck_name = get_category_orphan_deck_name(category_key)
-
-            def _source_label(source):
-                tags = extract_shared_deck_tags_and_labels(source.get('tags') or [])[0]
-                tail = tags[1:] if len(tags) > 1 else []
-                if tail:
-                    return ' / '.join(tail)
-                local_name = str(source.get('local_name') or '')
-                if local_name == orphan_deck_name:
-                    return 'orphan'
-                return local_name
-
-            bank_deck_ids = [int(src['local_deck_id']) for src in bank_sources if int(src.get('local_deck_id') or 0) > 0]
-            card_rows_by_deck_id = {}
-            for row in get_cards_with_stats_for_deck_ids(conn, bank_deck_ids):
-                deck_id = int(row[1] or 0)
-                if deck_id > 0:
-                    card_rows_by_deck_id.setdefault(deck_id, []).append(row)
-
-            merged_cards = []
-            for src in bank_sources:
-                local_deck_id = int(src['local_deck_id'])
-                rows = card_rows_by_deck_id.get(local_deck_id) or []
-                source_tags = extract_shared_deck_tags_and_labels(src.get('tags') or [])[0]
-                label = _source_label(src)
-                source_name = str(src.get('local_name') or '')
-                is_orphan = bool(src.get('is_orphan'))
-                for row in rows:
-                    mapped = map_card_row(row, preview_order, practice_priority_preview_by_card_id)
-                    card_id = int(row[0])
-                    is_candidate = card_id in candidate_card_set
-                    mapped['pending_sheet'] = card_id in pending_card_set
-                    mapped['available_for_practice'] = (not mapped['pending_sheet'])
-                    mapped['practicing_reason'] = None
-                    mapped['practicing_reason_label'] = None
-                    if mapped['pending_sheet']:
-                        mapped['writing_state'] = 3
-                        mapped['writing_state_label'] = 'In Practicing Sheet'
-                    elif is_candidate:
-                        mapped['writing_state'] = 2
-                        mapped['writing_state_label'] = 'Ready for Practicing Sheet'
-                        reason = candidate_reason_by_card.get(card_id)
-                        if reason:
-                            mapped['practicing_reason'] = reason[0]
-                            mapped['practicing_reason_label'] = reason[1]
-                    else:
-                        mapped['writing_state'] = 1
-                        mapped['writing_state_label'] = 'Default'
-                    mapped['source_deck_id'] = local_deck_id
-                    mapped['source_deck_name'] = source_name
-                    mapped['source_deck_label'] = label
-                    mapped['source_deck_tags'] = source_tags
-                    mapped['source_is_orphan'] = is_orphan
-                    audio_meta = build_writing_prompt_audio_payload(
-                        kid_id,
-                        mapped.get('front'),
-                        mapped.get('back'),
-                        category_key=category_key,
-                    )
-                    mapped['audio_file_name'] = audio_meta['audio_file_name']
-                    mapped['audio_mime_type'] = audio_meta['audio_mime_type']
-                    mapped['audio_url'] = audio_meta['audio_url']
-                    mapped['prompt_audio_url'] = audio_meta['prompt_audio_url']
-                    merged_cards.append(mapped)
-
-            if parse_include_practiced_from_other_arg():
-                existing_ids = {
-                    int(card.get('id'))
-                    for card in merged_cards
-                    if int(card.get('id') or 0) > 0
-                }
-                practiced_ids = get_card_ids_practiced_for_category(conn, category_key)
-                extra_ids = [cid for cid in practiced_ids if cid not in existing_ids]
-                for row in get_cards_with_stats_for_card_ids(conn, extra_ids):
-                    mapped = map_card_row(row, preview_order, practice_priority_preview_by_card_id)
-                    mapped['pending_sheet'] = False
-                    mapped['available_for_practice'] = False
-                    mapped['practicing_reason'] = None
-                    mapped['practicing_reason_label'] = None
+            preview_order = priority_preview['order_by_card_id']
+            practice_priority_preview_by_card_id = priority_preview['details_by_card_id']
+            practice_priority_subject_baseline = priority_preview['subject_baseline']
+
+        orphan_deck_name = get_category_orphan_deck_name(category_key)
+
+        def _source_label(source):
+            tags = extract_shared_deck_tags_and_labels(source.get('tags') or [])[0]
+            tail = tags[1:] if len(tags) > 1 else []
+            if tail:
+                return ' / '.join(tail)
+            local_name = str(source.get('local_name') or '')
+            if local_name == orphan_deck_name:
+                return 'orphan'
+            return local_name
+
+        bank_deck_ids = [int(src['local_deck_id']) for src in bank_sources if int(src.get('local_deck_id') or 0) > 0]
+        card_rows_by_deck_id = {}
+        for row in get_cards_with_stats_for_deck_ids(conn, bank_deck_ids):
+            deck_id = int(row[1] or 0)
+            if deck_id > 0:
+                card_rows_by_deck_id.setdefault(deck_id, []).append(row)
+
+        merged_cards = []
+        for src in bank_sources:
+            local_deck_id = int(src['local_deck_id'])
+            rows = card_rows_by_deck_id.get(local_deck_id) or []
+            source_tags = extract_shared_deck_tags_and_labels(src.get('tags') or [])[0]
+            label = _source_label(src)
+            source_name = str(src.get('local_name') or '')
+            is_orphan = bool(src.get('is_orphan'))
+            for row in rows:
+                mapped = map_card_row(row, preview_order, practice_priority_preview_by_card_id)
+                card_id = int(row[0])
+                is_candidate = card_id in candidate_card_set
+                mapped['pending_sheet'] = card_id in pending_card_set
+                mapped['available_for_practice'] = (not mapped['pending_sheet'])
+                mapped['practicing_reason'] = None
+                mapped['practicing_reason_label'] = None
+                if mapped['pending_sheet']:
+                    mapped['writing_state'] = 3
+                    mapped['writing_state_label'] = 'In Practicing Sheet'
+                elif is_candidate:
+                    mapped['writing_state'] = 2
+                    mapped['writing_state_label'] = 'Ready for Practicing Sheet'
+                    reason = candidate_reason_by_card.get(card_id)
+                    if reason:
+                        mapped['practicing_reason'] = reason[0]
+                        mapped['practicing_reason_label'] = reason[1]
+                else:
                     mapped['writing_state'] = 1
                     mapped['writing_state_label'] = 'Default'
-                    mapped['source_deck_id'] = int(row[1] or 0)
-                    mapped['source_deck_name'] = ''
-                    mapped['source_deck_label'] = ''
-                    mapped['source_deck_tags'] = []
-                    mapped['source_is_orphan'] = False
-                    mapped['from_practice_history'] = True
-                    mapped['audio_file_name'] = None
-                    mapped['audio_mime_type'] = None
-                    mapped['audio_url'] = None
-                    mapped['prompt_audio_url'] = None
-                    merged_cards.append(mapped)
-
-            merged_by_id = {
-                int(card.get('id')): card
+                mapped['source_deck_id'] = local_deck_id
+                mapped['source_deck_name'] = source_name
+                mapped['source_deck_label'] = label
+                mapped['source_deck_tags'] = source_tags
+                mapped['source_is_orphan'] = is_orphan
+                audio_meta = build_writing_prompt_audio_payload(
+                    kid_id,
+                    mapped.get('front'),
+                    mapped.get('back'),
+                    category_key=category_key,
+                )
+                mapped['audio_file_name'] = audio_meta['audio_file_name']
+                mapped['audio_mime_type'] = audio_meta['audio_mime_type']
+                mapped['audio_url'] = audio_meta['audio_url']
+                mapped['prompt_audio_url'] = audio_meta['prompt_audio_url']
+                merged_cards.append(mapped)
+
+        if parse_include_practiced_from_other_arg():
+            existing_ids = {
+                int(card.get('id'))
                 for card in merged_cards
                 if int(card.get('id') or 0) > 0
             }
-            practicing_cards = []
-            for card_id in candidate_card_ids:
-                card = merged_by_id.get(int(card_id))
-                if card is not None and int(card.get('writing_state') or 0) == 2:
-                    practicing_cards.append(card)
-            practicing_sheet_cards = [
-                card for card in merged_cards
-                if int(card.get('writing_state') or 0) == 3
-            ]
-
-            active_count = sum(int(src.get('active_card_count') or 0) for src in bank_sources)
-            skipped_count = sum(int(src.get('skipped_card_count') or 0) for src in bank_sources)
-            practice_active_count = sum(int(src.get('active_card_count') or 0) for src in practice_sources)
-            orphan_deck_id = get_category_orphan_deck(conn, category_key)
-        finally:
-            conn.close()
-
-        return jsonify({
-            'category_key': category_key,
-            'has_chinese_specific_logic': bool(has_chinese_specific_logic),
-            'is_merged_bank': True,
-            'deck_name': f'Merged {category_display_name} Bank',
-            'deck_id': orphan_deck_id,
-            'include_orphan_in_queue': get_category_include_orphan_for_kid(kid, category_key),
-            'practice_source_count': len(practice_sources),
-            'practice_active_card_count': int(practice_active_count),
-            'active_card_count': active_count,
-            'skipped_card_count': skipped_count,
-            'practicing_card_count': len(practicing_cards),
-            'practicing_cards': practicing_cards,
-            'practicing_sheet_card_count': len(practicing_sheet_cards),
-            'practicing_sheet_cards': practicing_sheet_cards,
-            'practice_priority_subject_baseline': practice_priority_subject_baseline,
-            'cards': merged_cards,
-            **special_ready_payload,
-            **build_kid_daily_progress_section(kid, category_key),
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            practiced_ids = get_card_ids_practiced_for_category(conn, category_key)
+            extra_ids = [cid for cid in practiced_ids if cid not in existing_ids]
+            for row in get_cards_with_stats_for_card_ids(conn, extra_ids):
+                mapped = map_card_row(row, preview_order, practice_priority_preview_by_card_id)
+                mapped['pending_sheet'] = False
+                mapped['available_for_practice'] = False
+                mapped['practicing_reason'] = None
+                mapped['practicing_reason_label'] = None
+                mapped['writing_state'] = 1
+                mapped['writing_state_label'] = 'Default'
+                mapped['source_deck_id'] = int(row[1] or 0)
+                mapped['source_deck_name'] = ''
+                mapped['source_deck_label'] = ''
+                mapped['source_deck_tags'] = []
+                mapped['source_is_orphan'] = False
+                mapped['from_practice_history'] = True
+                mapped['audio_file_name'] = None
+                mapped['audio_mime_type'] = None
+                mapped['audio_url'] = None
+                mapped['prompt_audio_url'] = None
+                merged_cards.append(mapped)
+
+        merged_by_id = {
+            int(card.get('id')): card
+            for card in merged_cards
+            if int(card.get('id') or 0) > 0
+        }
+        practicing_cards = []
+        for card_id in candidate_card_ids:
+            card = merged_by_id.get(int(card_id))
+            if card is not None and int(card.get('writing_state') or 0) == 2:
+                practicing_cards.append(card)
+        practicing_sheet_cards = [
+            card for card in merged_cards
+            if int(card.get('writing_state') or 0) == 3
+        ]
+
+        active_count = sum(int(src.get('active_card_count') or 0) for src in bank_sources)
+        skipped_count = sum(int(src.get('skipped_card_count') or 0) for src in bank_sources)
+        practice_active_count = sum(int(src.get('active_card_count') or 0) for src in practice_sources)
+        orphan_deck_id = get_category_orphan_deck(conn, category_key)
+    finally:
+        conn.close()
+
+    return jsonify({
+        'category_key': category_key,
+        'has_chinese_specific_logic': bool(has_chinese_specific_logic),
+        'is_merged_bank': True,
+        'deck_name': f'Merged {category_display_name} Bank',
+        'deck_id': orphan_deck_id,
+        'include_orphan_in_queue': get_category_include_orphan_for_kid(kid, category_key),
+        'practice_source_count': len(practice_sources),
+        'practice_active_card_count': int(practice_active_count),
+        'active_card_count': active_count,
+        'skipped_card_count': skipped_count,
+        'practicing_card_count': len(practicing_cards),
+        'practicing_cards': practicing_cards,
+        'practicing_sheet_card_count': len(practicing_sheet_cards),
+        'practicing_sheet_cards': practicing_sheet_cards,
+        'practice_priority_subject_baseline': practice_priority_subject_baseline,
+        'cards': merged_cards,
+        **special_ready_payload,
+        **build_kid_daily_progress_section(kid, category_key),
+    }), 200
 
 
 # ====================================================================
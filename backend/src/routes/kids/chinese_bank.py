@@ -12,6 +12,7 @@ Layout:
   2. GET bank listing (paginated + search + filters)
   3. Write routes: PUT update + refresh-used + force-sync-backs
 """
+import re
 from pathlib import Path
 
 from src.db import kid_db, metadata
@@ -63,9 +64,11 @@ def _mode_from_payload(payload):
     return _MODES[raw], None
 
 
+_HAN_ONLY_RE = re.compile(r'[\u3400-\u9FFF\uF900-\uFAFF]+')
+
+
 def _han_only(value: str) -> bool:
-    import re
-    return bool(re.fullmatch(r'[\u3400-\u9FFF\uF900-\uFAFF]+', value or ''))
+    return bool(_HAN_ONLY_RE.fullmatch(value or ''))
 
 
 def _mode_category_keys(back_content_value):
@@ -98,7 +101,7 @@ def _aggregate_thumb_down_by_front(back_content_value):
     for db_path in kid_db_paths:
         conn = None
         try:
-            conn = kid_db._connect_kid_db(str(db_path))
+            conn = kid_db.get_unpooled_kid_connection_by_path(str(db_path))
             rows = conn.execute(
                 f"""
                 SELECT c.front, SUM(c.thumb_down_count)
@@ -365,7 +368,7 @@ def dismiss_chinese_bank_thumbs():
     for db_path in kid_db_paths:
         conn = None
         try:
-            conn = kid_db._connect_kid_db(str(db_path))
+            conn = kid_db.get_unpooled_kid_connection_by_path(str(db_path))
             conn.execute(sql, params)
         except Exception as exc:
             errors.append({'db': db_path.name, 'error': str(exc)})
@@ -427,7 +430,7 @@ def refresh_chinese_bank_used():
                 for db_path in kid_db_paths:
                     kid_conn = None
                     try:
-                        kid_conn = kid_db._connect_kid_db(str(db_path))
+                        kid_conn = kid_db.get_unpooled_kid_connection_by_path(str(db_path))
                         kid_rows = kid_conn.execute(
                             f"""
                             SELECT DISTINCT c.front
@@ -548,6 +551,14 @@ def _push_result_payload(push_result, changed_key):
     }
 
 
+def _group_rows_by_front(rows):
+    """Group (front, *rest) rows into {front: [rest, ...]} preserving order."""
+    grouped = {}
+    for front, *rest in rows:
+        grouped.setdefault(front, []).append(tuple(rest))
+    return grouped
+
+
 def _push_bank_backs(bank, back_content_value):
     """Push bank values to shared+kid card backs (mode-decks only).
 
@@ -559,32 +570,27 @@ def _push_bank_backs(bank, back_content_value):
     if not bank:
         return {'changed': changed, 'errors': errors, 'kid_db_count': 0}
 
+    bank_keys = [key for key, target in bank.items() if target]
     shared_conn = get_shared_decks_connection()
     try:
-        shared_back_content_decks = set()
-        for row in shared_conn.execute(
+        shared_rows_by_front = _group_rows_by_front(shared_conn.execute(
             """
-            SELECT d.deck_id
-            FROM deck d
+            SELECT c.front, c.id, c.back
+            FROM cards c
+            JOIN deck d ON d.deck_id = c.deck_id
             JOIN deck_category dc ON dc.category_key = lower(d.tags[1])
             WHERE dc.has_chinese_specific_logic = TRUE
               AND dc.chinese_back_content = ?
               AND NOT list_contains(d.tags, 'chinese_writing')
+              AND c.front IN (SELECT UNNEST(?::VARCHAR[]))
+            ORDER BY c.id
             """,
-            [back_content_value],
-        ).fetchall():
-            shared_back_content_decks.add(row[0])
+            [back_content_value, bank_keys],
+        ).fetchall())
 
-        for key, target in bank.items():
-            if not target:
-                continue
-            rows = shared_conn.execute(
-                "SELECT id, deck_id, back FROM cards WHERE front = ?",
-                [key],
-            ).fetchall()
-            for card_id, deck_id, current_back in rows:
-                if deck_id not in shared_back_content_decks:
-                    continue
+        for key in bank_keys:
+            target = bank[key]
+            for card_id, current_back in shared_rows_by_front.get(key, []):
                 if target == (current_back or ''):
                     continue
                 shared_conn.execute(
@@ -596,55 +602,30 @@ def _push_bank_backs(bank, back_content_value):
     finally:
         shared_conn.close()
 
+    category_keys = _mode_category_keys(back_content_value)
     kid_db_paths = _iter_kid_db_paths()
     for db_path in kid_db_paths:
         kid_conn = None
         try:
-            kid_conn = kid_db._connect_kid_db(str(db_path))
-            kid_shared_conn = get_shared_decks_connection(read_only=True)
-            try:
-                kid_decks_in_mode = set()
-                deck_rows = kid_conn.execute(
-                    """
-                    SELECT id, tags
-                    FROM decks
-                    WHERE tags IS NOT NULL
-                      AND NOT list_contains(tags, 'chinese_writing')
-                    """
-                ).fetchall()
-                for deck_id, tags in deck_rows:
-                    first_tag = str((tags or [''])[0] if tags else '').strip().lower()
-                    if not first_tag:
-                        continue
-                    meta_row = kid_shared_conn.execute(
-                        """
-                        SELECT chinese_back_content
-                        FROM deck_category
-                        WHERE category_key = ?
-                          AND has_chinese_specific_logic = TRUE
-                        LIMIT 1
-                        """,
-                        [first_tag],
-                    ).fetchone()
-                    if not meta_row:
-                        continue
-                    bc = str(meta_row[0] or '').strip().lower()
-                    if bc == back_content_value:
-                        kid_decks_in_mode.add(deck_id)
-            finally:
-                kid_shared_conn.close()
-
-            for key, target in bank.items():
-                if not target:
-                    continue
-                rows = kid_conn.execute(
-                    "SELECT id, deck_id, back, thumb_down_count FROM cards WHERE front = ?",
-                    [key],
-                ).fetchall()
+            kid_conn = kid_db.get_unpooled_kid_connection_by_path(str(db_path))
+            kid_rows_by_front = _group_rows_by_front(kid_conn.execute(
+                """
+                SELECT c.front, c.id, c.back, c.thumb_down_count
+                FROM cards c
+                JOIN decks d ON d.id = c.deck_id
+                WHERE array_length(d.tags) >= 1
+                  AND lower(trim(d.tags[1])) IN (SELECT UNNEST(?::VARCHAR[]))
+                  AND NOT list_contains(d.tags, 'chinese_writing')
+                  AND c.front IN (SELECT UNNEST(?::VARCHAR[]))
+                ORDER BY c.id
+                """,
+                [category_keys, bank_keys],
+            ).fetchall())
+
+            for key in bank_keys:
+                target = bank[key]
                 touched = False
-                for card_id, deck_id, current_back, thumb_count in rows:
-                    if deck_id not in kid_decks_in_mode:
-                        continue
+                for card_id, current_back, thumb_count in kid_rows_by_front.get(key, []):
                     back_changed = target != (current_back or '')
                     thumb_clear = int(thumb_count or 0) > 0
                     if not back_changed and not thumb_clear:
@@ -28,6 +28,9 @@ from src.routes.kids_constants import (
     SESSION_RESULT_RETRY_FIXED_FIRST,
     TYPE_I_NON_CHINESE_DECK_MIX_FIELD,
 )
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
 from flask import send_file
 from src.services import kid_avatar
 from src.services.kid_category_config import get_category_orphan_deck_name
@@ -39,6 +42,7 @@ from src.routes.kids import (
     get_or_create_category_orphan_deck,
     get_shared_decks_connection,
     hydrate_kid_category_config_from_db,
+    json_array_stream_response,
     jsonify,
     kid_db,
     kids_bp,
@@ -71,7 +75,9 @@ from src.services.kid_daily_progress import (
     get_kid_today_session_status_by_deck_category,
     get_kid_ungraded_type_iii_count,
     get_type_iii_category_keys,
+    invalidate_today_session_rows_cache,
 )
+from src.services.kid_today_sessions import get_today_bounds_utc_for_timezone
 from src.services.offline_locks import get_locks_for_family
 from src.services.practice_mode import (
     is_drill_session_practice_mode,
@@ -89,6 +95,106 @@ from src.services.shared_deck_category import (
 # 1. Kid listing + create
 # ============================================================================
 
+# Kid DBs are independent DuckDB files; reused across requests so the
+# `/kids` dashboard doesn't spawn threads per poll.
+_KID_SUMMARY_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='kid-summary')
+_REPORT_SESSION_FETCH_BATCH_SIZE = 256
+
+
+def _build_kid_progress_summary(
+    kid,
+    *,
+    category_meta_by_key,
+    type_iii_category_keys,
+    day_bounds_utc,
+    offline_lock_by_kid,
+):
+    """Build one kid's default `/kids` dashboard entry from its own kid DB."""
+    conn = None
+    try:
+        conn = get_kid_connection_for(kid, read_only=True)
+    except Exception:
+        conn = None
+    try:
+        opted_in_category_keys = get_kid_opted_in_deck_category_keys(
+            kid,
+            category_meta_by_key=category_meta_by_key,
+            conn=conn,
+        )
+        practice_target_by_deck_category = get_kid_practice_target_by_deck_category(
+            kid,
+            opted_in_category_keys,
+            category_meta_by_key,
+            conn=conn,
+        )
+        (
+            today_counts,
+            today_started_counts,
+            today_star_tiers,
+            today_latest_percent,
+            today_latest_target_count,
+            today_latest_tried_count,
+            today_latest_right_count,
+            ungraded_count,
+        ) = get_kid_dashboard_stats(
+            kid,
+            category_meta_by_key=category_meta_by_key,
+            type_iii_category_keys=type_iii_category_keys,
+            conn=conn,
+            day_bounds_utc=day_bounds_utc,
+        )
+        daily_completed_by_deck_category = get_kid_daily_completed_by_deck_category(
+            kid,
+            opted_in_category_keys,
+            today_counts=today_counts,
+        )
+        daily_started_by_deck_category = get_kid_daily_completed_by_deck_category(
+            kid,
+            opted_in_category_keys,
+            today_counts=today_started_counts,
+        )
+        daily_star_tiers_by_deck_category = get_kid_daily_star_tiers_by_deck_category(
+            opted_in_category_keys,
+            today_star_tiers=today_star_tiers,
+        )
+        daily_percent_by_deck_category = get_kid_daily_percent_by_deck_category(
+            opted_in_category_keys,
+            today_latest_percent=today_latest_percent,
+        )
+        daily_target_by_deck_category = {
+            key: int(today_latest_target_count.get(key, 0) or 0)
+            for key in opted_in_category_keys
+        }
+        daily_tried_by_deck_category = {
+            key: int(today_latest_tried_count.get(key, 0) or 0)
+            for key in opted_in_category_keys
+        }
+        daily_right_by_deck_category = {
+            key: int(today_latest_right_count.get(key, 0) or 0)
+            for key in opted_in_category_keys
+        }
+        return {
+            **kid,
+            'dailyCompletedCountToday': int(today_counts.get('total', 0) or 0),
+            'typeIIIToReviewCount': ungraded_count,
+            'optedInDeckCategoryKeys': opted_in_category_keys,
+            'dailyCompletedByDeckCategory': daily_completed_by_deck_category,
+            'dailyStartedByDeckCategory': daily_started_by_deck_category,
+            'dailyStarTiersByDeckCategory': daily_star_tiers_by_deck_category,
+            'dailyPercentByDeckCategory': daily_percent_by_deck_category,
+            'dailyTargetByDeckCategory': daily_target_by_deck_category,
+            'dailyTriedByDeckCategory': daily_tried_by_deck_category,
+            'dailyRightByDeckCategory': daily_right_by_deck_category,
+            'practiceTargetByDeckCategory': practice_target_by_deck_category,
+            'deckCategoryMetaByKey': category_meta_by_key,
+            'offlineLock': offline_lock_by_kid.get(str(kid.get('id') or '')) or None,
+            'avatarUrl': kid_avatar.avatar_url_for_kid(kid),
+        }
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 @kids_bp.route('/kids', methods=['GET'])
 def get_kids():
     """Get all kids"""
@@ -126,7 +232,7 @@ def get_kids():
             # Skip the per-kid DB opens + dashboard stats the admin matrix needs.
             offline_lock_by_kid = {
                 str(entry.get('kid_id') or ''): entry
-                for entry in get_locks_for_family(family_id)
+                for entry in get_locks_for_family(family_id, kids=kids)
                 if entry.get('kid_id') is not None
             }
             return jsonify([
@@ -174,12 +280,13 @@ def get_kids():
 
         offline_lock_by_kid = {
             str(entry.get('kid_id') or ''): entry
-            for entry in get_locks_for_family(family_id)
+            for entry in get_locks_for_family(family_id, kids=kids)
             if entry.get('kid_id') is not None
         }
 
         if is_admin_view:
             family_timezone = metadata.get_family_timezone(family_id)
+            day_bounds_utc = get_today_bounds_utc_for_timezone(family_timezone)
             kids_with_admin_summary = []
             shared_conn = None
             try:
@@ -220,7 +327,7 @@ def get_kids():
                             type_iii_category_keys=type_iii_category_keys,
                             include_ungraded_count=include_admin_review_counts,
                             conn=conn,
-                            family_timezone=family_timezone,
+                            day_bounds_utc=day_bounds_utc,
                         )
                         daily_star_tiers_by_deck_category = get_kid_daily_star_tiers_by_deck_category(
                             opted_in_category_keys,
@@ -230,10 +337,10 @@ def get_kids():
                             kid,
                             opted_in_category_keys,
                             conn=conn,
-                            family_timezone=family_timezone,
                             shared_conn=shared_conn,
                             family_id=family_id,
                             category_meta_by_key=category_meta_by_key,
+                            day_bounds_utc=day_bounds_utc,
                         )
                         kids_with_admin_summary.append({
                             **kid,
@@ -256,94 +363,18 @@ def get_kids():
 
             return jsonify(kids_with_admin_summary), 200
 
-        family_timezone = metadata.get_family_timezone(family_id)
-        kids_with_progress = []
-        for kid in kids:
-            conn = None
-            try:
-                conn = get_kid_connection_for(kid, read_only=True)
-            except Exception:
-                conn = None
-            try:
-                opted_in_category_keys = get_kid_opted_in_deck_category_keys(
-                    kid,
-                    category_meta_by_key=category_meta_by_key,
-                    conn=conn,
-                )
-                practice_target_by_deck_category = get_kid_practice_target_by_deck_category(
-                    kid,
-                    opted_in_category_keys,
-                    category_meta_by_key,
-                    conn=conn,
-                )
-                (
-                    today_counts,
-                    today_started_counts,
-                    today_star_tiers,
-                    today_latest_percent,
-                    today_latest_target_count,
-                    today_latest_tried_count,
-                    today_latest_right_count,
-                    ungraded_count,
-                ) = get_kid_dashboard_stats(
-                    kid,
-                    category_meta_by_key=category_meta_by_key,
-                    type_iii_category_keys=type_iii_category_keys,
-                    conn=conn,
-                    family_timezone=family_timezone,
-                )
-                daily_completed_by_deck_category = get_kid_daily_completed_by_deck_category(
-                    kid,
-                    opted_in_category_keys,
-                    today_counts=today_counts,
-                )
-                daily_started_by_deck_category = get_kid_daily_completed_by_deck_category(
-                    kid,
-                    opted_in_category_keys,
-                    today_counts=today_started_counts,
-                )
-                daily_star_tiers_by_deck_category = get_kid_daily_star_tiers_by_deck_category(
-                    opted_in_category_keys,
-                    today_star_tiers=today_star_tiers,
-                )
-                daily_percent_by_deck_category = get_kid_daily_percent_by_deck_category(
-                    opted_in_category_keys,
-                    today_latest_percent=today_latest_percent,
-                )
-                daily_target_by_deck_category = {
-                    key: int(today_latest_target_count.get(key, 0) or 0)
-                    for key in opted_in_category_keys
-                }
-                daily_tried_by_deck_category = {
-                    key: int(today_latest_tried_count.get(key, 0) or 0)
-                    for key in opted_in_category_keys
-                }
-                daily_right_by_deck_category = {
-                    key: int(today_latest_right_count.get(key, 0) or 0)
-                    for key in opted_in_category_keys
-                }
-                kid_with_progress = {
-                    **kid,
-                    'dailyCompletedCountToday': int(today_counts.get('total', 0) or 0),
-                    'typeIIIToReviewCount': ungraded_count,
-                    'optedInDeckCategoryKeys': opted_in_category_keys,
-                    'dailyCompletedByDeckCategory': daily_completed_by_deck_category,
-                    'dailyStartedByDeckCategory': daily_started_by_deck_category,
-                    'dailyStarTiersByDeckCategory': daily_star_tiers_by_deck_category,
-                    'dailyPercentByDeckCategory': daily_percent_by_deck_category,
-                    'dailyTargetByDeckCategory': daily_target_by_deck_category,
-                    'dailyTriedByDeckCategory': daily_tried_by_deck_category,
-                    'dailyRightByDeckCategory': daily_right_by_deck_category,
-                    'practiceTargetByDeckCategory': practice_target_by_deck_category,
-                    'deckCategoryMetaByKey': category_meta_by_key,
-                    'offlineLock': offline_lock_by_kid.get(str(kid.get('id') or '')) or None,
-                    'avatarUrl': kid_avatar.avatar_url_for_kid(kid),
-                }
-                kids_with_progress.append(kid_with_progress)
-            finally:
-                if conn is not None:
-                    conn.close()
-
+        # Day bounds are per family, so they are computed once for all kids.
+        day_bounds_utc = get_today_bounds_utc_for_timezone(metadata.get_family_timezone(family_id))
+        # Each kid reads only its own DB file, so the per-kid summaries run
+        # concurrently on the shared pool instead of one after another.
+        build_summary = functools.partial(
+            _build_kid_progress_summary,
+            category_meta_by_key=category_meta_by_key,
+            type_iii_category_keys=type_iii_category_keys,
+            day_bounds_utc=day_bounds_utc,
+            offline_lock_by_kid=offline_lock_by_kid,
+        )
+        kids_with_progress = list(_KID_SUMMARY_EXECUTOR.map(build_summary, kids))
         return jsonify(kids_with_progress), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -662,69 +693,64 @@ def get_kid_deck_categories(kid_id):
 @kids_bp.route('/kids/<kid_id>/deck-categories', methods=['PUT'])
 def update_kid_deck_categories(kid_id):
     """Replace opted-in deck categories for one kid."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-        family_id = str(kid.get('familyId') or '').strip()
-        is_super = is_super_family_id(family_id)
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+    family_id = str(kid.get('familyId') or '').strip()
+    is_super = is_super_family_id(family_id)
 
-        payload = request.get_json() or {}
-        category_keys = normalize_deck_category_keys(payload.get('categoryKeys'))
+    payload = request.get_json() or {}
+    category_keys = normalize_deck_category_keys(payload.get('categoryKeys'))
 
-        shared_conn = get_shared_decks_connection(read_only=True)
-        try:
-            allowed_keys = {
-                normalize_shared_deck_tag(item.get('category_key'))
-                for item in get_shared_deck_categories(shared_conn)
-                if can_family_access_deck_category(
-                    item,
-                    family_id=family_id,
-                    is_super=is_super,
-                )
-                if normalize_shared_deck_tag(item.get('category_key'))
-            }
-        finally:
-            shared_conn.close()
+    shared_conn = get_shared_decks_connection(read_only=True)
+    try:
+        allowed_keys = {
+            normalize_shared_deck_tag(item.get('category_key'))
+            for item in get_shared_deck_categories(shared_conn)
+            if can_family_access_deck_category(
+                item,
+                family_id=family_id,
+                is_super=is_super,
+            )
+            if normalize_shared_deck_tag(item.get('category_key'))
+        }
+    finally:
+        shared_conn.close()
 
-        invalid = [key for key in category_keys if key not in allowed_keys]
-        if invalid:
-            return jsonify({'error': f'Unknown category key(s): {", ".join(invalid)}'}), 400
+    invalid = [key for key in category_keys if key not in allowed_keys]
+    if invalid:
+        return jsonify({'error': f'Unknown category key(s): {", ".join(invalid)}'}), 400
 
-        kid_conn = get_kid_connection_for(kid)
-        try:
-            kid_conn.execute(
-                f"UPDATE {KID_DECK_CATEGORY_OPT_IN_TABLE} SET {KID_DECK_CATEGORY_OPT_IN_COL_IS_OPTED_IN} = FALSE"
-            )
-            if category_keys:
-                kid_conn.executemany(
-                    f"""
-                    INSERT INTO {KID_DECK_CATEGORY_OPT_IN_TABLE} (
-                      category_key,
-                      {KID_DECK_CATEGORY_OPT_IN_COL_IS_OPTED_IN}
-                    )
-                    VALUES (?, TRUE)
-                    ON CONFLICT (category_key)
-                    DO UPDATE SET {KID_DECK_CATEGORY_OPT_IN_COL_IS_OPTED_IN} = TRUE
-                    """,
-                    [[key] for key in category_keys],
+    kid_conn = get_kid_connection_for(kid)
+    try:
+        kid_conn.execute(
+            f"UPDATE {KID_DECK_CATEGORY_OPT_IN_TABLE} SET {KID_DECK_CATEGORY_OPT_IN_COL_IS_OPTED_IN} = FALSE"
+        )
+        if category_keys:
+            kid_conn.executemany(
+                f"""
+                INSERT INTO {KID_DECK_CATEGORY_OPT_IN_TABLE} (
+                  category_key,
+                  {KID_DECK_CATEGORY_OPT_IN_COL_IS_OPTED_IN}
                 )
-                for key in category_keys:
-                    get_or_create_category_orphan_deck(kid_conn, key)
-        finally:
-            kid_conn.close()
+                VALUES (?, TRUE)
+                ON CONFLICT (category_key)
+                DO UPDATE SET {KID_DECK_CATEGORY_OPT_IN_COL_IS_OPTED_IN} = TRUE
+                """,
+                [[key] for key in category_keys],
+            )
+            for key in category_keys:
+                get_or_create_category_orphan_deck(kid_conn, key)
+    finally:
+        kid_conn.close()
 
-        kid['optedInDeckCategoryKeys'] = list(category_keys)
+    kid['optedInDeckCategoryKeys'] = list(category_keys)
 
-        return jsonify({
-            'updated': True,
-            'kid_id': str(kid.get('id') or ''),
-            'opted_in_category_keys': category_keys,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'updated': True,
+        'kid_id': str(kid.get('id') or ''),
+        'opted_in_category_keys': category_keys,
+    }), 200
 
 
 # ============================================================================
@@ -734,115 +760,123 @@ def update_kid_deck_categories(kid_id):
 @kids_bp.route('/kids/<kid_id>/report', methods=['GET'])
 def get_kid_report(kid_id):
     """Get one kid's practice history report for parent view."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
 
-        conn = get_kid_connection_for(kid, read_only=True)
-        try:
-            rows = conn.execute(
-                """
-                WITH unresolved_cards AS (
-                    SELECT sr.session_id, sr.card_id
-                    FROM session_results sr
-                    WHERE sr.card_id IS NOT NULL
-                      AND sr.correct != 1
-                ),
-                session_results_agg AS (
-                    SELECT
-                        sr.session_id,
-                        COUNT(*) AS answer_count,
-                        COALESCE(SUM(CASE WHEN sr.response_time_ms IS NULL THEN 0 ELSE sr.response_time_ms END), 0) AS total_response_ms
-                    FROM session_results sr
-                    GROUP BY sr.session_id
-                ),
-                unresolved_counts AS (
-                    SELECT session_id, COUNT(*) AS unresolved_count
-                    FROM unresolved_cards
-                    GROUP BY session_id
-                )
-                SELECT
-                    s.id,
-                    s.type,
-                    s.started_at,
-                    s.completed_at,
-                    COALESCE(s.planned_count, 0) AS planned_count,
-                    COALESCE(s.retry_count, 0) AS retry_count,
-                    COALESCE(s.retry_total_response_ms, 0) AS retry_total_response_ms,
-                    COALESCE(s.retry_best_rety_correct_count, 0) AS retry_best_rety_correct_count,
-                    COALESCE(a.answer_count, 0) AS answer_count,
-                    GREATEST(
-                        0,
-                        COALESCE(a.answer_count, 0) - COALESCE(uc.unresolved_count, 0)
-                    ) AS right_count,
-                    COALESCE(uc.unresolved_count, 0) AS wrong_count,
-                    COALESCE(a.total_response_ms, 0) AS total_response_ms,
-                    COALESCE(s.practice_mode, 'na') AS practice_mode
-                FROM sessions s
-                LEFT JOIN session_results_agg a ON a.session_id = s.id
-                LEFT JOIN unresolved_counts uc ON uc.session_id = s.id
-                ORDER BY COALESCE(s.completed_at, s.started_at) DESC, s.id DESC
-                """
-            ).fetchall()
-            practiced_card_rows = conn.execute(
-                """
-                SELECT DISTINCT session_id, card_id
-                FROM session_results
-                WHERE card_id IS NOT NULL
-                ORDER BY session_id ASC, card_id ASC
-                """
-            ).fetchall()
-        finally:
-            conn.close()
+    category_meta_by_key = get_shared_deck_category_meta_by_key()
+    family_id = str(kid.get('familyId') or '').strip()
+    report_head = {
+        'kid': {
+            'id': kid.get('id'),
+            'name': kid.get('name'),
+            'avatarUrl': kid_avatar.avatar_url_for_kid(kid),
+        },
+        'family_timezone': metadata.get_family_timezone(family_id),
+    }
 
-        category_meta_by_key = get_shared_deck_category_meta_by_key()
-        family_id = str(kid.get('familyId') or '').strip()
-        family_timezone = metadata.get_family_timezone(family_id)
-        practiced_card_ids_by_session_id = defaultdict(list)
-        for row in practiced_card_rows:
-            try:
-                session_id_int = int(row[0] or 0)
-                card_id_int = int(row[1] or 0)
-            except (TypeError, ValueError):
-                continue
-            if session_id_int > 0 and card_id_int > 0:
-                practiced_card_ids_by_session_id[session_id_int].append(card_id_int)
-        sessions = []
-        for row in rows:
-            session_id = int(row[0])
-            session_type = normalize_shared_deck_tag(row[1])
-            session_category_display_name = get_deck_category_display_name(session_type, category_meta_by_key)
-            sessions.append({
-                'id': session_id,
-                'type': row[1],
-                'behavior_type': get_session_behavior_type(session_type, category_meta_by_key),
-                'category_display_name': session_category_display_name,
-                'started_at': row[2].isoformat() if row[2] else None,
-                'completed_at': row[3].isoformat() if row[3] else None,
-                'planned_count': int(row[4] or 0),
-                'retry_count': int(row[5] or 0),
-                'retry_total_response_ms': int(row[6] or 0),
-                'retry_best_rety_correct_count': int(row[7] or 0),
-                'answer_count': int(row[8] or 0),
-                'right_count': int(row[9] or 0),
-                'wrong_count': int(row[10] or 0),
-                'total_response_ms': int(row[11] or 0),
-                'practice_mode': normalize_session_practice_mode(row[12]),
-                'practiced_card_ids': practiced_card_ids_by_session_id.get(session_id, []),
-            })
+    conn = get_kid_connection_for(kid, read_only=True)
+    try:
+        # Practiced card ids are aggregated per session in SQL, so the only
+        # result held open is this cursor, which is drained while streaming.
+        cursor = conn.execute(
+            """
+            WITH unresolved_cards AS (
+                SELECT sr.session_id, sr.card_id
+                FROM session_results sr
+                WHERE sr.card_id IS NOT NULL
+                  AND sr.correct != 1
+            ),
+            session_results_agg AS (
+                SELECT
+                    sr.session_id,
+                    COUNT(*) AS answer_count,
+                    COALESCE(SUM(CASE WHEN sr.response_time_ms IS NULL THEN 0 ELSE sr.response_time_ms END), 0) AS total_response_ms,
+                    list(DISTINCT sr.card_id ORDER BY sr.card_id) FILTER (WHERE sr.card_id > 0) AS practiced_card_ids
+                FROM session_results sr
+                GROUP BY sr.session_id
+            ),
+            unresolved_counts AS (
+                SELECT session_id, COUNT(*) AS unresolved_count
+                FROM unresolved_cards
+                GROUP BY session_id
+            )
+            SELECT
+                s.id,
+                s.type,
+                s.started_at,
+                s.completed_at,
+                COALESCE(s.planned_count, 0) AS planned_count,
+                COALESCE(s.retry_count, 0) AS retry_count,
+                COALESCE(s.retry_total_response_ms, 0) AS retry_total_response_ms,
+                COALESCE(s.retry_best_rety_correct_count, 0) AS retry_best_rety_correct_count,
+                COALESCE(a.answer_count, 0) AS answer_count,
+                GREATEST(
+                    0,
+                    COALESCE(a.answer_count, 0) - COALESCE(uc.unresolved_count, 0)
+                ) AS right_count,
+                COALESCE(uc.unresolved_count, 0) AS wrong_count,
+                COALESCE(a.total_response_ms, 0) AS total_response_ms,
+                COALESCE(s.practice_mode, 'na') AS practice_mode,
+                a.practiced_card_ids
+            FROM sessions s
+            LEFT JOIN session_results_agg a ON a.session_id = s.id
+            LEFT JOIN unresolved_counts uc ON uc.session_id = s.id
+            ORDER BY COALESCE(s.completed_at, s.started_at) DESC, s.id DESC
+            """
+        )
+    except Exception:
+        conn.close()
+        raise
+
+    def _iter_sessions():
+        # Rows are converted batch by batch while the body streams out;
+        # the connection is closed when the response closes.
+        while True:
+            rows = cursor.fetchmany(_REPORT_SESSION_FETCH_BATCH_SIZE)
+            if not rows:
+                return
+            # Every numeric column is COALESCE'd / counted in SQL, so
+            # the values are already non-null ints.
+            for (
+                session_id,
+                raw_session_type,
+                started_at,
+                completed_at,
+                planned_count,
+                retry_count,
+                retry_total_response_ms,
+                retry_best_rety_correct_count,
+                answer_count,
+                right_count,
+                wrong_count,
+                total_response_ms,
+                practice_mode,
+                practiced_card_ids,
+            ) in rows:
+                session_type = normalize_shared_deck_tag(raw_session_type)
+                yield {
+                    'id': session_id,
+                    'type': raw_session_type,
+                    'behavior_type': get_session_behavior_type(session_type, category_meta_by_key),
+                    'category_display_name': get_deck_category_display_name(session_type, category_meta_by_key),
+                    'started_at': started_at.isoformat() if started_at else None,
+                    'completed_at': completed_at.isoformat() if completed_at else None,
+                    'planned_count': planned_count,
+                    'retry_count': retry_count,
+                    'retry_total_response_ms': retry_total_response_ms,
+                    'retry_best_rety_correct_count': retry_best_rety_correct_count,
+                    'answer_count': answer_count,
+                    'right_count': right_count,
+                    'wrong_count': wrong_count,
+                    'total_response_ms': total_response_ms,
+                    'practice_mode': normalize_session_practice_mode(practice_mode),
+                    'practiced_card_ids': practiced_card_ids or [],
+                }
 
-        return jsonify({
-            'kid': {
-                'id': kid.get('id'),
-                'name': kid.get('name'),
-                'avatarUrl': kid_avatar.avatar_url_for_kid(kid),
-            },
-            'family_timezone': family_timezone,
-            'sessions': sessions
-        }), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    response = json_array_stream_response(report_head, 'sessions', _iter_sessions())
+    response.call_on_close(conn.close)
+    return response
 
 
 @kids_bp.route('/kids/<kid_id>/report/sessions/<session_id>', methods=['GET'])
@@ -880,15 +914,6 @@ def get_kid_report_session_detail(kid_id, session_id):
             conn.close()
             return jsonify({'error': 'Session not found'}), 404
 
-        def _session_source_deck_label(local_deck_name):
-            local_name = str(local_deck_name or '').strip()
-            if not local_name:
-                return ''
-            if local_name == get_category_orphan_deck_name(session_type):
-                return 'Personal Deck'
-            _, _, tail_name = local_name.partition('__')
-            return tail_name.strip() or local_name
-
         result_rows = conn.execute(
             """
             SELECT
@@ -927,18 +952,26 @@ def get_kid_report_session_detail(kid_id, session_id):
         session_category_meta = category_meta_by_key.get(session_type) or {}
         session_category_display_name = get_deck_category_display_name(session_type, category_meta_by_key)
 
-        answers = []
-        right_cards = []
-        wrong_cards = []
-        for row in result_rows:
+        orphan_deck_name = get_category_orphan_deck_name(session_type)
+        audio_url_prefix = f"/api/kids/{kid_id}/lesson-reading/audio/"
+
+        def _session_source_deck_label(local_deck_name):
+            local_name = str(local_deck_name or '').strip()
+            if not local_name:
+                return ''
+            if local_name == orphan_deck_name:
+                return 'Personal Deck'
+            _, _, tail_name = local_name.partition('__')
+            return tail_name.strip() or local_name
+
+        def _answer_item(row):
             correct_score = int(row[2] or 0)
+            is_pass = correct_score == 1 or correct_score <= -2
             type1_distractor_answers = [
                 str(a).strip()
                 for a in list(row[10] or [])
                 if str(a or '').strip()
             ]
-            type1_submitted_answers = [str(a or '') for a in list(row[11] or [])]
-            type1_submitted_grades = [int(g) for g in list(row[12] or [])]
             materialized_prompt = str(row[13] or '').strip()
             materialized_answer = str(row[14] or '').strip()
             type4_submitted_answers = [
@@ -946,22 +979,21 @@ def get_kid_report_session_detail(kid_id, session_id):
                 for a in list(row[15] or [])
                 if str(a or '').strip()
             ]
+            has_type4_prompt = bool(materialized_prompt or materialized_answer)
+            if has_type4_prompt or type4_submitted_answers:
+                submitted_answers = type4_submitted_answers
+            else:
+                submitted_answers = [str(a or '') for a in list(row[11] or [])]
             type4_submitted_grades = [int(g) for g in list(row[16] or [])]
-            submitted_answers = (
-                type4_submitted_answers
-                if materialized_prompt or materialized_answer or type4_submitted_answers
-                else type1_submitted_answers
-            )
-            submitted_grades = (
-                type4_submitted_grades
-                if materialized_prompt or materialized_answer or type4_submitted_grades
-                else type1_submitted_grades
-            )
-            item = {
+            if has_type4_prompt or type4_submitted_grades:
+                submitted_grades = type4_submitted_grades
+            else:
+                submitted_grades = [int(g) for g in list(row[12] or [])]
+            return {
                 'result_id': int(row[0]),
                 'card_id': int(row[1]) if row[1] is not None else None,
                 'correct_score': correct_score,
-                'correct': correct_score == 1 or correct_score <= -2,
+                'correct': is_pass,
                 'response_time_ms': int(row[3] or 0),
                 'timestamp': row[4].isoformat() if row[4] else None,
                 'front': row[5] or '',
@@ -969,23 +1001,22 @@ def get_kid_report_session_detail(kid_id, session_id):
                 'source_deck_name': str(row[7] or '').strip(),
                 'source_deck_label': _session_source_deck_label(row[7]),
                 'grade_status': (
-                    'pass' if correct_score == 1 or correct_score <= -2
+                    'pass' if is_pass
                     else ('partial' if correct_score == 2 else ('fail' if correct_score < 0 else 'unknown'))
                 ),
                 'audio_file_name': row[8] or None,
                 'audio_mime_type': row[9] or None,
-                'audio_url': f"/api/kids/{kid_id}/lesson-reading/audio/{row[8]}" if row[8] else None,
+                'audio_url': f"{audio_url_prefix}{row[8]}" if row[8] else None,
                 'distractor_answers': type1_distractor_answers,
                 'materialized_prompt': materialized_prompt,
                 'materialized_answer': materialized_answer,
                 'submitted_answers': submitted_answers,
                 'submitted_grades': submitted_grades,
             }
-            answers.append(item)
-            if correct_score == 1 or correct_score <= -2:
-                right_cards.append(item)
-            elif correct_score < 0 or correct_score == 2:
-                wrong_cards.append(item)
+
+        answers = [_answer_item(row) for row in result_rows]
+        right_cards = [item for item in answers if item['grade_status'] == 'pass']
+        wrong_cards = [item for item in answers if item['grade_status'] in ('partial', 'fail')]
 
         normalized_practice_mode = normalize_session_practice_mode(session_row[8])
         drill_speed_target_ms = None
@@ -1088,6 +1119,7 @@ def delete_kid_report_session(kid_id, session_id):
                     shared_conn.close()
         finally:
             conn.close()
+            invalidate_today_session_rows_cache(kid_id)
         return jsonify({'message': 'Session deleted'}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1225,27 +1257,36 @@ def get_kid_report_card_detail(kid_id, card_id):
             """,
             [card_id_int]
         ).fetchall()
+        right_count, wrong_count, ungraded_count = conn.execute(
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE score = 1 OR score <= ?),
+                COUNT(*) FILTER (WHERE score < 0 AND score > ?),
+                COUNT(*) FILTER (WHERE score >= 0 AND score != 1)
+            FROM (
+                SELECT COALESCE(sr.correct, 0) AS score
+                FROM session_results sr
+                JOIN sessions s ON s.id = sr.session_id
+                WHERE sr.card_id = ?
+            )
+            """,
+            [SESSION_RESULT_RETRY_FIXED_FIRST, SESSION_RESULT_RETRY_FIXED_FIRST, card_id_int]
+        ).fetchone()
         conn.close()
 
         category_meta_by_key = get_shared_deck_category_meta_by_key()
-        attempts = []
-        right_count = 0
-        wrong_count = 0
-        ungraded_count = 0
-        response_sum_ms = 0
-        for row in attempts_rows:
+        audio_url_prefix = f"/api/kids/{kid_id}/lesson-reading/audio/"
+
+        def _attempt_item(row):
             correct_score = int(row[1] or 0)
             is_correct = correct_score == 1 or correct_score <= -2
             response_ms = int(row[2] or 0)
             session_type = normalize_shared_deck_tag(row[5])
-            session_behavior_type = get_session_behavior_type(session_type, category_meta_by_key)
             type1_distractor_answers = [
                 str(a).strip()
                 for a in list(row[11] or [])
                 if str(a or '').strip()
             ]
-            type1_submitted_answers = [str(a or '') for a in list(row[12] or [])]
-            type1_submitted_grades = [int(g) for g in list(row[13] or [])]
             materialized_prompt = str(row[14] or '').strip()
             materialized_answer = str(row[15] or '').strip()
             type4_submitted_answers = [
@@ -1253,24 +1294,23 @@ def get_kid_report_card_detail(kid_id, card_id):
                 for a in list(row[16] or [])
                 if str(a or '').strip()
             ]
+            has_type4_prompt = bool(materialized_prompt or materialized_answer)
+            if has_type4_prompt or type4_submitted_answers:
+                submitted_answers = type4_submitted_answers
+            else:
+                submitted_answers = [str(a or '') for a in list(row[12] or [])]
             type4_submitted_grades = [int(g) for g in list(row[17] or [])]
-            submitted_answers = (
-                type4_submitted_answers
-                if materialized_prompt or materialized_answer or type4_submitted_answers
-                else type1_submitted_answers
-            )
-            submitted_grades = (
-                type4_submitted_grades
-                if materialized_prompt or materialized_answer or type4_submitted_grades
-                else type1_submitted_grades
-            )
+            if has_type4_prompt or type4_submitted_grades:
+                submitted_grades = type4_submitted_grades
+            else:
+                submitted_grades = [int(g) for g in list(row[13] or [])]
             attempt_submission_count = max(1, len(submitted_answers)) if materialized_prompt else 1
             avg_response_ms = float(response_ms)
             if materialized_prompt and attempt_submission_count > 1:
                 avg_response_ms = (
                     float(response_ms) + float(int(row[8] or 0))
                 ) / float(attempt_submission_count)
-            attempts.append({
+            return {
                 'result_id': int(row[0]),
                 'correct': is_correct,
                 'correct_score': correct_score,
@@ -1283,27 +1323,23 @@ def get_kid_report_card_detail(kid_id, card_id):
                 'timestamp': row[3].isoformat() if row[3] else None,
                 'session_id': int(row[4]) if row[4] is not None else None,
                 'session_type': row[5],
-                'session_behavior_type': session_behavior_type,
+                'session_behavior_type': get_session_behavior_type(session_type, category_meta_by_key),
                 'session_category_display_name': get_deck_category_display_name(session_type, category_meta_by_key),
                 'session_started_at': row[6].isoformat() if row[6] else None,
                 'session_completed_at': row[7].isoformat() if row[7] else None,
                 'retry_total_response_ms': int(row[8] or 0),
                 'audio_file_name': row[9] or None,
                 'audio_mime_type': row[10] or None,
-                'audio_url': f"/api/kids/{kid_id}/lesson-reading/audio/{row[9]}" if row[9] else None,
+                'audio_url': f"{audio_url_prefix}{row[9]}" if row[9] else None,
                 'distractor_answers': type1_distractor_answers,
                 'materialized_prompt': materialized_prompt,
                 'materialized_answer': materialized_answer,
                 'submitted_answers': submitted_answers,
                 'submitted_grades': submitted_grades,
-            })
-            response_sum_ms += avg_response_ms
-            if correct_score == 1 or correct_score <= SESSION_RESULT_RETRY_FIXED_FIRST:
-                right_count += 1
-            elif correct_score < 0:
-                wrong_count += 1
-            else:
-                ungraded_count += 1
+            }
+
+        attempts = [_attempt_item(row) for row in attempts_rows]
+        response_sum_ms = sum(item['avg_response_ms'] for item in attempts)
 
         attempts_count = len(attempts)
         avg_response_ms = (response_sum_ms / attempts_count) if attempts_count > 0 else 0
@@ -1402,6 +1438,7 @@ def grade_kid_report_session_result(kid_id, session_id, result_id):
             [mapped_correct, result_id_int]
         )
         conn.close()
+        invalidate_today_session_rows_cache(kid_id)
 
         return jsonify({
             'result_id': result_id_int,
@@ -1481,175 +1518,144 @@ def backfill_kid_report_result_response_time(kid_id, result_id):
 # 6. Kid update + delete
 # ============================================================================
 
+# Per-category `{categoryKey: value}` fields accepted by PUT /kids/<id>, in
+# apply order, with the opt-in column each one upserts.
+_CATEGORY_MAP_UPDATE_COLUMNS = (
+    (SESSION_CARD_COUNT_BY_CATEGORY_FIELD, KID_DECK_CATEGORY_OPT_IN_COL_SESSION_CARD_COUNT),
+    (INCLUDE_ORPHAN_BY_CATEGORY_FIELD, KID_DECK_CATEGORY_OPT_IN_COL_INCLUDE_ORPHAN),
+    (DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD, KID_DECK_CATEGORY_OPT_IN_COL_DRILL_SPEED_CUTOFF_MS),
+)
+_CATEGORY_OPT_IN_UPSERT_SQL_BY_COLUMN = {
+    column: f"""
+    INSERT INTO {KID_DECK_CATEGORY_OPT_IN_TABLE} (category_key, {column})
+    VALUES (?, ?)
+    ON CONFLICT (category_key)
+    DO UPDATE SET {column} = EXCLUDED.{column}
+    """
+    for _, column in _CATEGORY_MAP_UPDATE_COLUMNS
+}
+
+
+def _parse_category_map_update(data, field, all_category_keys, parse_value):
+    """Validate one per-category update field; raise ValueError on bad input."""
+    raw_map = data.get(field)
+    if not isinstance(raw_map, dict):
+        raise ValueError(f'{field} must be an object')
+    updates = {}
+    for raw_key, raw_value in raw_map.items():
+        key = normalize_shared_deck_tag(raw_key)
+        if key not in all_category_keys:
+            raise ValueError(f'Unknown category key in {field}: {raw_key}')
+        updates[key] = parse_value(f'{field}.{key}', key, raw_value)
+    return updates
+
+
+def _parse_int_field(label, raw_value):
+    try:
+        return int(raw_value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{label} must be an integer')
+
+
 @kids_bp.route('/kids/<kid_id>', methods=['PUT'])
 def update_kid(kid_id):
     """Update a specific kid's metadata"""
-    try:
-        family_id = current_family_id()
-        if not family_id:
-            return jsonify({'error': 'Family login required'}), 401
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        data = request.get_json() or {}
-        metadata_updates = {}
-        session_count_updates_by_key = {}
-        include_orphan_updates_by_key = {}
-        drill_speed_updates_by_key = {}
-        category_meta_by_key = get_shared_deck_category_meta_by_key()
-        all_category_keys = {
-            normalize_shared_deck_tag(raw_key)
-            for raw_key in category_meta_by_key.keys()
-            if normalize_shared_deck_tag(raw_key)
-        }
+    family_id = current_family_id()
+    if not family_id:
+        return jsonify({'error': 'Family login required'}), 401
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
 
-        if SESSION_CARD_COUNT_BY_CATEGORY_FIELD in data:
-            raw_map = data.get(SESSION_CARD_COUNT_BY_CATEGORY_FIELD)
-            if not isinstance(raw_map, dict):
-                return jsonify({'error': f'{SESSION_CARD_COUNT_BY_CATEGORY_FIELD} must be an object'}), 400
-            card_count_by_category = get_kid_active_card_count_by_deck_category(kid)
-            for raw_key, raw_value in raw_map.items():
-                key = normalize_shared_deck_tag(raw_key)
-                if key not in all_category_keys:
-                    return jsonify({'error': f'Unknown category key in {SESSION_CARD_COUNT_BY_CATEGORY_FIELD}: {raw_key}'}), 400
-                try:
-                    parsed = int(raw_value)
-                except (TypeError, ValueError):
-                    return jsonify({'error': f'{SESSION_CARD_COUNT_BY_CATEGORY_FIELD}.{key} must be an integer'}), 400
-                if parsed < 0:
-                    return jsonify({'error': f'{SESSION_CARD_COUNT_BY_CATEGORY_FIELD}.{key} must be 0 or more'}), 400
-                behavior_type = str(
-                    (category_meta_by_key.get(key) or {}).get('behavior_type') or ''
-                ).strip().lower()
-                if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                    cap = int(card_count_by_category.get(key, 0))
-                    if parsed > cap:
-                        return jsonify({
-                            'error': (
-                                f'{SESSION_CARD_COUNT_BY_CATEGORY_FIELD}.{key} '
-                                f'cannot exceed {cap} (active card count for this category)'
-                            ),
-                        }), 400
-                session_count_updates_by_key[key] = parsed
-
-        if INCLUDE_ORPHAN_BY_CATEGORY_FIELD in data:
-            raw_map = data.get(INCLUDE_ORPHAN_BY_CATEGORY_FIELD)
-            if not isinstance(raw_map, dict):
-                return jsonify({'error': f'{INCLUDE_ORPHAN_BY_CATEGORY_FIELD} must be an object'}), 400
-            for raw_key, raw_value in raw_map.items():
-                key = normalize_shared_deck_tag(raw_key)
-                if key not in all_category_keys:
-                    return jsonify({'error': f'Unknown category key in {INCLUDE_ORPHAN_BY_CATEGORY_FIELD}: {raw_key}'}), 400
-                if not isinstance(raw_value, bool):
-                    return jsonify({'error': f'{INCLUDE_ORPHAN_BY_CATEGORY_FIELD}.{key} must be a boolean'}), 400
-                include_orphan_updates_by_key[key] = raw_value
-
-        if DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD in data:
-            raw_map = data.get(DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD)
-            if not isinstance(raw_map, dict):
-                return jsonify({'error': f'{DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD} must be an object'}), 400
-            for raw_key, raw_value in raw_map.items():
-                key = normalize_shared_deck_tag(raw_key)
-                if key not in all_category_keys:
-                    return jsonify({'error': f'Unknown category key in {DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD}: {raw_key}'}), 400
-                try:
-                    parsed = int(raw_value)
-                except (TypeError, ValueError):
-                    return jsonify({'error': f'{DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD}.{key} must be an integer'}), 400
-                if parsed < MIN_DRILL_SPEED_CUTOFF_MS or parsed > MAX_DRILL_SPEED_CUTOFF_MS:
-                    return jsonify({
-                        'error': (
-                            f'{DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD}.{key} must be between '
-                            f'{MIN_DRILL_SPEED_CUTOFF_MS} and {MAX_DRILL_SPEED_CUTOFF_MS}'
-                        ),
-                    }), 400
-                drill_speed_updates_by_key[key] = parsed
-
-        if TYPE_I_NON_CHINESE_DECK_MIX_FIELD in data:
-            if not isinstance(data[TYPE_I_NON_CHINESE_DECK_MIX_FIELD], dict):
-                return jsonify({'error': f'{TYPE_I_NON_CHINESE_DECK_MIX_FIELD} must be an object'}), 400
-            metadata_updates[TYPE_I_NON_CHINESE_DECK_MIX_FIELD] = sanitize_deck_mix_payload(
-                data[TYPE_I_NON_CHINESE_DECK_MIX_FIELD]
+    data = request.get_json() or {}
+    metadata_updates = {}
+    category_meta_by_key = get_shared_deck_category_meta_by_key()
+    all_category_keys = {
+        normalize_shared_deck_tag(raw_key)
+        for raw_key in category_meta_by_key.keys()
+        if normalize_shared_deck_tag(raw_key)
+    }
+
+    card_count_by_category = (
+        get_kid_active_card_count_by_deck_category(kid)
+        if SESSION_CARD_COUNT_BY_CATEGORY_FIELD in data else {}
+    )
+
+    def _session_card_count(label, key, raw_value):
+        parsed = _parse_int_field(label, raw_value)
+        if parsed < 0:
+            raise ValueError(f'{label} must be 0 or more')
+        behavior_type = str(
+            (category_meta_by_key.get(key) or {}).get('behavior_type') or ''
+        ).strip().lower()
+        if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+            cap = int(card_count_by_category.get(key, 0))
+            if parsed > cap:
+                raise ValueError(f'{label} cannot exceed {cap} (active card count for this category)')
+        return parsed
+
+    def _include_orphan(label, key, raw_value):
+        if not isinstance(raw_value, bool):
+            raise ValueError(f'{label} must be a boolean')
+        return raw_value
+
+    def _drill_speed_cutoff_ms(label, key, raw_value):
+        parsed = _parse_int_field(label, raw_value)
+        if parsed < MIN_DRILL_SPEED_CUTOFF_MS or parsed > MAX_DRILL_SPEED_CUTOFF_MS:
+            raise ValueError(
+                f'{label} must be between {MIN_DRILL_SPEED_CUTOFF_MS} and {MAX_DRILL_SPEED_CUTOFF_MS}'
             )
-
-        has_db_updates = bool(
-            session_count_updates_by_key
-            or include_orphan_updates_by_key
-            or drill_speed_updates_by_key
+        return parsed
+
+    value_parser_by_field = {
+        SESSION_CARD_COUNT_BY_CATEGORY_FIELD: _session_card_count,
+        INCLUDE_ORPHAN_BY_CATEGORY_FIELD: _include_orphan,
+        DRILL_SPEED_CUTOFF_MS_BY_CATEGORY_FIELD: _drill_speed_cutoff_ms,
+    }
+    category_map_updates = []
+    for field, column in _CATEGORY_MAP_UPDATE_COLUMNS:
+        if field not in data:
+            continue
+        updates = _parse_category_map_update(
+            data, field, all_category_keys, value_parser_by_field[field],
+        )
+        if updates:
+            category_map_updates.append((column, updates))
+
+    if TYPE_I_NON_CHINESE_DECK_MIX_FIELD in data:
+        if not isinstance(data[TYPE_I_NON_CHINESE_DECK_MIX_FIELD], dict):
+            return jsonify({'error': f'{TYPE_I_NON_CHINESE_DECK_MIX_FIELD} must be an object'}), 400
+        metadata_updates[TYPE_I_NON_CHINESE_DECK_MIX_FIELD] = sanitize_deck_mix_payload(
+            data[TYPE_I_NON_CHINESE_DECK_MIX_FIELD]
         )
-        if not has_db_updates and not metadata_updates:
-            return jsonify({'error': 'No supported fields to update'}), 400
 
-        if has_db_updates:
-            kid_conn = get_kid_connection_for(kid)
-            try:
-                if session_count_updates_by_key:
-                    kid_conn.executemany(
-                        f"""
-                        INSERT INTO {KID_DECK_CATEGORY_OPT_IN_TABLE} (
-                          category_key,
-                          {KID_DECK_CATEGORY_OPT_IN_COL_SESSION_CARD_COUNT}
-                        )
-                        VALUES (?, ?)
-                        ON CONFLICT (category_key)
-                        DO UPDATE SET {KID_DECK_CATEGORY_OPT_IN_COL_SESSION_CARD_COUNT} = EXCLUDED.{KID_DECK_CATEGORY_OPT_IN_COL_SESSION_CARD_COUNT}
-                        """,
-                        [
-                            [key, int(value)]
-                            for key, value in session_count_updates_by_key.items()
-                        ],
-                    )
-                if include_orphan_updates_by_key:
-                    kid_conn.executemany(
-                        f"""
-                        INSERT INTO {KID_DECK_CATEGORY_OPT_IN_TABLE} (
-                          category_key,
-                          {KID_DECK_CATEGORY_OPT_IN_COL_INCLUDE_ORPHAN}
-                        )
-                        VALUES (?, ?)
-                        ON CONFLICT (category_key)
-                        DO UPDATE SET {KID_DECK_CATEGORY_OPT_IN_COL_INCLUDE_ORPHAN} = EXCLUDED.{KID_DECK_CATEGORY_OPT_IN_COL_INCLUDE_ORPHAN}
-                        """,
-                        [
-                            [key, bool(value)]
-                            for key, value in include_orphan_updates_by_key.items()
-                        ],
-                    )
-                if drill_speed_updates_by_key:
-                    kid_conn.executemany(
-                        f"""
-                        INSERT INTO {KID_DECK_CATEGORY_OPT_IN_TABLE} (
-                          category_key,
-                          {KID_DECK_CATEGORY_OPT_IN_COL_DRILL_SPEED_CUTOFF_MS}
-                        )
-                        VALUES (?, ?)
-                        ON CONFLICT (category_key)
-                        DO UPDATE SET {KID_DECK_CATEGORY_OPT_IN_COL_DRILL_SPEED_CUTOFF_MS} = EXCLUDED.{KID_DECK_CATEGORY_OPT_IN_COL_DRILL_SPEED_CUTOFF_MS}
-                        """,
-                        [
-                            [key, int(value)]
-                            for key, value in drill_speed_updates_by_key.items()
-                        ],
-                    )
-            finally:
-                kid_conn.close()
+    if not category_map_updates and not metadata_updates:
+        return jsonify({'error': 'No supported fields to update'}), 400
 
-        if metadata_updates:
-            updated_kid = metadata.update_kid(kid_id, metadata_updates, family_id=family_id)
-        else:
-            updated_kid = metadata.get_kid_by_id(kid_id, family_id=family_id)
-        if not updated_kid:
-            return jsonify({'error': 'Kid not found'}), 404
-        hydrate_kid_category_config_from_db(
-            updated_kid,
-            category_meta_by_key=category_meta_by_key,
-            force_reload=True,
-        )
+    if category_map_updates:
+        kid_conn = get_kid_connection_for(kid)
+        try:
+            for column, updates in category_map_updates:
+                kid_conn.executemany(
+                    _CATEGORY_OPT_IN_UPSERT_SQL_BY_COLUMN[column],
+                    [[key, value] for key, value in updates.items()],
+                )
+        finally:
+            kid_conn.close()
 
-        return jsonify(updated_kid), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if metadata_updates:
+        updated_kid = metadata.update_kid(kid_id, metadata_updates, family_id=family_id)
+    else:
+        updated_kid = metadata.get_kid_by_id(kid_id, family_id=family_id)
+    if not updated_kid:
+        return jsonify({'error': 'Kid not found'}), 404
+    hydrate_kid_category_config_from_db(
+        updated_kid,
+        category_meta_by_key=category_meta_by_key,
+        force_reload=True,
+    )
+
+    return jsonify(updated_kid), 200
 
 
 @kids_bp.route('/kids/<kid_id>', methods=['DELETE'])
@@ -1668,6 +1674,7 @@ def delete_kid(kid_id):
 
         # Delete database file
         kid_db.delete_kid_database_by_path(kid.get('dbFilePath') or get_kid_scoped_db_relpath(kid))
+        invalidate_today_session_rows_cache(kid.get('id'))
         type3_audio_dir = get_kid_type3_audio_dir(kid)
         if os.path.exists(type3_audio_dir):
             shutil.rmtree(type3_audio_dir, ignore_errors=True)
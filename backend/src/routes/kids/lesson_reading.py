@@ -16,7 +16,6 @@ from src.routes.kids import (
     request,
     send_file,
     send_from_directory,
-    subprocess,
     threading,
     uuid,
 )
@@ -79,6 +78,7 @@ def _ensure_type3_mp3_sibling(audio_dir, file_name, stored_mime_type):
             '-f', 'mp3',
             tmp_path,
         ]
+        import subprocess
         try:
             process = subprocess.run(
                 ffmpeg_cmd,
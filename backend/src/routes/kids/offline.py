@@ -658,7 +658,7 @@ def offline_report_pack_stats(kid_id):
 # ============================================================================
 
 # Mutating HTTP methods that the gate inspects. GET/HEAD/OPTIONS are always free.
-_GATED_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+_GATED_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
 
 
 def _extract_kid_id_from_path(path):
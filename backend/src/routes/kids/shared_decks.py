@@ -73,6 +73,7 @@ from src.services.family_auth import (
     require_super_family,
     resolve_family_id_int_or_error,
 )
+from src.services.kid_daily_progress import invalidate_today_session_rows_cache
 from src.services.chinese_text import (
     CHINESE_BACK_CONTENTS,
     CHINESE_BACK_CONTENT_PINYIN,
@@ -462,55 +463,51 @@ def delete_category_data_for_kid(kid, key):
             )
             changed = True
 
-        session_id_rows = kid_conn.execute(
-            "SELECT id FROM sessions WHERE type = ?",
+        # Session rows are keyed by category type, so every dependent delete
+        # filters through a subquery instead of round-tripping id lists.
+        audio_rows = kid_conn.execute(
+            """
+            SELECT lra.file_name FROM lesson_reading_audio lra
+            JOIN session_results sr ON sr.id = lra.result_id
+            JOIN sessions s ON s.id = sr.session_id
+            WHERE s.type = ?
+            """,
             [key],
         ).fetchall()
-        session_ids = [int(r[0]) for r in session_id_rows]
-        if session_ids:
-            session_placeholders = ','.join(['?'] * len(session_ids))
-            result_id_rows = kid_conn.execute(
-                f"SELECT id FROM session_results WHERE session_id IN ({session_placeholders})",
-                session_ids,
-            ).fetchall()
-            result_ids = [int(r[0]) for r in result_id_rows]
-            if result_ids:
-                result_placeholders = ','.join(['?'] * len(result_ids))
-                audio_rows = kid_conn.execute(
-                    f"SELECT file_name FROM lesson_reading_audio WHERE result_id IN ({result_placeholders})",
-                    result_ids,
-                ).fetchall()
-                audio_dir = get_kid_type3_audio_dir(kid)
-                for r in audio_rows:
-                    file_name = str(r[0] or '').strip()
-                    if not file_name:
-                        continue
-                    file_path = os.path.join(audio_dir, file_name)
-                    if os.path.exists(file_path):
-                        try:
-                            os.remove(file_path)
-                        except OSError:
-                            pass
-                kid_conn.execute(
-                    f"DELETE FROM lesson_reading_audio WHERE result_id IN ({result_placeholders})",
-                    result_ids,
-                )
-                kid_conn.execute(
-                    f"DELETE FROM type1_result_item WHERE result_id IN ({result_placeholders})",
-                    result_ids,
-                )
-                kid_conn.execute(
-                    f"DELETE FROM type4_result_item WHERE result_id IN ({result_placeholders})",
-                    result_ids,
-                )
-                kid_conn.execute(
-                    f"DELETE FROM session_results WHERE id IN ({result_placeholders})",
-                    result_ids,
-                )
+        if audio_rows:
+            audio_dir = get_kid_type3_audio_dir(kid)
+            for r in audio_rows:
+                file_name = str(r[0] or '').strip()
+                if not file_name:
+                    continue
+                file_path = os.path.join(audio_dir, file_name)
+                if os.path.exists(file_path):
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+        for result_table in ('lesson_reading_audio', 'type1_result_item', 'type4_result_item'):
             kid_conn.execute(
-                f"DELETE FROM sessions WHERE id IN ({session_placeholders})",
-                session_ids,
+                f"""
+                DELETE FROM {result_table}
+                WHERE result_id IN (
+                    SELECT sr.id FROM session_results sr
+                    JOIN sessions s ON s.id = sr.session_id
+                    WHERE s.type = ?
+                )
+                """,
+                [key],
             )
+        kid_conn.execute(
+            "DELETE FROM session_results WHERE session_id IN (SELECT id FROM sessions WHERE type = ?)",
+            [key],
+        )
+        # DuckDB DELETE yields a single deleted-row count.
+        deleted_session_count = kid_conn.execute(
+            "DELETE FROM sessions WHERE type = ?",
+            [key],
+        ).fetchone()[0]
+        if deleted_session_count:
             changed = True
 
         opt_in_deleted = kid_conn.execute(
@@ -531,6 +528,7 @@ def delete_category_data_for_kid(kid, key):
     finally:
         if kid_conn is not None:
             kid_conn.close()
+        invalidate_today_session_rows_cache(kid.get('id'))
     return changed
 
 
@@ -541,72 +539,67 @@ def delete_category_data_for_kid(kid, key):
 @kids_bp.route('/shared-decks/name-availability', methods=['GET'])
 def shared_deck_name_availability():
     """Check whether a shared deck name is globally available."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        requested_name = str(request.args.get('name') or '').strip()
-        exclude_deck_id_raw = str(request.args.get('excludeDeckId') or '').strip()
-        exclude_deck_id = None
-        if exclude_deck_id_raw:
-            try:
-                exclude_deck_id = int(exclude_deck_id_raw)
-            except (TypeError, ValueError):
-                return jsonify({'error': 'excludeDeckId must be an integer'}), 400
-
-        conn = get_shared_decks_connection(read_only=True)
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    requested_name = str(request.args.get('name') or '').strip()
+    exclude_deck_id_raw = str(request.args.get('excludeDeckId') or '').strip()
+    exclude_deck_id = None
+    if exclude_deck_id_raw:
         try:
-            tags = None
-            first_tag_raw = request.args.get('firstTag')
-            if first_tag_raw is not None:
-                extra_tags_raw = request.args.getlist('extraTag')
-                allowed_first_tags = get_allowed_shared_deck_first_tags(conn)
-                tags = build_shared_deck_tags(
-                    first_tag_raw,
-                    extra_tags_raw,
-                    allowed_first_tags=allowed_first_tags,
-                )
-
-            deck_name = '_'.join(tags) if tags else requested_name
-            if not deck_name:
-                return jsonify({'error': 'name is required'}), 400
+            exclude_deck_id = int(exclude_deck_id_raw)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'excludeDeckId must be an integer'}), 400
 
-            if exclude_deck_id is not None and exclude_deck_id > 0:
-                row = conn.execute(
-                    "SELECT deck_id FROM deck WHERE name = ? AND deck_id <> ? LIMIT 1",
-                    [deck_name, exclude_deck_id]
-                ).fetchone()
-            else:
-                row = conn.execute(
-                    "SELECT deck_id FROM deck WHERE name = ? LIMIT 1",
-                    [deck_name]
-                ).fetchone()
-            prefix_conflict_tags = (
-                find_shared_deck_tag_prefix_conflict(conn, tags)
-                if tags
-                else None
+    conn = get_shared_decks_connection(read_only=True)
+    try:
+        tags = None
+        first_tag_raw = request.args.get('firstTag')
+        if first_tag_raw is not None:
+            extra_tags_raw = request.args.getlist('extraTag')
+            allowed_first_tags = get_allowed_shared_deck_first_tags(conn)
+            tags = build_shared_deck_tags(
+                first_tag_raw,
+                extra_tags_raw,
+                allowed_first_tags=allowed_first_tags,
             )
-        finally:
-            conn.close()
 
-        if row is not None:
-            conflict_type = 'exact_name'
-        elif prefix_conflict_tags:
-            conflict_type = 'tag_prefix_conflict'
+        deck_name = '_'.join(tags) if tags else requested_name
+        if not deck_name:
+            return jsonify({'error': 'name is required'}), 400
+
+        if exclude_deck_id is not None and exclude_deck_id > 0:
+            row = conn.execute(
+                "SELECT deck_id FROM deck WHERE name = ? AND deck_id <> ? LIMIT 1",
+                [deck_name, exclude_deck_id]
+            ).fetchone()
         else:
-            conflict_type = None
-        return jsonify({
-            'name': deck_name,
-            'available': row is None and not prefix_conflict_tags,
-            'existing_deck_id': int(row[0]) if row else None,
-            'conflict_type': conflict_type,
-            'conflict_tags': prefix_conflict_tags,
-            'exclude_deck_id': exclude_deck_id,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            row = conn.execute(
+                "SELECT deck_id FROM deck WHERE name = ? LIMIT 1",
+                [deck_name]
+            ).fetchone()
+        prefix_conflict_tags = (
+            find_shared_deck_tag_prefix_conflict(conn, tags)
+            if tags
+            else None
+        )
+    finally:
+        conn.close()
+
+    if row is not None:
+        conflict_type = 'exact_name'
+    elif prefix_conflict_tags:
+        conflict_type = 'tag_prefix_conflict'
+    else:
+        conflict_type = None
+    return jsonify({
+        'name': deck_name,
+        'available': row is None and not prefix_conflict_tags,
+        'existing_deck_id': int(row[0]) if row else None,
+        'conflict_type': conflict_type,
+        'conflict_tags': prefix_conflict_tags,
+        'exclude_deck_id': exclude_deck_id,
+    }), 200
 
 
 @kids_bp.route('/shared-decks/chinese-characters/pinyin', methods=['POST'])
@@ -658,57 +651,47 @@ def shared_deck_chinese_characters_pinyin():
 @kids_bp.route('/shared-decks/type4/preview', methods=['POST'])
 def preview_shared_type4_generator():
     """Run a Type IV generator snippet and return example outputs."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-
-        payload = request.get_json() or {}
-        generator_code = normalize_type_iv_generator_code(payload.get('generatorCode'))
-        raw_seed_base = payload.get('seedBase')
-        if raw_seed_base in (None, ''):
-            seed_base = 1000
-        else:
-            seed_base = int(raw_seed_base)
-        samples, has_validate = preview_type4_generator(
-            generator_code,
-            sample_count=TYPE_IV_PREVIEW_SAMPLE_COUNT,
-            seed_base=seed_base,
-        )
-        return jsonify({
-            'sample_count': len(samples),
-            'samples': samples,
-            'has_validate': has_validate,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+
+    payload = request.get_json() or {}
+    generator_code = normalize_type_iv_generator_code(payload.get('generatorCode'))
+    raw_seed_base = payload.get('seedBase')
+    if raw_seed_base in (None, ''):
+        seed_base = 1000
+    else:
+        seed_base = int(raw_seed_base)
+    samples, has_validate = preview_type4_generator(
+        generator_code,
+        sample_count=TYPE_IV_PREVIEW_SAMPLE_COUNT,
+        seed_base=seed_base,
+    )
+    return jsonify({
+        'sample_count': len(samples),
+        'samples': samples,
+        'has_validate': has_validate,
+    }), 200
 
 
 @kids_bp.route('/shared-decks/type4/test-validate', methods=['POST'])
 def test_shared_type4_validate():
     """Test a Type IV generator's validate function against a submitted answer."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
 
-        payload = request.get_json() or {}
-        generator_code = normalize_type_iv_generator_code(payload.get('generatorCode'))
-        submitted_answer = str(payload.get('submittedAnswer') or '').strip()
-        expected_answer = str(payload.get('expectedAnswer') or '').strip()
-        if not submitted_answer:
-            return jsonify({'error': 'submittedAnswer is required'}), 400
-        if not expected_answer:
-            return jsonify({'error': 'expectedAnswer is required'}), 400
-
-        result = test_type4_validate(generator_code, submitted_answer, expected_answer)
-        return jsonify(result), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    payload = request.get_json() or {}
+    generator_code = normalize_type_iv_generator_code(payload.get('generatorCode'))
+    submitted_answer = str(payload.get('submittedAnswer') or '').strip()
+    expected_answer = str(payload.get('expectedAnswer') or '').strip()
+    if not submitted_answer:
+        return jsonify({'error': 'submittedAnswer is required'}), 400
+    if not expected_answer:
+        return jsonify({'error': 'expectedAnswer is required'}), 400
+
+    result = test_type4_validate(generator_code, submitted_answer, expected_answer)
+    return jsonify(result), 200
 
 
 # ============================================================================
@@ -718,167 +701,157 @@ def test_shared_type4_validate():
 @kids_bp.route('/shared-decks/type4/representative-label-availability', methods=['POST'])
 def shared_type4_representative_label_availability():
     """Check whether a type-IV representative label is available in one category."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-
-        payload = request.get_json() or {}
-        category_key = normalize_shared_deck_tag(payload.get('categoryKey'))
-        if not category_key:
-            raise ValueError('categoryKey is required')
-        representative_label = normalize_type_iv_display_label(payload.get('displayLabel'))
-        exclude_deck_id_raw = payload.get('excludeDeckId')
-        exclude_deck_id = None
-        if exclude_deck_id_raw not in (None, ''):
-            try:
-                exclude_deck_id = int(exclude_deck_id_raw)
-            except (TypeError, ValueError):
-                raise ValueError('excludeDeckId must be an integer')
-
-        conn = get_shared_decks_connection(read_only=True)
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+
+    payload = request.get_json() or {}
+    category_key = normalize_shared_deck_tag(payload.get('categoryKey'))
+    if not category_key:
+        raise ValueError('categoryKey is required')
+    representative_label = normalize_type_iv_display_label(payload.get('displayLabel'))
+    exclude_deck_id_raw = payload.get('excludeDeckId')
+    exclude_deck_id = None
+    if exclude_deck_id_raw not in (None, ''):
         try:
-            category_meta = None
-            for item in get_shared_deck_categories(conn):
-                key = normalize_shared_deck_tag(item.get('category_key'))
-                if key == category_key:
-                    category_meta = item
-                    break
-            if category_meta is None:
-                raise ValueError(f'Unknown categoryKey: {category_key}')
-            behavior_type = str(category_meta.get('behavior_type') or '').strip().lower()
-            if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                raise ValueError('Representative-label availability is only for type_iv categories')
+            exclude_deck_id = int(exclude_deck_id_raw)
+        except (TypeError, ValueError):
+            raise ValueError('excludeDeckId must be an integer')
 
-            conflict = find_shared_type_iv_representative_label_conflict(
-                conn,
-                category_key,
-                representative_label,
-                exclude_deck_id=exclude_deck_id,
-            )
-        finally:
-            conn.close()
+    conn = get_shared_decks_connection(read_only=True)
+    try:
+        category_meta = None
+        for item in get_shared_deck_categories(conn):
+            key = normalize_shared_deck_tag(item.get('category_key'))
+            if key == category_key:
+                category_meta = item
+                break
+        if category_meta is None:
+            raise ValueError(f'Unknown categoryKey: {category_key}')
+        behavior_type = str(category_meta.get('behavior_type') or '').strip().lower()
+        if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+            raise ValueError('Representative-label availability is only for type_iv categories')
+
+        conflict = find_shared_type_iv_representative_label_conflict(
+            conn,
+            category_key,
+            representative_label,
+            exclude_deck_id=exclude_deck_id,
+        )
+    finally:
+        conn.close()
 
-        return jsonify({
-            'category_key': category_key,
-            'display_label': representative_label,
-            'available': conflict is None,
-            'existing_deck_id': int(conflict['deck_id']) if conflict else None,
-            'existing_deck_name': str(conflict['deck_name']) if conflict else '',
-            'existing_tags': list(conflict['tags']) if conflict else [],
-            'existing_tag_labels': list(conflict['tag_labels']) if conflict else [],
-            'exclude_deck_id': exclude_deck_id,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'category_key': category_key,
+        'display_label': representative_label,
+        'available': conflict is None,
+        'existing_deck_id': int(conflict['deck_id']) if conflict else None,
+        'existing_deck_name': str(conflict['deck_name']) if conflict else '',
+        'existing_tags': list(conflict['tags']) if conflict else [],
+        'existing_tag_labels': list(conflict['tag_labels']) if conflict else [],
+        'exclude_deck_id': exclude_deck_id,
+    }), 200
 
 
 @kids_bp.route('/shared-decks/category-card-overlap', methods=['POST'])
 def shared_deck_category_card_overlap():
     """Compare candidate cards with existing cards in one category."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
 
-        payload = request.get_json() or {}
-        category_key = normalize_shared_deck_tag(payload.get('categoryKey'))
-        if not category_key:
-            raise ValueError('categoryKey is required')
-
-        conn = get_shared_decks_connection(read_only=True)
-        try:
-            category_meta = None
-            for item in get_shared_deck_categories(conn):
-                key = normalize_shared_deck_tag(item.get('category_key'))
-                if key == category_key:
-                    category_meta = item
-                    break
-            if category_meta is None:
-                raise ValueError(f'Unknown categoryKey: {category_key}')
-
-            behavior_type = str(category_meta.get('behavior_type') or '').strip().lower()
-            chinese_type_i = (
-                behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_I
-                and bool(category_meta.get('has_chinese_specific_logic'))
-            )
-            cards = normalize_shared_deck_cards(
-                payload.get('cards'), allow_empty_back=chinese_type_i
-            )
-            if behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                raise ValueError('type_iv categories use Python generators, not static cards')
-
-            rows = conn.execute(
-                """
-                SELECT
-                  c.front,
-                  c.back,
-                  d.deck_id,
-                  d.name
-                FROM cards c
-                JOIN deck d ON d.deck_id = c.deck_id
-                WHERE array_length(d.tags) >= 1
-                  AND lower(d.tags[1]) = ?
-                ORDER BY d.deck_id ASC, c.id ASC
-                """,
-                [category_key],
-            ).fetchall()
-        finally:
-            conn.close()
-
-        existing_by_front = {}
-        for row in rows:
-            front = str(row[0] or '')
-            back = str(row[1] or '')
-            existing_by_front.setdefault(front, []).append({
-                'front': front,
-                'back': back,
-                'deck_id': int(row[2]),
-                'deck_name': str(row[3] or ''),
-            })
+    payload = request.get_json() or {}
+    category_key = normalize_shared_deck_tag(payload.get('categoryKey'))
+    if not category_key:
+        raise ValueError('categoryKey is required')
 
-        def unique_decks(entries):
-            seen = set()
-            out = []
-            for entry in entries:
-                key = int(entry.get('deck_id') or 0)
-                if key <= 0 or key in seen:
-                    continue
-                seen.add(key)
-                out.append({
-                    'deck_id': key,
-                    'deck_name': str(entry.get('deck_name') or '').strip(),
-                })
-            return out
-
-        overlaps = []
-        for idx, card in enumerate(cards):
-            front = str(card.get('front') or '')
-            back = str(card.get('back') or '')
-            matches = list(existing_by_front.get(front) or [])
-            if not matches:
+    conn = get_shared_decks_connection(read_only=True)
+    try:
+        category_meta = None
+        for item in get_shared_deck_categories(conn):
+            key = normalize_shared_deck_tag(item.get('category_key'))
+            if key == category_key:
+                category_meta = item
+                break
+        if category_meta is None:
+            raise ValueError(f'Unknown categoryKey: {category_key}')
+
+        behavior_type = str(category_meta.get('behavior_type') or '').strip().lower()
+        chinese_type_i = (
+            behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_I
+            and bool(category_meta.get('has_chinese_specific_logic'))
+        )
+        cards = normalize_shared_deck_cards(
+            payload.get('cards'), allow_empty_back=chinese_type_i
+        )
+        if behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+            raise ValueError('type_iv categories use Python generators, not static cards')
+
+        rows = conn.execute(
+            """
+            SELECT
+              c.front,
+              c.back,
+              d.deck_id,
+              d.name
+            FROM cards c
+            JOIN deck d ON d.deck_id = c.deck_id
+            WHERE array_length(d.tags) >= 1
+              AND lower(d.tags[1]) = ?
+            ORDER BY d.deck_id ASC, c.id ASC
+            """,
+            [category_key],
+        ).fetchall()
+    finally:
+        conn.close()
+
+    existing_by_front = {}
+    for row in rows:
+        front = str(row[0] or '')
+        back = str(row[1] or '')
+        existing_by_front.setdefault(front, []).append({
+            'front': front,
+            'back': back,
+            'deck_id': int(row[2]),
+            'deck_name': str(row[3] or ''),
+        })
+
+    def unique_decks(entries):
+        seen = set()
+        out = []
+        for entry in entries:
+            key = int(entry.get('deck_id') or 0)
+            if key <= 0 or key in seen:
                 continue
-
-            exact_matches = [entry for entry in matches if entry.get('front') == front and entry.get('back') == back]
-            mismatch_matches = [entry for entry in matches if not (entry.get('front') == front and entry.get('back') == back)]
-            overlaps.append({
-                'index': idx,
-                'front': front,
-                'back': back,
-                'exact_match_decks': unique_decks(exact_matches),
-                'mismatch_decks': unique_decks(mismatch_matches),
+            seen.add(key)
+            out.append({
+                'deck_id': key,
+                'deck_name': str(entry.get('deck_name') or '').strip(),
             })
-
-        return jsonify({
-            'category_key': category_key,
-            'overlaps': overlaps,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return out
+
+    overlaps = []
+    for idx, card in enumerate(cards):
+        front = str(card.get('front') or '')
+        back = str(card.get('back') or '')
+        matches = list(existing_by_front.get(front) or [])
+        if not matches:
+            continue
+
+        exact_matches = [entry for entry in matches if entry.get('front') == front and entry.get('back') == back]
+        mismatch_matches = [entry for entry in matches if not (entry.get('front') == front and entry.get('back') == back)]
+        overlaps.append({
+            'index': idx,
+            'front': front,
+            'back': back,
+            'exact_match_decks': unique_decks(exact_matches),
+            'mismatch_decks': unique_decks(mismatch_matches),
+        })
+
+    return jsonify({
+        'category_key': category_key,
+        'overlaps': overlaps,
+    }), 200
 
 
 # ============================================================================
@@ -888,23 +861,18 @@ def shared_deck_category_card_overlap():
 @kids_bp.route('/shared-decks/tags', methods=['GET'])
 def shared_deck_tags():
     """Return shared-deck ordered tag paths for autocomplete."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
 
-        conn = get_shared_decks_connection(read_only=True)
-        try:
-            tag_paths = get_all_shared_deck_tag_paths(conn)
-            tag_label_paths = get_all_shared_deck_tag_label_paths(conn)
-        finally:
-            conn.close()
+    conn = get_shared_decks_connection(read_only=True)
+    try:
+        tag_paths = get_all_shared_deck_tag_paths(conn)
+        tag_label_paths = get_all_shared_deck_tag_label_paths(conn)
+    finally:
+        conn.close()
 
-        return jsonify({'tag_paths': tag_paths, 'tag_label_paths': tag_label_paths}), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'tag_paths': tag_paths, 'tag_label_paths': tag_label_paths}), 200
 
 
 # ============================================================================
@@ -1064,252 +1032,242 @@ def get_shared_deck_details(deck_id):
 @kids_bp.route('/shared-decks/<int:deck_id>/tags', methods=['PUT'])
 def update_shared_deck_tags(deck_id):
     """Rename one owned shared deck's tag path while keeping its first tag fixed."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        family_id_int, err = resolve_family_id_int_or_error()
-        if err:
-            return err
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    family_id_int, err = resolve_family_id_int_or_error()
+    if err:
+        return err
 
-        payload = request.get_json(silent=True) or {}
-        extra_tags_payload = payload.get('extraTags')
+    payload = request.get_json(silent=True) or {}
+    extra_tags_payload = payload.get('extraTags')
 
-        with _SHARED_DECK_MUTATION_LOCK:
-            conn = None
-            try:
-                conn = get_shared_decks_connection()
-                deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
-                if not deck_row:
-                    return jsonify({'error': 'Deck not found'}), 404
+    with _SHARED_DECK_MUTATION_LOCK:
+        conn = None
+        try:
+            conn = get_shared_decks_connection()
+            deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
+            if not deck_row:
+                return jsonify({'error': 'Deck not found'}), 404
 
-                current_name = str(deck_row[1] or '').strip()
-                current_tags, _ = extract_shared_deck_tags_and_labels(deck_row[2])
-                current_first_tag = normalize_shared_deck_tag(current_tags[0] if current_tags else '')
-                if not current_first_tag:
-                    return jsonify({'error': 'Deck is missing a valid first tag'}), 400
+            current_name = str(deck_row[1] or '').strip()
+            current_tags, _ = extract_shared_deck_tags_and_labels(deck_row[2])
+            current_first_tag = normalize_shared_deck_tag(current_tags[0] if current_tags else '')
+            if not current_first_tag:
+                return jsonify({'error': 'Deck is missing a valid first tag'}), 400
+
+            allowed_first_tags = get_allowed_shared_deck_first_tags(conn)
+            tags, comments_by_tag = build_shared_deck_tags(
+                current_first_tag,
+                extra_tags_payload,
+                allowed_first_tags=allowed_first_tags,
+                include_comments=True,
+            )
+            if tags[0] != current_first_tag:
+                return jsonify({'error': 'First tag cannot be changed here'}), 400
 
-                allowed_first_tags = get_allowed_shared_deck_first_tags(conn)
-                tags, comments_by_tag = build_shared_deck_tags(
-                    current_first_tag,
-                    extra_tags_payload,
-                    allowed_first_tags=allowed_first_tags,
-                    include_comments=True,
-                )
-                if tags[0] != current_first_tag:
-                    return jsonify({'error': 'First tag cannot be changed here'}), 400
-
-                if tags != current_tags:
-                    prefix_conflict_tags = find_shared_deck_tag_prefix_conflict(conn, tags)
-                    if prefix_conflict_tags:
-                        raise ValueError(
-                            'Tag path conflicts with existing deck path '
-                            f'{format_shared_deck_tag_path(prefix_conflict_tags)}. '
-                            'Nested tag paths are not allowed.'
-                        )
-
-                next_name = '_'.join(tags)
-                storage_tags = [
-                    format_shared_deck_tag_display_label(tag, comments_by_tag.get(tag))
-                    for tag in tags
-                ]
+            if tags != current_tags:
+                prefix_conflict_tags = find_shared_deck_tag_prefix_conflict(conn, tags)
+                if prefix_conflict_tags:
+                    raise ValueError(
+                        'Tag path conflicts with existing deck path '
+                        f'{format_shared_deck_tag_path(prefix_conflict_tags)}. '
+                        'Nested tag paths are not allowed.'
+                    )
 
-                existing_name_row = conn.execute(
-                    "SELECT deck_id FROM deck WHERE name = ? AND deck_id <> ? LIMIT 1",
-                    [next_name, deck_id],
-                ).fetchone()
-                if existing_name_row:
-                    return jsonify({'error': 'Deck name already exists. Please choose different tags.'}), 409
+            next_name = '_'.join(tags)
+            storage_tags = [
+                format_shared_deck_tag_display_label(tag, comments_by_tag.get(tag))
+                for tag in tags
+            ]
 
-                shared_updated = False
-                if next_name != current_name or storage_tags != [str(item) for item in list(deck_row[2] or [])]:
-                    conn.execute("BEGIN TRANSACTION")
-                    try:
-                        conn.execute(
-                            """
-                            UPDATE deck
-                            SET name = ?, tags = ?
-                            WHERE deck_id = ? AND creator_family_id = ?
-                            """,
-                            [next_name, storage_tags, deck_id, family_id_int],
-                        )
-                        conn.execute("COMMIT")
-                        shared_updated = True
-                    except Exception:
-                        conn.execute("ROLLBACK")
-                        raise
-            finally:
-                if conn is not None:
-                    conn.close()
+            existing_name_row = conn.execute(
+                "SELECT deck_id FROM deck WHERE name = ? AND deck_id <> ? LIMIT 1",
+                [next_name, deck_id],
+            ).fetchone()
+            if existing_name_row:
+                return jsonify({'error': 'Deck name already exists. Please choose different tags.'}), 409
 
-            sync_result = sync_materialized_shared_deck_metadata_for_all_kids(
-                deck_id,
-                next_name,
-                storage_tags,
-            )
-            if sync_result['failures']:
-                failed_labels = [
-                    item['kid_name'] or f"kid {item['kid_id']}"
-                    for item in sync_result['failures']
-                ]
-                return jsonify({
-                    'error': (
-                        'Shared deck tags were updated, but some kid DBs failed to sync: '
-                        + ', '.join(failed_labels)
-                        + '. Re-running the same rename will retry the kid sync.'
-                    ),
-                    'shared_updated': bool(shared_updated),
-                    'deck_id': int(deck_id),
-                    'deck': {
-                        'deck_id': int(deck_id),
-                        'name': next_name,
-                        'tags': tags,
-                        'tag_labels': storage_tags,
-                    },
-                    'updated_kid_count': int(sync_result['updated_kid_count']),
-                    'updated_deck_count': int(sync_result['updated_deck_count']),
-                    'kid_sync_failures': sync_result['failures'],
-                }), 500
+            shared_updated = False
+            if next_name != current_name or storage_tags != [str(item) for item in list(deck_row[2] or [])]:
+                conn.execute("BEGIN TRANSACTION")
+                try:
+                    conn.execute(
+                        """
+                        UPDATE deck
+                        SET name = ?, tags = ?
+                        WHERE deck_id = ? AND creator_family_id = ?
+                        """,
+                        [next_name, storage_tags, deck_id, family_id_int],
+                    )
+                    conn.execute("COMMIT")
+                    shared_updated = True
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+        finally:
+            if conn is not None:
+                conn.close()
 
-        return jsonify({
-            'updated': True,
-            'shared_updated': bool(shared_updated),
-            'deck': {
+        sync_result = sync_materialized_shared_deck_metadata_for_all_kids(
+            deck_id,
+            next_name,
+            storage_tags,
+        )
+        if sync_result['failures']:
+            failed_labels = [
+                item['kid_name'] or f"kid {item['kid_id']}"
+                for item in sync_result['failures']
+            ]
+            return jsonify({
+                'error': (
+                    'Shared deck tags were updated, but some kid DBs failed to sync: '
+                    + ', '.join(failed_labels)
+                    + '. Re-running the same rename will retry the kid sync.'
+                ),
+                'shared_updated': bool(shared_updated),
                 'deck_id': int(deck_id),
-                'name': next_name,
-                'tags': tags,
-                'tag_labels': storage_tags,
-            },
-            'updated_kid_count': int(sync_result['updated_kid_count']),
-            'updated_deck_count': int(sync_result['updated_deck_count']),
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+                'deck': {
+                    'deck_id': int(deck_id),
+                    'name': next_name,
+                    'tags': tags,
+                    'tag_labels': storage_tags,
+                },
+                'updated_kid_count': int(sync_result['updated_kid_count']),
+                'updated_deck_count': int(sync_result['updated_deck_count']),
+                'kid_sync_failures': sync_result['failures'],
+            }), 500
+
+    return jsonify({
+        'updated': True,
+        'shared_updated': bool(shared_updated),
+        'deck': {
+            'deck_id': int(deck_id),
+            'name': next_name,
+            'tags': tags,
+            'tag_labels': storage_tags,
+        },
+        'updated_kid_count': int(sync_result['updated_kid_count']),
+        'updated_deck_count': int(sync_result['updated_deck_count']),
+    }), 200
 
 
 @kids_bp.route('/shared-decks/rename-tag', methods=['POST'])
 def rename_shared_deck_tag():
     """Rename a tag across all decks that contain it at the specified position."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        family_id_int, err = resolve_family_id_int_or_error()
-        if err:
-            return err
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    family_id_int, err = resolve_family_id_int_or_error()
+    if err:
+        return err
+
+    payload = request.get_json(silent=True) or {}
+    old_tag_raw = str(payload.get('oldTag') or '').strip()
+    new_tag_raw = str(payload.get('newTag') or '').strip()
+    tag_index = int(payload.get('tagIndex', -1))
+
+    old_tag = normalize_shared_deck_tag(old_tag_raw)
+    new_tag_parsed, new_comment = parse_shared_deck_tag_with_comment(new_tag_raw)
+    if not old_tag:
+        return jsonify({'error': 'oldTag is required'}), 400
+    if not new_tag_parsed:
+        return jsonify({'error': 'newTag is required'}), 400
+    if tag_index < 1:
+        return jsonify({'error': 'tagIndex must be >= 1 (cannot rename first tag)'}), 400
+    if old_tag == new_tag_parsed and not new_comment:
+        return jsonify({'error': 'New tag is the same as the old tag'}), 400
+
+    new_label = format_shared_deck_tag_display_label(new_tag_parsed, new_comment)
+
+    with _SHARED_DECK_MUTATION_LOCK:
+        conn = None
+        try:
+            conn = get_shared_decks_connection()
+            all_rows = conn.execute(
+                "SELECT deck_id, name, tags, creator_family_id FROM deck WHERE creator_family_id = ?",
+                [family_id_int],
+            ).fetchall()
 
-        payload = request.get_json(silent=True) or {}
-        old_tag_raw = str(payload.get('oldTag') or '').strip()
-        new_tag_raw = str(payload.get('newTag') or '').strip()
-        tag_index = int(payload.get('tagIndex', -1))
-
-        old_tag = normalize_shared_deck_tag(old_tag_raw)
-        new_tag_parsed, new_comment = parse_shared_deck_tag_with_comment(new_tag_raw)
-        if not old_tag:
-            return jsonify({'error': 'oldTag is required'}), 400
-        if not new_tag_parsed:
-            return jsonify({'error': 'newTag is required'}), 400
-        if tag_index < 1:
-            return jsonify({'error': 'tagIndex must be >= 1 (cannot rename first tag)'}), 400
-        if old_tag == new_tag_parsed and not new_comment:
-            return jsonify({'error': 'New tag is the same as the old tag'}), 400
-
-        new_label = format_shared_deck_tag_display_label(new_tag_parsed, new_comment)
+            matching_decks = []
+            for row in all_rows:
+                deck_id = row[0]
+                raw_tags = row[2]
+                tags, _ = extract_shared_deck_tags_and_labels(raw_tags)
+                if tag_index < len(tags) and tags[tag_index] == old_tag:
+                    matching_decks.append((deck_id, row[1], raw_tags, tags))
+
+            if not matching_decks:
+                return jsonify({'error': f'No decks found with tag "{old_tag}" at position {tag_index}'}), 404
+
+            # Check for name conflicts before making any changes
+            for deck_id, current_name, raw_tags, tags in matching_decks:
+                new_tags = list(tags)
+                new_tags[tag_index] = new_tag_parsed
+                new_name = '_'.join(new_tags)
+                if new_name != current_name:
+                    conflict = conn.execute(
+                        "SELECT deck_id FROM deck WHERE name = ? AND deck_id <> ? LIMIT 1",
+                        [new_name, deck_id],
+                    ).fetchone()
+                    if conflict:
+                        return jsonify({
+                            'error': f'Renaming would create duplicate deck name "{new_name}"',
+                        }), 409
 
-        with _SHARED_DECK_MUTATION_LOCK:
-            conn = None
+            # Apply all renames in a single transaction
+            conn.execute("BEGIN TRANSACTION")
             try:
-                conn = get_shared_decks_connection()
-                all_rows = conn.execute(
-                    "SELECT deck_id, name, tags, creator_family_id FROM deck WHERE creator_family_id = ?",
-                    [family_id_int],
-                ).fetchall()
-
-                matching_decks = []
-                for row in all_rows:
-                    deck_id = row[0]
-                    raw_tags = row[2]
-                    tags, _ = extract_shared_deck_tags_and_labels(raw_tags)
-                    if tag_index < len(tags) and tags[tag_index] == old_tag:
-                        matching_decks.append((deck_id, row[1], raw_tags, tags))
-
-                if not matching_decks:
-                    return jsonify({'error': f'No decks found with tag "{old_tag}" at position {tag_index}'}), 404
-
-                # Check for name conflicts before making any changes
+                updated_decks = []
                 for deck_id, current_name, raw_tags, tags in matching_decks:
                     new_tags = list(tags)
                     new_tags[tag_index] = new_tag_parsed
                     new_name = '_'.join(new_tags)
-                    if new_name != current_name:
-                        conflict = conn.execute(
-                            "SELECT deck_id FROM deck WHERE name = ? AND deck_id <> ? LIMIT 1",
-                            [new_name, deck_id],
-                        ).fetchone()
-                        if conflict:
-                            return jsonify({
-                                'error': f'Renaming would create duplicate deck name "{new_name}"',
-                            }), 409
-
-                # Apply all renames in a single transaction
-                conn.execute("BEGIN TRANSACTION")
-                try:
-                    updated_decks = []
-                    for deck_id, current_name, raw_tags, tags in matching_decks:
-                        new_tags = list(tags)
-                        new_tags[tag_index] = new_tag_parsed
-                        new_name = '_'.join(new_tags)
-
-                        storage_tags = list(raw_tags or [])
-                        if tag_index < len(storage_tags):
-                            storage_tags[tag_index] = new_label
-
-                        conn.execute(
-                            "UPDATE deck SET name = ?, tags = ? WHERE deck_id = ? AND creator_family_id = ?",
-                            [new_name, storage_tags, deck_id, family_id_int],
-                        )
-                        updated_decks.append({
-                            'deck_id': int(deck_id),
-                            'name': new_name,
-                            'tags': new_tags,
-                            'tag_labels': storage_tags,
-                        })
-                    conn.execute("COMMIT")
-                except Exception:
-                    conn.execute("ROLLBACK")
-                    raise
-            finally:
-                if conn is not None:
-                    conn.close()
 
-            # Sync each renamed deck to kid DBs
-            total_kid_updates = 0
-            total_deck_updates = 0
-            sync_failures = []
-            for deck_info in updated_decks:
-                result = sync_materialized_shared_deck_metadata_for_all_kids(
-                    deck_info['deck_id'],
-                    deck_info['name'],
-                    deck_info['tag_labels'],
-                )
-                total_kid_updates += result['updated_kid_count']
-                total_deck_updates += result['updated_deck_count']
-                sync_failures.extend(result['failures'])
+                    storage_tags = list(raw_tags or [])
+                    if tag_index < len(storage_tags):
+                        storage_tags[tag_index] = new_label
 
-        return jsonify({
-            'updated': True,
-            'renamed_deck_count': len(updated_decks),
-            'updated_kid_count': total_kid_updates,
-            'updated_deck_count': total_deck_updates,
-            'decks': updated_decks,
-            'sync_failures': sync_failures,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+                    conn.execute(
+                        "UPDATE deck SET name = ?, tags = ? WHERE deck_id = ? AND creator_family_id = ?",
+                        [new_name, storage_tags, deck_id, family_id_int],
+                    )
+                    updated_decks.append({
+                        'deck_id': int(deck_id),
+                        'name': new_name,
+                        'tags': new_tags,
+                        'tag_labels': storage_tags,
+                    })
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            if conn is not None:
+                conn.close()
+
+        # Sync each renamed deck to kid DBs
+        total_kid_updates = 0
+        total_deck_updates = 0
+        sync_failures = []
+        for deck_info in updated_decks:
+            result = sync_materialized_shared_deck_metadata_for_all_kids(
+                deck_info['deck_id'],
+                deck_info['name'],
+                deck_info['tag_labels'],
+            )
+            total_kid_updates += result['updated_kid_count']
+            total_deck_updates += result['updated_deck_count']
+            sync_failures.extend(result['failures'])
+
+    return jsonify({
+        'updated': True,
+        'renamed_deck_count': len(updated_decks),
+        'updated_kid_count': total_kid_updates,
+        'updated_deck_count': total_deck_updates,
+        'decks': updated_decks,
+        'sync_failures': sync_failures,
+    }), 200
 
 
 # ============================================================================
@@ -1319,180 +1277,165 @@ def rename_shared_deck_tag():
 @kids_bp.route('/shared-decks/<int:deck_id>/generator-definition', methods=['PUT'])
 def update_shared_deck_generator_definition(deck_id):
     """Update the stored Python generator code for one owned type-IV shared deck."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        family_id_int, err = resolve_family_id_int_or_error()
-        if err:
-            return err
-
-        payload = request.get_json(silent=True) or {}
-        generator_code = normalize_type_iv_generator_code(payload.get('generatorCode'))
-        preview_type4_generator(generator_code, sample_count=1)
-
-        with _SHARED_DECK_MUTATION_LOCK:
-            conn = None
-            try:
-                conn = get_shared_decks_connection()
-                deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
-                if not deck_row:
-                    return jsonify({'error': 'Deck not found'}), 404
-                behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
-                if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                    return jsonify({'error': 'Only type_iv decks support generator code updates'}), 400
-                existing_definition = get_shared_deck_generator_definition(conn, deck_id)
-                if not existing_definition:
-                    return jsonify({'error': 'Generator definition not found for this deck'}), 404
-                is_multichoice_only = normalize_type_iv_multichoice_only(
-                    payload.get('isMultichoiceOnly'),
-                    default=bool(existing_definition.get('is_multichoice_only')),
-                )
-                conn.execute(
-                    """
-                    UPDATE deck_generator_definition
-                    SET code = ?, is_multichoice_only = ?
-                    WHERE deck_id = ?
-                    """,
-                    [generator_code, bool(is_multichoice_only), deck_id],
-                )
-            finally:
-                if conn is not None:
-                    conn.close()
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    family_id_int, err = resolve_family_id_int_or_error()
+    if err:
+        return err
+
+    payload = request.get_json(silent=True) or {}
+    generator_code = normalize_type_iv_generator_code(payload.get('generatorCode'))
+    preview_type4_generator(generator_code, sample_count=1)
+
+    with _SHARED_DECK_MUTATION_LOCK:
+        conn = None
+        try:
+            conn = get_shared_decks_connection()
+            deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
+            if not deck_row:
+                return jsonify({'error': 'Deck not found'}), 404
+            behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
+            if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+                return jsonify({'error': 'Only type_iv decks support generator code updates'}), 400
+            existing_definition = get_shared_deck_generator_definition(conn, deck_id)
+            if not existing_definition:
+                return jsonify({'error': 'Generator definition not found for this deck'}), 404
+            is_multichoice_only = normalize_type_iv_multichoice_only(
+                payload.get('isMultichoiceOnly'),
+                default=bool(existing_definition.get('is_multichoice_only')),
+            )
+            conn.execute(
+                """
+                UPDATE deck_generator_definition
+                SET code = ?, is_multichoice_only = ?
+                WHERE deck_id = ?
+                """,
+                [generator_code, bool(is_multichoice_only), deck_id],
+            )
+        finally:
+            if conn is not None:
+                conn.close()
 
-        return jsonify({
-            'updated': True,
-            'deck_id': int(deck_id),
-            'generator_definition': {
-                'code': generator_code,
-                'is_multichoice_only': bool(is_multichoice_only),
-            },
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'updated': True,
+        'deck_id': int(deck_id),
+        'generator_definition': {
+            'code': generator_code,
+            'is_multichoice_only': bool(is_multichoice_only),
+        },
+    }), 200
 
 @kids_bp.route('/shared-decks/<int:deck_id>/print-problems', methods=['POST'])
 def generate_shared_deck_print_problems(deck_id):
     """Generate math problems from a type-IV deck generator for printable sheets."""
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    family_id_int, err = resolve_family_id_int_or_error()
+    if err:
+        return err
+
+    payload = request.get_json(silent=True) or {}
+    count = _safe_positive_int_or_none(payload.get('count'))
+    if count is None or count <= 0:
+        return jsonify({'error': 'count is required and must be a positive integer'}), 400
+    if count > 200:
+        return jsonify({'error': 'count must be at most 200'}), 400
+
+    seed_base = payload.get('seedBase')
+    if seed_base is None:
+        seed_base = int(time.time_ns() % 2_000_000_000)
+    else:
+        try:
+            seed_base = int(seed_base)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'seedBase must be an integer'}), 400
+
+    conn = None
     try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        family_id_int, err = resolve_family_id_int_or_error()
-        if err:
-            return err
+        conn = get_shared_decks_connection(read_only=True)
+        deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
+        if not deck_row:
+            return jsonify({'error': 'Deck not found'}), 404
+        behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
+        if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+            return jsonify({'error': 'Only type_iv decks support print problems'}), 400
+        definition = get_shared_deck_generator_definition(conn, deck_id)
+        if not definition or not definition.get('code'):
+            return jsonify({'error': 'Generator definition not found for this deck'}), 404
+    finally:
+        if conn is not None:
+            conn.close()
+
+    samples = run_type4_generator(
+        definition['code'],
+        sample_count=count,
+        seed_base=seed_base,
+    )
+    problems = []
+    for sample in samples:
+        problems.append({
+            'prompt': str(sample.get('prompt', '')),
+            'answer': str(sample.get('answer', '')),
+        })
+
+    return jsonify({
+        'deck_id': int(deck_id),
+        'problems': problems,
+        'seed_base': seed_base,
+    }), 200
 
-        payload = request.get_json(silent=True) or {}
-        count = _safe_positive_int_or_none(payload.get('count'))
-        if count is None or count <= 0:
-            return jsonify({'error': 'count is required and must be a positive integer'}), 400
-        if count > 200:
-            return jsonify({'error': 'count must be at most 200'}), 400
-
-        seed_base = payload.get('seedBase')
-        if seed_base is None:
-            seed_base = int(time.time_ns() % 2_000_000_000)
-        else:
-            try:
-                seed_base = int(seed_base)
-            except (TypeError, ValueError):
-                return jsonify({'error': 'seedBase must be an integer'}), 400
 
+@kids_bp.route('/shared-decks/<int:deck_id>/print-cell-design', methods=['PUT'])
+def update_shared_deck_print_cell_design(deck_id):
+    """Persist one shared type-IV deck cell design (super family only)."""
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    family_id_int, err = resolve_family_id_int_or_error()
+    if err:
+        return err
+
+    payload = request.get_json(silent=True) or {}
+    raw_cell_design = payload.get('cellDesign')
+    if raw_cell_design is None:
+        cell_design = None
+        design_json = None
+    else:
+        cell_design = normalize_type_iv_print_cell_design(raw_cell_design)
+        design_json = json.dumps(cell_design, ensure_ascii=False, separators=(',', ':'))
+
+    with _SHARED_DECK_MUTATION_LOCK:
         conn = None
         try:
-            conn = get_shared_decks_connection(read_only=True)
+            conn = get_shared_decks_connection()
             deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
             if not deck_row:
                 return jsonify({'error': 'Deck not found'}), 404
             behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
             if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                return jsonify({'error': 'Only type_iv decks support print problems'}), 400
-            definition = get_shared_deck_generator_definition(conn, deck_id)
-            if not definition or not definition.get('code'):
+                return jsonify({'error': 'Only type_iv decks support print cell design'}), 400
+            existing_definition = get_shared_deck_generator_definition(conn, deck_id)
+            if not existing_definition:
                 return jsonify({'error': 'Generator definition not found for this deck'}), 404
+            conn.execute(
+                """
+                UPDATE deck_generator_definition
+                SET print_cell_design_json = ?
+                WHERE deck_id = ?
+                """,
+                [design_json, deck_id],
+            )
         finally:
             if conn is not None:
                 conn.close()
 
-        samples = run_type4_generator(
-            definition['code'],
-            sample_count=count,
-            seed_base=seed_base,
-        )
-        problems = []
-        for sample in samples:
-            problems.append({
-                'prompt': str(sample.get('prompt', '')),
-                'answer': str(sample.get('answer', '')),
-            })
-
-        return jsonify({
-            'deck_id': int(deck_id),
-            'problems': problems,
-            'seed_base': seed_base,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-
-@kids_bp.route('/shared-decks/<int:deck_id>/print-cell-design', methods=['PUT'])
-def update_shared_deck_print_cell_design(deck_id):
-    """Persist one shared type-IV deck cell design (super family only)."""
-    try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        family_id_int, err = resolve_family_id_int_or_error()
-        if err:
-            return err
-
-        payload = request.get_json(silent=True) or {}
-        raw_cell_design = payload.get('cellDesign')
-        if raw_cell_design is None:
-            cell_design = None
-            design_json = None
-        else:
-            cell_design = normalize_type_iv_print_cell_design(raw_cell_design)
-            design_json = json.dumps(cell_design, ensure_ascii=False, separators=(',', ':'))
-
-        with _SHARED_DECK_MUTATION_LOCK:
-            conn = None
-            try:
-                conn = get_shared_decks_connection()
-                deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
-                if not deck_row:
-                    return jsonify({'error': 'Deck not found'}), 404
-                behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
-                if behavior_type != DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                    return jsonify({'error': 'Only type_iv decks support print cell design'}), 400
-                existing_definition = get_shared_deck_generator_definition(conn, deck_id)
-                if not existing_definition:
-                    return jsonify({'error': 'Generator definition not found for this deck'}), 404
-                conn.execute(
-                    """
-                    UPDATE deck_generator_definition
-                    SET print_cell_design_json = ?
-                    WHERE deck_id = ?
-                    """,
-                    [design_json, deck_id],
-                )
-            finally:
-                if conn is not None:
-                    conn.close()
-
-        return jsonify({
-            'updated': True,
-            'deck_id': int(deck_id),
-            'cell_design': cell_design,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'updated': True,
+        'deck_id': int(deck_id),
+        'cell_design': cell_design,
+    }), 200
 
 
 # ============================================================================
@@ -1636,102 +1579,113 @@ def delete_shared_deck_card(deck_id, card_id):
 @kids_bp.route('/shared-decks/<int:deck_id>/cards/replace', methods=['PUT'])
 def replace_shared_deck_cards(deck_id):
     """Replace all cards in one owned shared deck with a new set, using key-aware diff."""
+    auth_err = require_super_family()
+    if auth_err:
+        return auth_err
+    family_id_int, err = resolve_family_id_int_or_error()
+    if err:
+        return err
+
+    conn = None
     try:
-        auth_err = require_super_family()
-        if auth_err:
-            return auth_err
-        family_id_int, err = resolve_family_id_int_or_error()
-        if err:
-            return err
-
-        conn = None
-        try:
-            conn = get_shared_decks_connection()
-            deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
-            if not deck_row:
-                return jsonify({'error': 'Deck not found'}), 404
-            behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
-            if behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-                return jsonify({'error': 'type_iv decks are immutable and do not support card edits'}), 400
-
-            chinese_type_i = is_shared_deck_chinese_type_i(conn, deck_row[2])
-            chinese_back_content = (
-                get_shared_deck_chinese_back_content(conn, deck_row[2])
-                if chinese_type_i
-                else ''
-            )
-            payload = request.get_json(silent=True) or {}
-            new_cards = normalize_shared_deck_cards(payload.get('cards'), allow_empty_back=chinese_type_i)
+        conn = get_shared_decks_connection()
+        deck_row = get_shared_deck_owned_by_family(conn, deck_id, family_id_int)
+        if not deck_row:
+            return jsonify({'error': 'Deck not found'}), 404
+        behavior_type = get_shared_deck_behavior_type_from_raw_tags(conn, deck_row[2])
+        if behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+            return jsonify({'error': 'type_iv decks are immutable and do not support card edits'}), 400
+
+        chinese_type_i = is_shared_deck_chinese_type_i(conn, deck_row[2])
+        chinese_back_content = (
+            get_shared_deck_chinese_back_content(conn, deck_row[2])
+            if chinese_type_i
+            else ''
+        )
+        payload = request.get_json(silent=True) or {}
+        new_cards = normalize_shared_deck_cards(payload.get('cards'), allow_empty_back=chinese_type_i)
 
-            if chinese_type_i and chinese_back_content:
-                for card in new_cards:
-                    if not card['back']:
-                        card['back'] = build_chinese_auto_back_text(card['front'], chinese_back_content)
+        if chinese_type_i and chinese_back_content:
+            for card in new_cards:
+                if not card['back']:
+                    card['back'] = build_chinese_auto_back_text(card['front'], chinese_back_content)
 
-            new_cards = dedupe_shared_deck_cards_by_front(new_cards)
+        new_cards = dedupe_shared_deck_cards_by_front(new_cards)
 
-            existing_rows = conn.execute(
-                "SELECT id, front, back FROM cards WHERE deck_id = ? ORDER BY id ASC",
-                [deck_id]
-            ).fetchall()
+        existing_rows = conn.execute(
+            "SELECT id, front, back FROM cards WHERE deck_id = ? ORDER BY id ASC",
+            [deck_id]
+        ).fetchall()
 
-            old_by_front = {}
-            for row in existing_rows:
-                card_id = int(row[0])
-                front = str(row[1] or '')
-                back = str(row[2] or '')
-                old_by_front[front] = {'id': card_id, 'front': front, 'back': back}
+        old_by_front = {}
+        for row in existing_rows:
+            card_id = int(row[0])
+            front = str(row[1] or '')
+            back = str(row[2] or '')
+            old_by_front[front] = {'id': card_id, 'front': front, 'back': back}
 
-            added = 0
-            updated = 0
-            removed = 0
-            seen_fronts = set()
+        insert_rows = []
+        update_rows = []
+        seen_fronts = set()
 
-            for card in new_cards:
-                front = str(card.get('front') or '')
-                back = str(card.get('back') or '')
-                seen_fronts.add(front)
-                old = old_by_front.get(front)
-                if old is None:
-                    conn.execute(
+        for card in new_cards:
+            front = str(card.get('front') or '')
+            back = str(card.get('back') or '')
+            seen_fronts.add(front)
+            old = old_by_front.get(front)
+            if old is None:
+                insert_rows.append([deck_id, front, back])
+            elif old['back'] != back:
+                update_rows.append([back, old['id'], deck_id])
+
+        removed_ids = [
+            old['id'] for front, old in old_by_front.items()
+            if front not in seen_fronts
+        ]
+        added = len(insert_rows)
+        updated = len(update_rows)
+        removed = len(removed_ids)
+
+        # One transaction for the whole diff instead of one autocommit
+        # (and WAL flush) per changed card.
+        if insert_rows or update_rows or removed_ids:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                if insert_rows:
+                    conn.executemany(
                         "INSERT INTO cards (deck_id, front, back) VALUES (?, ?, ?)",
-                        [deck_id, front, back]
+                        insert_rows
                     )
-                    added += 1
-                elif old['back'] != back:
-                    conn.execute(
+                if update_rows:
+                    conn.executemany(
                         "UPDATE cards SET back = ? WHERE id = ? AND deck_id = ?",
-                        [back, old['id'], deck_id]
+                        update_rows
                     )
-                    updated += 1
-
-            for front, old in old_by_front.items():
-                if front not in seen_fronts:
+                if removed_ids:
                     conn.execute(
-                        "DELETE FROM cards WHERE id = ? AND deck_id = ?",
-                        [old['id'], deck_id]
+                        "DELETE FROM cards WHERE deck_id = ? AND id IN (SELECT UNNEST(?::INTEGER[]))",
+                        [deck_id, removed_ids]
                     )
-                    removed += 1
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
 
-            card_count = int(conn.execute(
-                "SELECT COUNT(*) FROM cards WHERE deck_id = ?",
-                [deck_id]
-            ).fetchone()[0] or 0)
-        finally:
-            if conn is not None:
-                conn.close()
+        card_count = int(conn.execute(
+            "SELECT COUNT(*) FROM cards WHERE deck_id = ?",
+            [deck_id]
+        ).fetchone()[0] or 0)
+    finally:
+        if conn is not None:
+            conn.close()
 
-        return jsonify({
-            'deck_id': int(deck_id),
-            'added': added,
-            'updated': updated,
-            'removed': removed,
-            'card_count': card_count,
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'deck_id': int(deck_id),
+        'added': added,
+        'updated': updated,
+        'removed': removed,
+        'card_count': card_count,
+    }), 200
 
 
 # ============================================================================
@@ -11,6 +11,7 @@ Layout (search for `# === N. ` banner markers to jump between sections):
                                  /kids/<id>/type2/chinese-print-sheets[...]
 """
 from src.routes.kids import (
+    Response,
     build_shared_type1_prompt_audio_file_name,
     build_shared_writing_audio_file_name,
     build_writing_front_tts_text,
@@ -24,27 +25,35 @@ from src.routes.kids import (
     get_shared_type2_cards,
     get_shared_writing_audio_dir,
     json,
+    json_array_stream_response,
     jsonify,
     kids_bp,
     mimetypes,
     normalize_shared_deck_tag,
     normalize_writing_audio_text,
+    orjson,
     os,
     request,
     send_from_directory,
     split_type2_bulk_rows,
     synthesize_shared_writing_audio,
 )
-from src.services.card_stats import delete_card_from_deck_internal
+from src.services.card_stats import (
+    card_has_practice_history,
+    delete_card_from_deck_internal,
+)
 from src.services.family_auth import get_kid_connection_for, get_kid_for_family
-from src.services.kid_card_queries import get_kid_card_fronts_for_deck_ids
+from src.services.kid_card_queries import (
+    get_kid_card_fronts_for_deck_ids,
+    insert_kid_cards_for_deck,
+)
 from src.services.kid_category_resolve import (
     resolve_kid_type_i_chinese_category_key,
     resolve_kid_type_ii_category_with_mode,
 )
 from src.services.writing_candidates import (
     get_pending_writing_card_ids,
-    get_writing_candidate_card_ids,
+    get_writing_candidate_rows,
     remove_cards_from_type2_chinese_print_sheets,
 )
 
@@ -61,287 +70,277 @@ def get_writing_cards(kid_id):
 @kids_bp.route('/kids/<kid_id>/type2/cards', methods=['POST'])
 def add_writing_cards(kid_id):
     """Add one type-II orphan card from provided prompt/answer text."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        payload = request.get_json(silent=True) or {}
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
-            kid,
-            payload.get('categoryKey') or request.args.get('categoryKey'),
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    payload = request.get_json(silent=True) or {}
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        payload.get('categoryKey') or request.args.get('categoryKey'),
+    )
+    if has_chinese_specific_logic:
+        answer_text = (
+            payload.get('characters')
+            or payload.get('text')
+            or request.form.get('characters')
+            or request.form.get('text')
+            or ''
         )
-        if has_chinese_specific_logic:
-            answer_text = (
-                payload.get('characters')
-                or payload.get('text')
-                or request.form.get('characters')
-                or request.form.get('text')
-                or ''
-            )
-            answer_text = str(answer_text).strip()
-            if len(answer_text) == 0:
-                return jsonify({'error': 'Please provide answer text'}), 400
-            card_front = answer_text
-            card_back = answer_text
-        else:
-            front_text = (
-                payload.get('front')
-                or payload.get('text')
-                or request.form.get('front')
-                or request.form.get('text')
-                or ''
-            )
-            back_text = (
-                payload.get('back')
-                or request.form.get('back')
-                or ''
-            )
-            front_text = str(front_text).strip()
-            back_text = str(back_text).strip() or front_text
-            if len(front_text) == 0:
-                return jsonify({'error': 'Please provide card front text'}), 400
-            card_front = front_text
-            card_back = back_text
-
-        conn = get_kid_connection_for(kid)
-        deck_id = get_or_create_category_orphan_deck(conn, category_key)
-
-        source_decks = get_shared_merged_source_decks_for_kid(
-            conn,
-            kid,
-            category_key,
+        answer_text = str(answer_text).strip()
+        if len(answer_text) == 0:
+            return jsonify({'error': 'Please provide answer text'}), 400
+        card_front = answer_text
+        card_back = answer_text
+    else:
+        front_text = (
+            payload.get('front')
+            or payload.get('text')
+            or request.form.get('front')
+            or request.form.get('text')
+            or ''
         )
-        source_deck_ids = [int(src['local_deck_id']) for src in source_decks]
-        existing_fronts = {
-            str(value or '').strip()
-            for value in get_kid_card_fronts_for_deck_ids(conn, source_deck_ids)
-        }
-        if str(card_front or '').strip() in existing_fronts:
-            conn.close()
-            return jsonify({
-                'error': (
-                    'This Chinese writing answer already exists in the card bank'
-                    if has_chinese_specific_logic
-                    else 'This type-II answer already exists in the card bank'
-                )
-            }), 400
-
-        row = conn.execute(
-            """
-            INSERT INTO cards (deck_id, front, back)
-            VALUES (?, ?, ?)
-            RETURNING id, deck_id, front, back, created_at
-            """,
-            [deck_id, card_front, card_back]
-        ).fetchone()
-
-        conn.close()
-        audio_meta = build_writing_prompt_audio_payload(
-            kid_id,
-            row[2],
-            row[3],
-            category_key=category_key,
+        back_text = (
+            payload.get('back')
+            or request.form.get('back')
+            or ''
         )
+        front_text = str(front_text).strip()
+        back_text = str(back_text).strip() or front_text
+        if len(front_text) == 0:
+            return jsonify({'error': 'Please provide card front text'}), 400
+        card_front = front_text
+        card_back = back_text
+
+    conn = get_kid_connection_for(kid)
+    deck_id = get_or_create_category_orphan_deck(conn, category_key)
+
+    source_decks = get_shared_merged_source_decks_for_kid(
+        conn,
+        kid,
+        category_key,
+    )
+    source_deck_ids = [int(src['local_deck_id']) for src in source_decks]
+    existing_fronts = {
+        str(value or '').strip()
+        for value in get_kid_card_fronts_for_deck_ids(conn, source_deck_ids, fronts=[card_front])
+    }
+    if str(card_front or '').strip() in existing_fronts:
+        conn.close()
         return jsonify({
-            'category_key': category_key,
-            'deck_id': deck_id,
-            'inserted_count': 1,
-            'cards': [{
-                'id': row[0],
-                'deck_id': row[1],
-                'front': row[2],
-                'back': row[3],
-                'created_at': row[4].isoformat() if row[4] else None,
-                'audio_file_name': audio_meta['audio_file_name'],
-                'audio_mime_type': audio_meta['audio_mime_type'],
-                'audio_url': audio_meta['audio_url'],
-                'prompt_audio_url': audio_meta['prompt_audio_url'],
-            }]
-        }), 201
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            'error': (
+                'This Chinese writing answer already exists in the card bank'
+                if has_chinese_specific_logic
+                else 'This type-II answer already exists in the card bank'
+            )
+        }), 400
+
+    row = conn.execute(
+        """
+        INSERT INTO cards (deck_id, front, back)
+        VALUES (?, ?, ?)
+        RETURNING id, deck_id, front, back, created_at
+        """,
+        [deck_id, card_front, card_back]
+    ).fetchone()
+
+    conn.close()
+    audio_meta = build_writing_prompt_audio_payload(
+        kid_id,
+        row[2],
+        row[3],
+        category_key=category_key,
+    )
+    return jsonify({
+        'category_key': category_key,
+        'deck_id': deck_id,
+        'inserted_count': 1,
+        'cards': [{
+            'id': row[0],
+            'deck_id': row[1],
+            'front': row[2],
+            'back': row[3],
+            'created_at': row[4].isoformat() if row[4] else None,
+            'audio_file_name': audio_meta['audio_file_name'],
+            'audio_mime_type': audio_meta['audio_mime_type'],
+            'audio_url': audio_meta['audio_url'],
+            'prompt_audio_url': audio_meta['prompt_audio_url'],
+        }]
+    }), 201
 
 
 @kids_bp.route('/kids/<kid_id>/type2/cards/<card_id>', methods=['PUT'])
 def update_writing_card(kid_id, card_id):
     """Update one type-II card back text (the voice prompt / clue)."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        data = request.get_json(silent=True) or {}
-        category_key, _has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
-            kid,
-            data.get('categoryKey') or request.args.get('categoryKey'),
-        )
-        next_back = str(data.get('back') or '').strip()
-        if not next_back:
-            return jsonify({'error': 'back is required'}), 400
-
-        conn = get_kid_connection_for(kid)
-        source_decks = get_shared_merged_source_decks_for_kid(
-            conn,
-            kid,
-            category_key,
-        )
-        source_deck_ids = [int(src['local_deck_id']) for src in source_decks]
-        if len(source_deck_ids) == 0:
-            conn.close()
-            return jsonify({'error': 'Writing card not found'}), 404
-        placeholders = ','.join(['?'] * len(source_deck_ids))
-        row = conn.execute(
-            f"""
-            SELECT id, deck_id, front, back, COALESCE(skip_practice, FALSE), created_at
-            FROM cards
-            WHERE id = ? AND deck_id IN ({placeholders})
-            LIMIT 1
-            """,
-            [card_id, *source_deck_ids]
-        ).fetchone()
-        if not row:
-            conn.close()
-            return jsonify({'error': 'Writing card not found'}), 404
-
-        card_front = str(row[2] or '')
-        old_back = str(row[3] or '')
-        if old_back != next_back:
-            conn.execute(
-                "UPDATE cards SET back = ?, thumb_down_count = 0 WHERE id = ?",
-                [next_back, row[0]]
-            )
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    data = request.get_json(silent=True) or {}
+    category_key, _has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        data.get('categoryKey') or request.args.get('categoryKey'),
+    )
+    next_back = str(data.get('back') or '').strip()
+    if not next_back:
+        return jsonify({'error': 'back is required'}), 400
+
+    conn = get_kid_connection_for(kid)
+    source_decks = get_shared_merged_source_decks_for_kid(
+        conn,
+        kid,
+        category_key,
+    )
+    source_deck_ids = [int(src['local_deck_id']) for src in source_decks]
+    if len(source_deck_ids) == 0:
         conn.close()
-
-        old_file_name = build_shared_writing_audio_file_name(card_front, old_back)
-        new_audio_meta = build_writing_prompt_audio_payload(
-            kid_id,
-            card_front,
-            next_back,
-            category_key=category_key,
+        return jsonify({'error': 'Writing card not found'}), 404
+    placeholders = ','.join(['?'] * len(source_deck_ids))
+    row = conn.execute(
+        f"""
+        SELECT id, deck_id, front, back, COALESCE(skip_practice, FALSE), created_at
+        FROM cards
+        WHERE id = ? AND deck_id IN ({placeholders})
+        LIMIT 1
+        """,
+        [card_id, *source_deck_ids]
+    ).fetchone()
+    if not row:
+        conn.close()
+        return jsonify({'error': 'Writing card not found'}), 404
+
+    card_front = str(row[2] or '')
+    old_back = str(row[3] or '')
+    if old_back != next_back:
+        conn.execute(
+            "UPDATE cards SET back = ?, thumb_down_count = 0 WHERE id = ?",
+            [next_back, row[0]]
         )
-        new_file_name = new_audio_meta.get('audio_file_name') or ''
-        if old_file_name and old_file_name != new_file_name:
-            old_audio_path = os.path.join(get_shared_writing_audio_dir(), old_file_name)
-            if os.path.exists(old_audio_path):
-                try:
-                    os.remove(old_audio_path)
-                except OSError:
-                    pass
+    conn.close()
+
+    old_file_name = build_shared_writing_audio_file_name(card_front, old_back)
+    new_audio_meta = build_writing_prompt_audio_payload(
+        kid_id,
+        card_front,
+        next_back,
+        category_key=category_key,
+    )
+    new_file_name = new_audio_meta.get('audio_file_name') or ''
+    if old_file_name and old_file_name != new_file_name:
+        old_audio_path = os.path.join(get_shared_writing_audio_dir(), old_file_name)
+        if os.path.exists(old_audio_path):
+            try:
+                os.remove(old_audio_path)
+            except OSError:
+                pass
 
-        return jsonify({
-            'category_key': category_key,
-            'id': int(row[0]),
-            'deck_id': int(row[1]),
-            'front': card_front,
-            'back': next_back,
-            'skip_practice': bool(row[4]),
-            'created_at': row[5].isoformat() if row[5] else None,
-            'audio_file_name': new_audio_meta.get('audio_file_name'),
-            'audio_mime_type': new_audio_meta.get('audio_mime_type'),
-            'audio_url': new_audio_meta.get('audio_url'),
-            'prompt_audio_url': new_audio_meta.get('prompt_audio_url'),
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({
+        'category_key': category_key,
+        'id': int(row[0]),
+        'deck_id': int(row[1]),
+        'front': card_front,
+        'back': next_back,
+        'skip_practice': bool(row[4]),
+        'created_at': row[5].isoformat() if row[5] else None,
+        'audio_file_name': new_audio_meta.get('audio_file_name'),
+        'audio_mime_type': new_audio_meta.get('audio_mime_type'),
+        'audio_url': new_audio_meta.get('audio_url'),
+        'prompt_audio_url': new_audio_meta.get('prompt_audio_url'),
+    }), 200
 
 
 @kids_bp.route('/kids/<kid_id>/type2/cards/bulk', methods=['POST'])
 def add_writing_cards_bulk(kid_id):
     """Bulk-add type-II orphan cards."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        payload = request.get_json() or {}
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
-            kid,
-            payload.get('categoryKey') or request.args.get('categoryKey'),
-        )
-        raw_text = payload.get('text', '')
-        rows_to_insert = split_type2_bulk_rows(raw_text, has_chinese_specific_logic)
-        if len(rows_to_insert) == 0:
-            return jsonify({
-                'error': (
-                    'Please paste at least one Chinese word/phrase'
-                    if has_chinese_specific_logic
-                    else 'Please paste at least one non-empty line'
-                )
-            }), 400
-
-        conn = get_kid_connection_for(kid)
-        deck_id = get_or_create_category_orphan_deck(conn, category_key)
-        source_decks = get_shared_merged_source_decks_for_kid(
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    payload = request.get_json() or {}
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        payload.get('categoryKey') or request.args.get('categoryKey'),
+    )
+    raw_text = payload.get('text', '')
+    rows_to_insert = split_type2_bulk_rows(raw_text, has_chinese_specific_logic)
+    if len(rows_to_insert) == 0:
+        return jsonify({
+            'error': (
+                'Please paste at least one Chinese word/phrase'
+                if has_chinese_specific_logic
+                else 'Please paste at least one non-empty line'
+            )
+        }), 400
+
+    conn = get_kid_connection_for(kid)
+    deck_id = get_or_create_category_orphan_deck(conn, category_key)
+    source_decks = get_shared_merged_source_decks_for_kid(
+        conn,
+        kid,
+        category_key,
+    )
+    source_deck_ids = [int(src['local_deck_id']) for src in source_decks]
+    existing_fronts = {
+        str(value or '').strip()
+        for value in get_kid_card_fronts_for_deck_ids(
             conn,
-            kid,
-            category_key,
+            source_deck_ids,
+            fronts=[front_text for front_text, _ in rows_to_insert],
         )
-        source_deck_ids = [int(src['local_deck_id']) for src in source_decks]
-        existing_fronts = {
-            str(value or '').strip()
-            for value in get_kid_card_fronts_for_deck_ids(conn, source_deck_ids)
-        }
-
-        created = []
-        skipped_existing = 0
-        skipped_existing_cards = []
-        for front_text, back_text in rows_to_insert:
-            front_value = str(front_text or '').strip()
-            if not front_value:
-                continue
-            if front_value in existing_fronts:
-                skipped_existing += 1
-                skipped_existing_cards.append(
-                    format_type2_bulk_card_text(front_text, back_text, has_chinese_specific_logic)
-                )
-                continue
-
-            row = conn.execute(
-                """
-                INSERT INTO cards (deck_id, front, back)
-                VALUES (?, ?, ?)
-                RETURNING id, deck_id, front, back, created_at
-                """,
-                [deck_id, front_text, back_text]
-            ).fetchone()
-            existing_fronts.add(front_value)
-            audio_meta = build_writing_prompt_audio_payload(
-                kid_id,
-                front_text,
-                back_text,
-                category_key=category_key,
+    }
+
+    insert_rows = []
+    skipped_existing = 0
+    skipped_existing_cards = []
+    for front_text, back_text in rows_to_insert:
+        front_value = str(front_text or '').strip()
+        if not front_value:
+            continue
+        if front_value in existing_fronts:
+            skipped_existing += 1
+            skipped_existing_cards.append(
+                format_type2_bulk_card_text(front_text, back_text, has_chinese_specific_logic)
             )
-            created.append({
-                'id': int(row[0]),
-                'deck_id': int(row[1]),
-                'front': row[2],
-                'back': row[3],
-                'created_at': row[4].isoformat() if row[4] else None,
-                'audio_file_name': audio_meta['audio_file_name'],
-                'audio_mime_type': audio_meta['audio_mime_type'],
-                'audio_url': audio_meta['audio_url'],
-                'prompt_audio_url': audio_meta['prompt_audio_url'],
-            })
+            continue
+        existing_fronts.add(front_value)
+        insert_rows.append((front_text, back_text))
 
+    try:
+        created_rows = insert_kid_cards_for_deck(conn, deck_id, insert_rows)
+    except Exception:
         conn.close()
-        return jsonify({
-            'category_key': category_key,
-            'deck_id': deck_id,
-            'input_token_count': len(rows_to_insert),
-            'inserted_count': len(created),
-            'skipped_existing_count': skipped_existing,
-            'skipped_existing_cards': skipped_existing_cards,
-            'cards': created
-        }), 201
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        raise
+
+    created = []
+    for row in created_rows:
+        audio_meta = build_writing_prompt_audio_payload(
+            kid_id,
+            row[2],
+            row[3],
+            category_key=category_key,
+        )
+        created.append({
+            'id': int(row[0]),
+            'deck_id': int(row[1]),
+            'front': row[2],
+            'back': row[3],
+            'created_at': row[4].isoformat() if row[4] else None,
+            'audio_file_name': audio_meta['audio_file_name'],
+            'audio_mime_type': audio_meta['audio_mime_type'],
+            'audio_url': audio_meta['audio_url'],
+            'prompt_audio_url': audio_meta['prompt_audio_url'],
+        })
+
+    conn.close()
+    return jsonify({
+        'category_key': category_key,
+        'deck_id': deck_id,
+        'input_token_count': len(rows_to_insert),
+        'inserted_count': len(created),
+        'skipped_existing_count': skipped_existing,
+        'skipped_existing_cards': skipped_existing_cards,
+        'cards': created
+    }), 201
 
 
 # ============================================================================
@@ -351,147 +350,137 @@ def add_writing_cards_bulk(kid_id):
 @kids_bp.route('/kids/<kid_id>/type2/audio/<path:file_name>', methods=['GET'])
 def get_writing_audio(kid_id, file_name):
     """Serve type-II prompt audio file for a kid."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        request.args.get('categoryKey'),
+    )
+    if file_name != os.path.basename(file_name):
+        return jsonify({'error': 'Invalid file name'}), 400
+
+    conn = get_kid_connection_for(kid, read_only=True)
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
-            kid,
-            request.args.get('categoryKey'),
+        # Keep this endpoint read-only. Do not create orphan decks while serving audio.
+        materialized_by_local_id = get_kid_materialized_shared_decks_by_first_tag(
+            conn, normalize_shared_deck_tag(category_key)
         )
-        if file_name != os.path.basename(file_name):
-            return jsonify({'error': 'Invalid file name'}), 400
-
-        conn = get_kid_connection_for(kid, read_only=True)
-        try:
-            # Keep this endpoint read-only. Do not create orphan decks while serving audio.
-            materialized_by_local_id = get_kid_materialized_shared_decks_by_first_tag(
-                conn, normalize_shared_deck_tag(category_key)
-            )
-            source_deck_ids = [
-                int(entry['local_deck_id'])
-                for entry in materialized_by_local_id.values()
-                if int(entry.get('local_deck_id') or 0) > 0
-            ]
-            include_orphan = get_category_include_orphan_for_kid(kid, category_key)
-            if include_orphan:
-                orphan_deck_name = get_category_orphan_deck_name(category_key)
-                orphan_row = conn.execute(
-                    "SELECT id FROM decks WHERE name = ? LIMIT 1",
-                    [orphan_deck_name],
-                ).fetchone()
-                if orphan_row and int(orphan_row[0] or 0) > 0:
-                    source_deck_ids.append(int(orphan_row[0]))
-
-            source_deck_ids = sorted(set(source_deck_ids))
-            if not source_deck_ids:
-                return jsonify({'error': 'Audio file not found'}), 404
-            placeholders = ','.join(['?'] * len(source_deck_ids))
-            rows = conn.execute(
-                f"SELECT front, back FROM cards WHERE deck_id IN ({placeholders})",
-                source_deck_ids
-            ).fetchall()
-        finally:
-            conn.close()
-
-        spoken_by_file_name = {}
-        for row in rows:
-            front_text = normalize_writing_audio_text(row[0])
-            back_text = normalize_writing_audio_text(row[1])
-            card_file = build_shared_writing_audio_file_name(front_text, back_text)
-            if card_file and card_file not in spoken_by_file_name:
-                spoken_by_file_name[card_file] = build_writing_front_tts_text(front_text, back_text)
+        source_deck_ids = [
+            int(entry['local_deck_id'])
+            for entry in materialized_by_local_id.values()
+            if int(entry.get('local_deck_id') or 0) > 0
+        ]
+        include_orphan = get_category_include_orphan_for_kid(kid, category_key)
+        if include_orphan:
+            orphan_deck_name = get_category_orphan_deck_name(category_key)
+            orphan_row = conn.execute(
+                "SELECT id FROM decks WHERE name = ? LIMIT 1",
+                [orphan_deck_name],
+            ).fetchone()
+            if orphan_row and int(orphan_row[0] or 0) > 0:
+                source_deck_ids.append(int(orphan_row[0]))
 
-        spoken_text = spoken_by_file_name.get(file_name)
-        if not spoken_text:
+        source_deck_ids = sorted(set(source_deck_ids))
+        if not source_deck_ids:
             return jsonify({'error': 'Audio file not found'}), 404
+        placeholders = ','.join(['?'] * len(source_deck_ids))
+        rows = conn.execute(
+            f"SELECT front, back FROM cards WHERE deck_id IN ({placeholders})",
+            source_deck_ids
+        ).fetchall()
+    finally:
+        conn.close()
 
-        audio_dir = get_shared_writing_audio_dir()
-        audio_path = os.path.join(audio_dir, file_name)
+    spoken_by_file_name = {}
+    for row in rows:
+        front_text = normalize_writing_audio_text(row[0])
+        back_text = normalize_writing_audio_text(row[1])
+        card_file = build_shared_writing_audio_file_name(front_text, back_text)
+        if card_file and card_file not in spoken_by_file_name:
+            spoken_by_file_name[card_file] = build_writing_front_tts_text(front_text, back_text)
+
+    spoken_text = spoken_by_file_name.get(file_name)
+    if not spoken_text:
+        return jsonify({'error': 'Audio file not found'}), 404
+
+    audio_dir = get_shared_writing_audio_dir()
+    audio_path = os.path.join(audio_dir, file_name)
+    if not os.path.exists(audio_path):
+        synthesize_shared_writing_audio(
+            file_name,
+            spoken_text,
+            has_chinese_specific_logic=has_chinese_specific_logic,
+        )
         if not os.path.exists(audio_path):
-            synthesize_shared_writing_audio(
-                file_name,
-                spoken_text,
-                has_chinese_specific_logic=has_chinese_specific_logic,
-            )
-            if not os.path.exists(audio_path):
-                return jsonify({'error': 'Audio file not found'}), 404
+            return jsonify({'error': 'Audio file not found'}), 404
 
-        mime_type = mimetypes.guess_type(file_name)[0] or 'audio/mpeg'
-        return send_from_directory(audio_dir, file_name, as_attachment=False, mimetype=mime_type)
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    mime_type = mimetypes.guess_type(file_name)[0] or 'audio/mpeg'
+    return send_from_directory(audio_dir, file_name, as_attachment=False, mimetype=mime_type)
 
 
 @kids_bp.route('/kids/<kid_id>/cards/audio/<path:file_name>', methods=['GET'])
 def get_type1_chinese_prompt_audio(kid_id, file_name):
     """Serve type-I Chinese multiple-choice prompt audio for a kid."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    category_key = resolve_kid_type_i_chinese_category_key(
+        kid,
+        request.args.get('categoryKey'),
+        allow_default=False,
+    )
+    if file_name != os.path.basename(file_name):
+        return jsonify({'error': 'Invalid file name'}), 400
+
+    conn = get_kid_connection_for(kid, read_only=True)
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        category_key = resolve_kid_type_i_chinese_category_key(
+        sources = get_shared_merged_source_decks_for_kid(
+            conn,
             kid,
-            request.args.get('categoryKey'),
-            allow_default=False,
+            category_key,
         )
-        if file_name != os.path.basename(file_name):
-            return jsonify({'error': 'Invalid file name'}), 400
-
-        conn = get_kid_connection_for(kid, read_only=True)
-        try:
-            sources = get_shared_merged_source_decks_for_kid(
-                conn,
-                kid,
-                category_key,
-            )
-            source_deck_ids = [
-                int(source['local_deck_id'])
-                for source in sources
-                if int(source.get('local_deck_id') or 0) > 0
-            ]
-            if not source_deck_ids:
-                return jsonify({'error': 'Audio file not found'}), 404
-            placeholders = ','.join(['?'] * len(source_deck_ids))
-            rows = conn.execute(
-                f"SELECT front FROM cards WHERE deck_id IN ({placeholders})",
-                source_deck_ids,
-            ).fetchall()
-        finally:
-            conn.close()
-
-        spoken_by_file_name = {}
-        for row in rows:
-            front_text = normalize_writing_audio_text(row[0])
-            front_file = build_shared_type1_prompt_audio_file_name(front_text)
-            if front_file and front_file not in spoken_by_file_name:
-                spoken_by_file_name[front_file] = front_text
-
-        spoken_text = spoken_by_file_name.get(file_name)
-        if not spoken_text:
+        source_deck_ids = [
+            int(source['local_deck_id'])
+            for source in sources
+            if int(source.get('local_deck_id') or 0) > 0
+        ]
+        if not source_deck_ids:
             return jsonify({'error': 'Audio file not found'}), 404
+        placeholders = ','.join(['?'] * len(source_deck_ids))
+        rows = conn.execute(
+            f"SELECT front FROM cards WHERE deck_id IN ({placeholders})",
+            source_deck_ids,
+        ).fetchall()
+    finally:
+        conn.close()
 
-        audio_dir = get_shared_writing_audio_dir()
-        audio_path = os.path.join(audio_dir, file_name)
+    spoken_by_file_name = {}
+    for row in rows:
+        front_text = normalize_writing_audio_text(row[0])
+        front_file = build_shared_type1_prompt_audio_file_name(front_text)
+        if front_file and front_file not in spoken_by_file_name:
+            spoken_by_file_name[front_file] = front_text
+
+    spoken_text = spoken_by_file_name.get(file_name)
+    if not spoken_text:
+        return jsonify({'error': 'Audio file not found'}), 404
+
+    audio_dir = get_shared_writing_audio_dir()
+    audio_path = os.path.join(audio_dir, file_name)
+    if not os.path.exists(audio_path):
+        synthesize_shared_writing_audio(
+            file_name,
+            spoken_text,
+            has_chinese_specific_logic=True,
+        )
         if not os.path.exists(audio_path):
-            synthesize_shared_writing_audio(
-                file_name,
-                spoken_text,
-                has_chinese_specific_logic=True,
-            )
-            if not os.path.exists(audio_path):
-                return jsonify({'error': 'Audio file not found'}), 404
+            return jsonify({'error': 'Audio file not found'}), 404
 
-        mime_type = mimetypes.guess_type(file_name)[0] or 'audio/mpeg'
-        return send_from_directory(audio_dir, file_name, as_attachment=False, mimetype=mime_type)
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    mime_type = mimetypes.guess_type(file_name)[0] or 'audio/mpeg'
+    return send_from_directory(audio_dir, file_name, as_attachment=False, mimetype=mime_type)
 
 
 # --- delete_writing_card sits between "audio" and "chinese-print-sheets" ---
@@ -499,366 +488,358 @@ def get_type1_chinese_prompt_audio(kid_id, file_name):
 @kids_bp.route('/kids/<kid_id>/type2/cards/<card_id>', methods=['DELETE'])
 def delete_writing_card(kid_id, card_id):
     """Delete a type-II orphan card and remove its shared generated clip."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        request.args.get('categoryKey'),
+    )
+    conn = get_kid_connection_for(kid)
+    deck_id = get_or_create_category_orphan_deck(conn, category_key)
+
+    row = conn.execute(
+        """
+        SELECT c.id, c.front, c.back
+        FROM cards c
+        WHERE c.id = ? AND c.deck_id = ?
+        """,
+        [card_id, deck_id]
+    ).fetchone()
+    if not row:
+        conn.close()
+        return jsonify({'error': 'Writing card not found'}), 404
 
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
-            kid,
-            request.args.get('categoryKey'),
-        )
-        conn = get_kid_connection_for(kid)
-        deck_id = get_or_create_category_orphan_deck(conn, category_key)
-
-        row = conn.execute(
-            """
-            SELECT c.id, c.front, c.back
-            FROM cards c
-            WHERE c.id = ? AND c.deck_id = ?
-            """,
-            [card_id, deck_id]
-        ).fetchone()
-        if not row:
-            conn.close()
-            return jsonify({'error': 'Writing card not found'}), 404
+    if card_has_practice_history(conn, card_id):
+        conn.close()
+        return jsonify({'error': 'Cards with practice history cannot be deleted'}), 400
 
-        practiced_count = int(conn.execute(
-            "SELECT COUNT(*) FROM session_results WHERE card_id = ?",
-            [card_id]
-        ).fetchone()[0] or 0)
-        if practiced_count > 0:
-            conn.close()
-            return jsonify({'error': 'Cards with practice history cannot be deleted'}), 400
+    remove_cards_from_type2_chinese_print_sheets(conn, [card_id])
+    delete_card_from_deck_internal(conn, card_id)
+    conn.close()
 
-        remove_cards_from_type2_chinese_print_sheets(conn, [card_id])
-        delete_card_from_deck_internal(conn, card_id)
-        conn.close()
+    clip_name = build_shared_writing_audio_file_name(row[1], row[2])
+    clip_names = {clip_name} if clip_name else set()
+    for file_name in clip_names:
+        audio_path = os.path.join(get_shared_writing_audio_dir(), file_name)
+        if os.path.exists(audio_path):
+            try:
+                os.remove(audio_path)
+            except OSError:
+                pass
 
-        clip_name = build_shared_writing_audio_file_name(row[1], row[2])
-        clip_names = {clip_name} if clip_name else set()
-        for file_name in clip_names:
-            audio_path = os.path.join(get_shared_writing_audio_dir(), file_name)
-            if os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                except OSError:
-                    pass
-
-        return jsonify({'message': 'Writing card deleted successfully'}), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'message': 'Writing card deleted successfully'}), 200
 
 # ============================================================================
 # 3. Chinese print-sheets — CRUD + complete/withdraw lifecycle
 # ============================================================================
 
+# The list view only needs paper size and per-row labels, so DuckDB pulls
+# them out of layout_json instead of Python parsing every full layout.
+# Malformed layouts yield NULLs rather than failing the whole list.
+_CHINESE_PRINT_SHEET_LIST_SQL = """
+SELECT
+  id,
+  category_key,
+  status,
+  created_at,
+  completed_at,
+  json_extract_string(layout, '$.paper_size') AS paper_size,
+  list_transform(
+    json_extract(layout, '$.rows[*]'),
+    r -> COALESCE(NULLIF(r->>'front', ''), r->>'back', '')
+  ) AS row_labels
+FROM (
+  SELECT *, CASE WHEN json_valid(layout_json) THEN layout_json END AS layout
+  FROM type2_chinese_print_sheets
+  WHERE category_key = ?
+)
+ORDER BY created_at DESC, id DESC
+"""
+
+_CHINESE_PRINT_SHEET_LIST_FETCH_BATCH_SIZE = 64
+
+# Every field the list payload is derived from goes into the digest, so a
+# create, complete, withdraw or layout rewrite (card deletion) changes the
+# ETag. DuckDB's hash is stable across processes.
+_CHINESE_PRINT_SHEET_LIST_ETAG_SQL = """
+SELECT COUNT(*), COALESCE(bit_xor(hash(id, category_key, status, created_at, completed_at, layout_json)), 0)
+FROM type2_chinese_print_sheets
+WHERE category_key = ?
+"""
+
+_CHINESE_PRINT_SHEET_DETAIL_SQL = """
+SELECT id, category_key, layout_json, status, created_at, completed_at
+FROM type2_chinese_print_sheets
+WHERE id = ?
+"""
+
+_CHINESE_PRINT_SHEET_INSERT_SQL = """
+INSERT INTO type2_chinese_print_sheets (category_key, layout_json, status)
+VALUES (?, ?, 'pending')
+RETURNING id
+"""
+
+_CHINESE_PRINT_SHEET_EXISTS_SQL = "SELECT 1 FROM type2_chinese_print_sheets WHERE id = ?"
+
+# Complete/withdraw guard on status inside the statement itself; an empty
+# RETURNING means "missing or already done", which the callers then
+# disambiguate with `_CHINESE_PRINT_SHEET_EXISTS_SQL`.
+_CHINESE_PRINT_SHEET_COMPLETE_SQL = """
+UPDATE type2_chinese_print_sheets
+SET status = 'done', completed_at = CURRENT_TIMESTAMP
+WHERE id = ? AND status != 'done'
+RETURNING id
+"""
+
+_CHINESE_PRINT_SHEET_DELETE_SQL = """
+DELETE FROM type2_chinese_print_sheets
+WHERE id = ? AND status != 'done'
+RETURNING id
+"""
+
+
+def _chinese_print_sheet_payload(sheet_id, category_key, status, created_at, completed_at):
+    """Build the sheet fields shared by the list and detail responses."""
+    return {
+        'id': sheet_id,
+        'category_key': category_key or '',
+        'status': status or 'pending',
+        'created_at': created_at.isoformat() if created_at else None,
+        'completed_at': completed_at.isoformat() if completed_at else None,
+    }
+
+
+def _chinese_print_sheet_row_to_payload(row):
+    """Map one `_CHINESE_PRINT_SHEET_DETAIL_SQL` row to (payload, parsed layout).
+
+    orjson parses strictly (no trailing commas, NaN or Infinity); anything it
+    rejects falls back to `{}`.
+    """
+    sheet_id, category_key, layout_json, status, created_at, completed_at = row
+    layout = {}
+    if layout_json:
+        try:
+            layout = orjson.loads(layout_json)
+        except orjson.JSONDecodeError:
+            pass
+    return _chinese_print_sheet_payload(sheet_id, category_key, status, created_at, completed_at), layout
+
+
 @kids_bp.route('/kids/<kid_id>/type2/chinese-print-sheets', methods=['POST'])
 def create_chinese_print_sheet(kid_id):
     """Persist one custom printable Chinese writing sheet."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    payload = request.get_json(silent=True) or {}
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        payload.get('categoryKey') or request.args.get('categoryKey'),
+    )
+    if not has_chinese_specific_logic:
+        return jsonify({'error': 'Practice sheets are only available for Chinese-specific type-II categories'}), 400
+
+    rows = payload.get('rows')
+    if not isinstance(rows, list) or len(rows) == 0:
+        return jsonify({'error': 'rows must be a non-empty array'}), 400
+
+    paper_size = str(payload.get('paperSize') or 'us-letter').strip().lower()
+    if paper_size not in ('us-letter', 'a4'):
+        paper_size = 'us-letter'
+
+    conn = None
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
+        conn = get_kid_connection_for(kid)
+        # Each row's cardId is validated once; the layout loop below reuses it.
+        if not all(isinstance(row, dict) for row in rows):
+            return jsonify({'error': 'rows must contain objects'}), 400
+        try:
+            row_card_ids = [int(row.get('cardId')) for row in rows]
+        except (TypeError, ValueError):
+            return jsonify({'error': 'rows must contain valid cardId values'}), 400
+        if min(row_card_ids) <= 0:
+            return jsonify({'error': 'rows must contain valid cardId values'}), 400
+        card_ids = list(dict.fromkeys(row_card_ids))
 
-        payload = request.get_json(silent=True) or {}
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        source_decks = get_shared_merged_source_decks_for_kid(
+            conn,
             kid,
-            payload.get('categoryKey') or request.args.get('categoryKey'),
+            category_key,
         )
-        if not has_chinese_specific_logic:
-            return jsonify({'error': 'Practice sheets are only available for Chinese-specific type-II categories'}), 400
-
-        rows = payload.get('rows')
-        if not isinstance(rows, list) or len(rows) == 0:
-            return jsonify({'error': 'rows must be a non-empty array'}), 400
-
-        paper_size = str(payload.get('paperSize') or 'us-letter').strip().lower()
-        if paper_size not in ('us-letter', 'a4'):
-            paper_size = 'us-letter'
-
-        conn = None
-        try:
-            conn = get_kid_connection_for(kid)
-            card_ids = []
-            for row in rows:
-                if not isinstance(row, dict):
-                    return jsonify({'error': 'rows must contain objects'}), 400
-                try:
-                    card_id = int(row.get('cardId'))
-                except (TypeError, ValueError):
-                    return jsonify({'error': 'rows must contain valid cardId values'}), 400
-                if card_id <= 0:
-                    return jsonify({'error': 'rows must contain valid cardId values'}), 400
-                if card_id not in card_ids:
-                    card_ids.append(card_id)
-
-            source_decks = get_shared_merged_source_decks_for_kid(
-                conn,
-                kid,
-                category_key,
-            )
-            bank_deck_ids = [
-                int(src['local_deck_id'])
-                for src in source_decks
-                if int(src.get('card_count') or 0) > 0
-            ]
-            if len(bank_deck_ids) == 0:
-                return jsonify({'error': 'No writing cards are available for this category'}), 409
-
-            pending_card_ids = get_pending_writing_card_ids(conn)
-            pending_card_set = set(pending_card_ids)
-            if any(card_id in pending_card_set for card_id in card_ids):
-                return jsonify({'error': 'Some selected cards are already practicing in another sheet'}), 409
-
-            candidate_card_set = set(get_writing_candidate_card_ids(
+        bank_deck_ids = [
+            int(src['local_deck_id'])
+            for src in source_decks
+            if int(src.get('card_count') or 0) > 0
+        ]
+        if len(bank_deck_ids) == 0:
+            return jsonify({'error': 'No writing cards are available for this category'}), 409
+
+        pending_card_ids = get_pending_writing_card_ids(conn)
+        if not set(pending_card_ids).isdisjoint(card_ids):
+            return jsonify({'error': 'Some selected cards are already practicing in another sheet'}), 409
+
+        # Candidate rows already carry front/back from the bank decks, so they
+        # double as the existence check for the selected cards.
+        candidate_cards_by_id = {
+            int(candidate_id): (front, back)
+            for candidate_id, front, back, _, _ in get_writing_candidate_rows(
                 conn,
                 bank_deck_ids,
                 category_key,
                 excluded_card_ids=pending_card_ids,
-            ))
-            if any(card_id not in candidate_card_set for card_id in card_ids):
-                return jsonify({'error': 'Some selected cards are no longer in the suggested card list'}), 409
-
-            deck_placeholders = ','.join(['?'] * len(bank_deck_ids))
-            card_placeholders = ','.join(['?'] * len(card_ids))
-            found = conn.execute(
-                f"""
-                SELECT id, front, back
-                FROM cards
-                WHERE deck_id IN ({deck_placeholders})
-                  AND id IN ({card_placeholders})
-                """,
-                [*bank_deck_ids, *card_ids],
-            ).fetchall()
-            found_map = {
-                int(row[0]): {'id': int(row[0]), 'front': row[1], 'back': row[2]}
-                for row in found
-            }
-            if len(found_map) != len(card_ids):
-                return jsonify({'error': 'Some selected cards are no longer available'}), 409
-
-            layout_rows = []
-            for row in rows:
-                card_id = int(row.get('cardId'))
-                card = found_map.get(card_id)
-                if not card:
-                    return jsonify({'error': f'Card {card_id} not found'}), 404
-                layout_rows.append({
-                    'card_id': card_id,
-                    'front': card['front'],
-                    'back': card['back'],
-                    'empty_count': max(1, min(9, int(row.get('emptyCount') or 1))),
-                    'scale': round(max(0.5, min(2.0, float(row.get('scale') or 1.0))), 2),
-                })
-
-            layout_json = json.dumps({
-                'paper_size': paper_size,
-                'rows': layout_rows,
-            }, ensure_ascii=False, separators=(',', ':'))
-            sheet_id = conn.execute(
-                """
-                INSERT INTO type2_chinese_print_sheets (category_key, layout_json, status)
-                VALUES (?, ?, 'pending')
-                RETURNING id
-                """,
-                [category_key, layout_json],
-            ).fetchone()[0]
-        finally:
-            if conn is not None:
-                conn.close()
+            )
+        }
+        if not candidate_cards_by_id.keys() >= set(card_ids):
+            return jsonify({'error': 'Some selected cards are no longer in the suggested card list'}), 409
+
+        layout_rows = []
+        for row, card_id in zip(rows, row_card_ids):
+            front, back = candidate_cards_by_id[card_id]
+            layout_rows.append({
+                'card_id': card_id,
+                'front': front,
+                'back': back,
+                'empty_count': max(1, min(9, int(row.get('emptyCount') or 1))),
+                'scale': round(max(0.5, min(2.0, float(row.get('scale') or 1.0))), 2),
+            })
 
-        return jsonify({
-            'created': True,
-            'sheet_id': int(sheet_id),
-            'status': 'pending',
-        }), 201
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        layout_json = json.dumps({
+            'paper_size': paper_size,
+            'rows': layout_rows,
+        }, ensure_ascii=False, separators=(',', ':'))
+        sheet_id = conn.execute(
+            _CHINESE_PRINT_SHEET_INSERT_SQL,
+            [category_key, layout_json],
+        ).fetchone()[0]
+    finally:
+        if conn is not None:
+            conn.close()
+
+    return jsonify({
+        'created': True,
+        'sheet_id': int(sheet_id),
+        'status': 'pending',
+    }), 201
 
 
 @kids_bp.route('/kids/<kid_id>/type2/chinese-print-sheets', methods=['GET'])
 def list_chinese_print_sheets(kid_id):
     """List persisted custom printable Chinese writing sheets for one kid/category."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
+        kid,
+        request.args.get('categoryKey'),
+    )
+    if not has_chinese_specific_logic:
+        return jsonify({'error': 'Practice sheets are only available for Chinese-specific type-II categories'}), 400
+
+    conn = get_kid_connection_for(kid, read_only=True)
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
-
-        category_key, has_chinese_specific_logic = resolve_kid_type_ii_category_with_mode(
-            kid,
-            request.args.get('categoryKey'),
-        )
-        if not has_chinese_specific_logic:
-            return jsonify({'error': 'Practice sheets are only available for Chinese-specific type-II categories'}), 400
-
-        conn = None
-        try:
-            conn = get_kid_connection_for(kid, read_only=True)
-            rows = conn.execute(
-                """
-                SELECT id, category_key, layout_json, status, created_at, completed_at
-                FROM type2_chinese_print_sheets
-                WHERE category_key = ?
-                ORDER BY created_at DESC, id DESC
-                """,
-                [category_key],
-            ).fetchall()
-        finally:
-            if conn is not None:
-                conn.close()
-
-        sheets = []
-        for row in rows:
-            layout = {}
-            try:
-                layout = json.loads(row[2]) if row[2] else {}
-            except (json.JSONDecodeError, TypeError):
-                pass
-            layout_rows = list(layout.get('rows') or [])
-            card_labels = []
-            for lr in layout_rows:
-                label = str(lr.get('front') or lr.get('back') or '')
-                if label and label not in card_labels:
-                    card_labels.append(label)
-            sheets.append({
-                'id': int(row[0]),
-                'category_key': str(row[1] or ''),
-                'status': str(row[3] or 'pending'),
-                'created_at': row[4].isoformat() if row[4] else None,
-                'completed_at': row[5].isoformat() if row[5] else None,
-                'paper_size': str(layout.get('paper_size') or 'us-letter'),
-                'row_count': len(layout_rows),
-                'card_labels': card_labels,
-            })
-
-        return jsonify({'sheets': sheets}), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        sheet_count, sheet_digest = conn.execute(_CHINESE_PRINT_SHEET_LIST_ETAG_SQL, [category_key]).fetchone()
+        etag = f'{sheet_count}-{sheet_digest:x}'
+        if request.if_none_match.contains(etag):
+            conn.close()
+            not_modified = Response(status=304)
+            not_modified.set_etag(etag)
+            return not_modified
+        cursor = conn.execute(_CHINESE_PRINT_SHEET_LIST_SQL, [category_key])
+    except Exception:
+        conn.close()
+        raise
+
+    def _iter_sheets():
+        # Sheets are encoded batch by batch while the body streams out; the
+        # connection is closed when the response closes.
+        while True:
+            rows = cursor.fetchmany(_CHINESE_PRINT_SHEET_LIST_FETCH_BATCH_SIZE)
+            if not rows:
+                return
+            for sheet_id, category, status, created_at, completed_at, paper_size, row_labels in rows:
+                row_labels = row_labels or []
+                sheet = _chinese_print_sheet_payload(sheet_id, category, status, created_at, completed_at)
+                sheet['paper_size'] = paper_size or 'us-letter'
+                sheet['row_count'] = len(row_labels)
+                # dict.fromkeys dedupes in first-seen order in one pass.
+                sheet['card_labels'] = list(dict.fromkeys(label for label in row_labels if label))
+                yield sheet
+
+    response = json_array_stream_response({}, 'sheets', _iter_sheets())
+    response.set_etag(etag)
+    response.call_on_close(conn.close)
+    return response
 
 
 @kids_bp.route('/kids/<kid_id>/type2/chinese-print-sheets/<int:sheet_id>', methods=['GET'])
 def get_chinese_print_sheet_detail(kid_id, sheet_id):
     """Return one persisted Chinese writing sheet with layout for print."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
 
-        conn = None
-        try:
-            conn = get_kid_connection_for(kid, read_only=True)
-            row = conn.execute(
-                """
-                SELECT id, category_key, layout_json, status, created_at, completed_at
-                FROM type2_chinese_print_sheets
-                WHERE id = ?
-                """,
-                [sheet_id],
-            ).fetchone()
-        finally:
-            if conn is not None:
-                conn.close()
-
-        if not row:
-            return jsonify({'error': 'Sheet not found'}), 404
+    conn = None
+    try:
+        conn = get_kid_connection_for(kid, read_only=True)
+        row = conn.execute(_CHINESE_PRINT_SHEET_DETAIL_SQL, [sheet_id]).fetchone()
+    finally:
+        if conn is not None:
+            conn.close()
 
-        layout = {}
-        try:
-            layout = json.loads(row[2]) if row[2] else {}
-        except (json.JSONDecodeError, TypeError):
-            pass
+    if not row:
+        return jsonify({'error': 'Sheet not found'}), 404
 
-        kid_name = str(kid.get('name') or '')
-        return jsonify({
-            'sheet': {
-                'id': int(row[0]),
-                'category_key': str(row[1] or ''),
-                'status': str(row[3] or 'pending'),
-                'created_at': row[4].isoformat() if row[4] else None,
-                'completed_at': row[5].isoformat() if row[5] else None,
-                'kid_name': kid_name,
-                'layout': layout,
-            },
-        }), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    sheet, layout = _chinese_print_sheet_row_to_payload(row)
+    sheet['kid_name'] = str(kid.get('name') or '')
+    sheet['layout'] = layout
+    response = jsonify({'sheet': sheet})
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @kids_bp.route('/kids/<kid_id>/type2/chinese-print-sheets/<int:sheet_id>/complete', methods=['POST'])
 def complete_chinese_print_sheet(kid_id, sheet_id):
     """Mark one Chinese print sheet as done."""
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
+
+    conn = None
     try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
+        conn = get_kid_connection_for(kid)
+        updated = conn.execute(_CHINESE_PRINT_SHEET_COMPLETE_SQL, [sheet_id]).fetchone()
+        if not updated and not conn.execute(_CHINESE_PRINT_SHEET_EXISTS_SQL, [sheet_id]).fetchone():
+            return jsonify({'error': 'Sheet not found'}), 404
+    finally:
+        if conn is not None:
+            conn.close()
 
-        conn = None
-        try:
-            conn = get_kid_connection_for(kid)
-            row = conn.execute(
-                "SELECT id, status FROM type2_chinese_print_sheets WHERE id = ?",
-                [sheet_id],
-            ).fetchone()
-            if not row:
-                return jsonify({'error': 'Sheet not found'}), 404
-            if str(row[1] or '').strip().lower() != 'done':
-                conn.execute(
-                    """
-                    UPDATE type2_chinese_print_sheets
-                    SET status = 'done', completed_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                    """,
-                    [sheet_id],
-                )
-        finally:
-            if conn is not None:
-                conn.close()
-
-        return jsonify({'sheet_id': int(sheet_id), 'status': 'done'}), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'sheet_id': int(sheet_id), 'status': 'done'}), 200
 
 
 @kids_bp.route('/kids/<kid_id>/type2/chinese-print-sheets/<int:sheet_id>/withdraw', methods=['POST'])
 def withdraw_chinese_print_sheet(kid_id, sheet_id):
     """Delete one pending Chinese print sheet."""
-    try:
-        kid = get_kid_for_family(kid_id)
-        if not kid:
-            return jsonify({'error': 'Kid not found'}), 404
+    kid = get_kid_for_family(kid_id)
+    if not kid:
+        return jsonify({'error': 'Kid not found'}), 404
 
-        conn = None
-        try:
-            conn = get_kid_connection_for(kid)
-            row = conn.execute(
-                "SELECT id, status FROM type2_chinese_print_sheets WHERE id = ?",
-                [sheet_id],
-            ).fetchone()
-            if not row:
+    conn = None
+    try:
+        conn = get_kid_connection_for(kid)
+        deleted = conn.execute(_CHINESE_PRINT_SHEET_DELETE_SQL, [sheet_id]).fetchone()
+        if not deleted:
+            if not conn.execute(_CHINESE_PRINT_SHEET_EXISTS_SQL, [sheet_id]).fetchone():
                 return jsonify({'error': 'Sheet not found'}), 404
-            status = str(row[1] or '').strip().lower()
-            if status == 'done':
-                return jsonify({'error': 'Completed sheets cannot be withdrawn'}), 400
-            conn.execute("DELETE FROM type2_chinese_print_sheets WHERE id = ?", [sheet_id])
-        finally:
-            if conn is not None:
-                conn.close()
-
-        return jsonify({'sheet_id': int(sheet_id), 'deleted': True}), 200
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            return jsonify({'error': 'Completed sheets cannot be withdrawn'}), 400
+    finally:
+        if conn is not None:
+            conn.close()
+
+    return jsonify({'sheet_id': int(sheet_id), 'deleted': True}), 200
 
 
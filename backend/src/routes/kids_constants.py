@@ -30,12 +30,12 @@ DECK_CATEGORY_BEHAVIOR_TYPE_I = 'type_i'
 DECK_CATEGORY_BEHAVIOR_TYPE_II = 'type_ii'
 DECK_CATEGORY_BEHAVIOR_TYPE_III = 'type_iii'
 DECK_CATEGORY_BEHAVIOR_TYPE_IV = 'type_iv'
-DECK_CATEGORY_BEHAVIOR_TYPES = {
+DECK_CATEGORY_BEHAVIOR_TYPES = frozenset({
     DECK_CATEGORY_BEHAVIOR_TYPE_I,
     DECK_CATEGORY_BEHAVIOR_TYPE_II,
     DECK_CATEGORY_BEHAVIOR_TYPE_III,
     DECK_CATEGORY_BEHAVIOR_TYPE_IV,
-}
+})
 MAX_SHARED_DECK_TAGS = 20
 MAX_SHARED_DECK_CARDS = 10000
 MAX_SHARED_TAG_LENGTH = 64
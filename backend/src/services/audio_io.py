@@ -12,13 +12,15 @@ import os
 import re
 import shutil
 
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f]+')
+
 
 def sanitize_download_filename_stem(raw_name, fallback='recording'):
     """Return safe user-facing filename stem while preserving Unicode text."""
     text = str(raw_name or '').strip()
     if not text:
         text = fallback
-    text = re.sub(r'[\x00-\x1f\x7f]+', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
     text = text.replace('/', '／').replace('\\', '＼')
     text = text.strip().strip('.')
     if not text:
@@ -4,7 +4,7 @@ Pure DB helpers and a pure row mapper — no module-level state, all DB access
 goes through an open kid `conn` arg.
 
 Layout:
-  1. Single-card delete
+  1. Single-card delete (+ practice-history guard)
   2. Cards-with-stats readers (deck-scoped + card-id-scoped) + practiced-card ids
   3. Row-to-API mapper (with practice-priority preview merged in)
 """
@@ -12,9 +12,18 @@ from src.services.normalize_inputs import normalize_positive_int_list
 
 
 # =====================================================================
-# === 1. Single-card delete
+# === 1. Single-card delete (+ practice-history guard)
 # =====================================================================
 
+def card_has_practice_history(conn, card_id):
+    """Return whether any session_results row references this card."""
+    row = conn.execute(
+        "SELECT EXISTS (SELECT 1 FROM session_results WHERE card_id = ?)",
+        [card_id],
+    ).fetchone()
+    return bool(row and row[0])
+
+
 def delete_card_from_deck_internal(conn, card_id):
     """Delete one card from a deck."""
     conn.execute("DELETE FROM cards WHERE id = ?", [card_id])
@@ -24,15 +33,39 @@ def delete_card_from_deck_internal(conn, card_id):
 # === 2. Cards-with-stats readers (deck-scoped + card-id-scoped) + practiced-card ids
 # =====================================================================
 
-def get_cards_with_stats_for_deck_ids(conn, deck_ids):
-    """Return cards with attempt / last-seen stats for many decks."""
-    normalized_ids = normalize_positive_int_list(deck_ids)
-    if not normalized_ids:
-        return []
+def _select_cards_with_stats(conn, card_filter_sql, order_by_sql, params):
+    """Run the cards+stats read for cards matching one `c.`-aliased filter.
 
-    placeholders = ','.join(['?'] * len(normalized_ids))
+    session_results is aggregated per card_id (semi-joined to the selected
+    cards) before the join, so grouping never carries the wide card columns.
+    """
     return conn.execute(
         f"""
+        WITH selected_cards AS (
+            SELECT
+                c.id,
+                c.deck_id,
+                c.front,
+                c.back,
+                c.skip_practice,
+                c.created_at,
+                c.thumb_down_count
+            FROM cards c
+            WHERE {card_filter_sql}
+        ),
+        result_stats AS (
+            SELECT
+                sr.card_id,
+                COUNT(*) AS lifetime_attempts,
+                MAX(sr.timestamp) AS last_seen_at,
+                MIN(sr.timestamp) AS first_practiced_at,
+                100.0 * AVG(CASE WHEN sr.correct = 1 THEN 0.0 ELSE 1.0 END) AS overall_wrong_rate,
+                ARG_MAX(COALESCE(sr.response_time_ms, 0), sr.timestamp) AS last_response_time_ms,
+                ARG_MAX(sr.correct, sr.timestamp) AS last_result_correct
+            FROM session_results sr
+            WHERE sr.card_id IN (SELECT id FROM selected_cards)
+            GROUP BY sr.card_id
+        )
         SELECT
             c.id,
             c.deck_id,
@@ -40,41 +73,35 @@ def get_cards_with_stats_for_deck_ids(conn, deck_ids):
             c.back,
             COALESCE(c.skip_practice, FALSE) AS skip_practice,
             c.created_at,
-            COUNT(sr.id) AS lifetime_attempts,
-            MAX(sr.timestamp) AS last_seen_at,
-            MIN(sr.timestamp) AS first_practiced_at,
-            100.0 * AVG(
-                CASE
-                    WHEN sr.id IS NULL THEN NULL
-                    WHEN sr.correct = 1 THEN 0.0
-                    ELSE 1.0
-                END
-            ) AS overall_wrong_rate,
-            ARG_MAX(
-                CASE
-                    WHEN sr.id IS NULL THEN NULL
-                    ELSE COALESCE(sr.response_time_ms, 0)
-                END,
-                sr.timestamp
-            ) AS last_response_time_ms,
-            ARG_MAX(
-                CASE
-                    WHEN sr.id IS NULL THEN NULL
-                    ELSE sr.correct
-                END,
-                sr.timestamp
-            ) AS last_result_correct,
+            COALESCE(st.lifetime_attempts, 0) AS lifetime_attempts,
+            st.last_seen_at,
+            st.first_practiced_at,
+            st.overall_wrong_rate,
+            st.last_response_time_ms,
+            st.last_result_correct,
             COALESCE(c.thumb_down_count, 0) AS thumb_down_count
-        FROM cards c
-        LEFT JOIN session_results sr ON c.id = sr.card_id
-        WHERE c.deck_id IN ({placeholders})
-        GROUP BY c.id, c.deck_id, c.front, c.back, c.skip_practice, c.created_at, c.thumb_down_count
-        ORDER BY c.deck_id ASC, c.id ASC
+        FROM selected_cards c
+        LEFT JOIN result_stats st ON st.card_id = c.id
+        ORDER BY {order_by_sql}
         """,
-        normalized_ids,
+        params,
     ).fetchall()
 
 
+def get_cards_with_stats_for_deck_ids(conn, deck_ids):
+    """Return cards with attempt / last-seen stats for many decks."""
+    normalized_ids = normalize_positive_int_list(deck_ids)
+    if not normalized_ids:
+        return []
+
+    return _select_cards_with_stats(
+        conn,
+        "c.deck_id IN (SELECT UNNEST(?::INTEGER[]))",
+        "c.deck_id ASC, c.id ASC",
+        [normalized_ids],
+    )
+
+
 def get_cards_with_stats(conn, deck_id):
     """Return cards with attempt / last-seen stats."""
     return get_cards_with_stats_for_deck_ids(conn, [deck_id])
@@ -86,49 +113,12 @@ def get_cards_with_stats_for_card_ids(conn, card_ids):
     if not normalized_ids:
         return []
 
-    placeholders = ','.join(['?'] * len(normalized_ids))
-    return conn.execute(
-        f"""
-        SELECT
-            c.id,
-            c.deck_id,
-            c.front,
-            c.back,
-            COALESCE(c.skip_practice, FALSE) AS skip_practice,
-            c.created_at,
-            COUNT(sr.id) AS lifetime_attempts,
-            MAX(sr.timestamp) AS last_seen_at,
-            MIN(sr.timestamp) AS first_practiced_at,
-            100.0 * AVG(
-                CASE
-                    WHEN sr.id IS NULL THEN NULL
-                    WHEN sr.correct = 1 THEN 0.0
-                    ELSE 1.0
-                END
-            ) AS overall_wrong_rate,
-            ARG_MAX(
-                CASE
-                    WHEN sr.id IS NULL THEN NULL
-                    ELSE COALESCE(sr.response_time_ms, 0)
-                END,
-                sr.timestamp
-            ) AS last_response_time_ms,
-            ARG_MAX(
-                CASE
-                    WHEN sr.id IS NULL THEN NULL
-                    ELSE sr.correct
-                END,
-                sr.timestamp
-            ) AS last_result_correct,
-            COALESCE(c.thumb_down_count, 0) AS thumb_down_count
-        FROM cards c
-        LEFT JOIN session_results sr ON c.id = sr.card_id
-        WHERE c.id IN ({placeholders})
-        GROUP BY c.id, c.deck_id, c.front, c.back, c.skip_practice, c.created_at, c.thumb_down_count
-        ORDER BY c.id ASC
-        """,
-        normalized_ids,
-    ).fetchall()
+    return _select_cards_with_stats(
+        conn,
+        "c.id IN (SELECT UNNEST(?::INTEGER[]))",
+        "c.id ASC",
+        [normalized_ids],
+    )
 
 
 def get_card_ids_practiced_for_category(conn, category_key):
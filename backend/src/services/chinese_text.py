@@ -1,4 +1,6 @@
 """Chinese-text helpers: pinyin generation, auto back-text fill, category lookups."""
+from functools import lru_cache
+
 from src.chinese_character_meanings import (
     get_bank_meaning,
     get_character_bank_pinyin,
@@ -28,6 +30,12 @@ def build_chinese_pinyin_text(text):
     normalized = str(text or '').strip()
     if not normalized:
         return ''
+    return _build_chinese_pinyin_text_cached(normalized)
+
+
+@lru_cache(maxsize=4096)
+def _build_chinese_pinyin_text_cached(normalized):
+    """Memoized pypinyin reading for one already-stripped, non-empty text."""
     try:
         from pypinyin import lazy_pinyin, pinyin, Style  # type: ignore
     except Exception as exc:
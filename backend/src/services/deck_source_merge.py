@@ -72,8 +72,8 @@ def get_card_count_summary_by_deck_ids(conn, deck_ids):
         SELECT
             d.id AS deck_id,
             COUNT(c.id) AS card_count,
-            COALESCE(SUM(CASE WHEN COALESCE(c.skip_practice, FALSE) = FALSE THEN 1 ELSE 0 END), 0) AS active_card_count,
-            COALESCE(SUM(CASE WHEN COALESCE(c.skip_practice, FALSE) = TRUE THEN 1 ELSE 0 END), 0) AS skipped_card_count
+            COUNT(c.id) FILTER (WHERE COALESCE(c.skip_practice, FALSE) = FALSE) AS active_card_count,
+            COUNT(c.id) FILTER (WHERE COALESCE(c.skip_practice, FALSE) = TRUE) AS skipped_card_count
         FROM decks d
         LEFT JOIN cards c ON c.deck_id = d.id
         WHERE d.id IN ({placeholders})
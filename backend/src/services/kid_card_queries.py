@@ -1,18 +1,70 @@
-"""Kid-local card distinct-value reader.
+"""Kid-local card distinct-value reader + batch card insert.
 
-DB helper takes an open `conn`. No module state.
+DB helpers take an open `conn`. No module state.
 """
 from src.services.normalize_inputs import normalize_positive_int_list
 
+# Every character `str.strip()` removes (all `isspace()` code points sit below
+# U+3001). DuckDB's bare trim() only drops spaces, so the front filter passes
+# this set to trim(front, ?) to normalize stored fronts like the Python side.
+_STR_STRIP_CHARS = ''.join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
 
-def get_kid_card_fronts_for_deck_ids(conn, deck_ids):
-    """Return distinct card fronts across selected kid-local deck ids."""
+
+def get_kid_card_fronts_for_deck_ids(conn, deck_ids, fronts=None):
+    """Return distinct card fronts across selected kid-local deck ids.
+
+    When `fronts` is given, only those candidate fronts are looked up, so
+    duplicate checks read back at most one row per candidate instead of the
+    whole card bank.
+    """
     deck_id_list = normalize_positive_int_list(deck_ids)
     if not deck_id_list:
         return set()
-    placeholders = ','.join(['?'] * len(deck_id_list))
-    rows = conn.execute(
-        f"SELECT DISTINCT front FROM cards WHERE deck_id IN ({placeholders})",
-        deck_id_list,
-    ).fetchall()
+    if fronts is None:
+        rows = conn.execute(
+            "SELECT DISTINCT front FROM cards WHERE deck_id IN (SELECT UNNEST(?::INTEGER[]))",
+            [deck_id_list],
+        ).fetchall()
+    else:
+        front_list = [str(front or '').strip() for front in fronts]
+        front_list = [front for front in front_list if front]
+        if not front_list:
+            return set()
+        rows = conn.execute(
+            """
+            SELECT DISTINCT front
+            FROM cards
+            WHERE deck_id IN (SELECT UNNEST($1::INTEGER[]))
+              AND trim(front, $2::VARCHAR) IN (SELECT UNNEST($3::VARCHAR[]))
+            """,
+            [deck_id_list, _STR_STRIP_CHARS, front_list],
+        ).fetchall()
     return {str(row[0] or '') for row in rows if str(row[0] or '')}
+
+
+def insert_kid_cards_for_deck(conn, deck_id, rows):
+    """Insert (front, back) rows into one deck; return created rows in input order.
+
+    Each returned row is (id, deck_id, front, back, created_at). Fronts must be
+    unique within `rows` (callers dedup against existing fronts first). The
+    batch is one INSERT inside one transaction.
+    """
+    rows = list(rows or [])
+    if not rows:
+        return []
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        created_rows = conn.execute(
+            """
+            INSERT INTO cards (deck_id, front, back)
+            SELECT ?, UNNEST(?::VARCHAR[]), UNNEST(?::VARCHAR[])
+            RETURNING id, deck_id, front, back, created_at
+            """,
+            [int(deck_id), [row[0] for row in rows], [row[1] for row in rows]],
+        ).fetchall()
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    created_by_front = {row[2]: row for row in created_rows}
+    return [created_by_front[front] for front, _ in rows]
@@ -31,6 +31,15 @@ from src.services.shared_deck_category import get_shared_deck_category_meta_by_k
 from src.services.shared_deck_normalize import normalize_shared_deck_tag
 
 
+def _non_negative_int(value, fallback):
+    """Parse one stored count/cutoff as an int floored at 0; `fallback` if unparseable."""
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return fallback
+    return parsed if parsed > 0 else 0
+
+
 # =====================================================================
 # === 1. Orphan-deck lookup / get-or-create by name
 # =====================================================================
@@ -102,15 +111,11 @@ def hydrate_kid_category_config_from_db(
     else:
         metadata_map = get_shared_deck_category_meta_by_key()
     category_keys = sorted(
-        {
-            normalize_shared_deck_tag(raw_key)
-            for raw_key in metadata_map.keys()
-            if normalize_shared_deck_tag(raw_key)
-        }
+        {key for key in map(normalize_shared_deck_tag, metadata_map.keys()) if key}
     )
-    session_by_category = {key: 0 for key in category_keys}
-    include_orphan_by_category = {key: DEFAULT_INCLUDE_ORPHAN_IN_QUEUE for key in category_keys}
-    drill_speed_by_category = {key: DEFAULT_DRILL_SPEED_CUTOFF_MS for key in category_keys}
+    session_by_category = dict.fromkeys(category_keys, 0)
+    include_orphan_by_category = dict.fromkeys(category_keys, DEFAULT_INCLUDE_ORPHAN_IN_QUEUE)
+    drill_speed_by_category = dict.fromkeys(category_keys, DEFAULT_DRILL_SPEED_CUTOFF_MS)
     opted_in_set = set()
 
     local_conn = conn
@@ -138,16 +143,10 @@ def hydrate_kid_category_config_from_db(
         key = normalize_shared_deck_tag(row[0])
         if not key:
             continue
-        session_by_category[key] = max(
-            0,
-            int(row[2] or 0),
-        )
+        session_by_category[key] = _non_negative_int(row[2], 0)
         include_orphan_by_category[key] = bool(row[3])
         if row[4] is not None:
-            try:
-                drill_speed_by_category[key] = max(0, int(row[4]))
-            except (TypeError, ValueError):
-                drill_speed_by_category[key] = DEFAULT_DRILL_SPEED_CUTOFF_MS
+            drill_speed_by_category[key] = _non_negative_int(row[4], DEFAULT_DRILL_SPEED_CUTOFF_MS)
         if bool(row[1]):
             opted_in_set.add(key)
 
@@ -155,9 +154,7 @@ def hydrate_kid_category_config_from_db(
         key for key in category_keys
         if key in opted_in_set
     ]
-    for key in sorted(opted_in_set):
-        if key not in category_keys:
-            opted_in_keys.append(key)
+    opted_in_keys.extend(sorted(opted_in_set.difference(category_keys)))
 
     kid[SESSION_CARD_COUNT_BY_CATEGORY_FIELD] = session_by_category
     kid[INCLUDE_ORPHAN_BY_CATEGORY_FIELD] = include_orphan_by_category
@@ -181,38 +178,29 @@ def get_category_session_card_count_for_kid(kid, category_key):
         raw_map = kid.get(SESSION_CARD_COUNT_BY_CATEGORY_FIELD)
     if not isinstance(raw_map, dict):
         return 0
-    raw_value = raw_map.get(key, 0)
-    try:
-        parsed = int(raw_value)
-    except (TypeError, ValueError):
-        return 0
-    return max(0, parsed)
+    return _non_negative_int(raw_map.get(key, 0), 0)
 
 
 def with_preview_session_count_for_category(kid, category_key, session_count):
-    """Return kid-like payload overriding one category session count for planning."""
+    """Return kid-like payload overriding one category session count for planning.
+
+    Planning only reads the payload, so the kid itself is returned when the
+    override matches its current count (or there is no category to override).
+    """
     key = normalize_shared_deck_tag(category_key)
     if not key:
-        return {**kid}
+        return kid
 
-    try:
-        parsed = int(session_count)
-    except (TypeError, ValueError):
-        parsed = 0
-    parsed = max(0, parsed)
+    parsed = _non_negative_int(session_count, 0)
 
+    # Hydrated maps are already keyed by normalized tags, so a flat copy
+    # is enough; only the overridden category needs normalizing.
     existing = kid.get(SESSION_CARD_COUNT_BY_CATEGORY_FIELD)
-    merged = {}
-    if isinstance(existing, dict):
-        for raw_key, raw_value in existing.items():
-            normalized = normalize_shared_deck_tag(raw_key)
-            if normalized:
-                merged[normalized] = raw_value
+    if isinstance(existing, dict) and existing.get(key) == parsed:
+        return kid
+    merged = dict(existing) if isinstance(existing, dict) else {}
     merged[key] = parsed
-    return {
-        **kid,
-        SESSION_CARD_COUNT_BY_CATEGORY_FIELD: merged,
-    }
+    return {**kid, SESSION_CARD_COUNT_BY_CATEGORY_FIELD: merged}
 
 
 def get_category_include_orphan_for_kid(kid, category_key):
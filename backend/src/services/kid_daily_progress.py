@@ -12,7 +12,9 @@ Helpers that read each kid's per-kid SQLite to produce:
     onto a per-category dict for the report payload.
 
 `get_kid_connection_for` is opened lazily when no `conn` is supplied.
-No module state.
+Module state: a short-TTL cache of today's per-session rows per kid,
+cleared by `invalidate_today_session_rows_cache` on session writes, kid delete
+and backup restore.
 
 Layout (search for `# === N. ` banner markers to jump between sections):
 
@@ -24,7 +26,10 @@ Layout (search for `# === N. ` banner markers to jump between sections):
     6. Composite progress section builder for the kid report
 """
 from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from contextlib import closing
+from datetime import datetime, timezone
+import threading
+import time
 from zoneinfo import ZoneInfo
 
 from src.db import metadata
@@ -49,6 +54,10 @@ from src.services.shared_deck_category import (
     get_session_behavior_type,
     get_shared_deck_category_meta_by_key,
 )
+from src.services.kid_today_sessions import (
+    get_kid_today_bounds_utc,
+    get_today_bounds_utc_for_timezone,
+)
 from src.services.shared_deck_normalize import normalize_shared_deck_tag
 
 
@@ -96,6 +105,136 @@ def get_deck_category_display_name(category_key, category_meta_by_key=None):
 # =====================================================================
 # === 2. Dashboard stats — today's session aggregates
 # =====================================================================
+# Today's per-session rows are the one aggregate `get_kid_dashboard_stats`
+# runs per kid on every dashboard poll. They are cached per (kid, UTC day
+# start) for `_TODAY_SESSION_ROWS_CACHE_TTL` seconds; every session write
+# path and kid delete call `invalidate_today_session_rows_cache(kid_id)`, and
+# backup restore clears every kid's entries.
+_TODAY_SESSION_ROWS_CACHE_TTL = 30
+_today_session_rows_cache = {}
+_today_session_rows_generation = defaultdict(int)
+_today_session_rows_kid_locks = {}
+_today_session_rows_cache_lock = threading.Lock()
+
+_TODAY_SESSION_ROWS_SQL = """
+WITH todays_sessions AS (
+    SELECT
+        id,
+        type,
+        planned_count,
+        completed_at,
+        started_at,
+        CASE
+            WHEN completed_at IS NOT NULL
+             AND completed_at >= ?
+             AND completed_at < ?
+            THEN 1 ELSE 0
+        END AS completed_today,
+        CASE
+            WHEN started_at IS NOT NULL
+             AND started_at >= ?
+             AND started_at < ?
+            THEN 1 ELSE 0
+        END AS started_today
+    FROM sessions
+    WHERE (
+        completed_at IS NOT NULL
+        AND completed_at >= ?
+        AND completed_at < ?
+    ) OR (
+        started_at IS NOT NULL
+        AND started_at >= ?
+        AND started_at < ?
+    )
+),
+unresolved_counts AS (
+    SELECT sr.session_id, COUNT(*) AS unresolved_count
+    FROM session_results sr
+    JOIN todays_sessions ts ON ts.id = sr.session_id
+    WHERE sr.card_id IS NOT NULL
+      AND (sr.correct = -1 OR sr.correct = 2)
+    GROUP BY sr.session_id
+)
+SELECT
+    s.type,
+    COALESCE(s.planned_count, 0) AS planned_count,
+    COUNT(sr.id) AS answer_count,
+    COALESCE(uc.unresolved_count, 0) AS unresolved_count,
+    s.completed_today,
+    s.started_today
+FROM todays_sessions s
+LEFT JOIN session_results sr ON sr.session_id = s.id
+LEFT JOIN unresolved_counts uc ON uc.session_id = s.id
+GROUP BY
+    s.id,
+    s.type,
+    s.planned_count,
+    s.completed_at,
+    s.started_at,
+    s.completed_today,
+    s.started_today,
+    uc.unresolved_count
+ORDER BY COALESCE(s.completed_at, s.started_at) ASC, s.id ASC
+"""
+
+
+def invalidate_today_session_rows_cache(kid_id=None):
+    """Drop one kid's cached today-session rows, or every kid's when kid_id is None."""
+    with _today_session_rows_cache_lock:
+        if kid_id is None:
+            for kid_key in _today_session_rows_generation:
+                _today_session_rows_generation[kid_key] += 1
+            _today_session_rows_cache.clear()
+            return
+        kid_key = str(kid_id)
+        _today_session_rows_generation[kid_key] += 1
+        for key in [key for key in _today_session_rows_cache if key[0] == kid_key]:
+            del _today_session_rows_cache[key]
+
+
+def _get_today_session_rows(conn, kid_id, day_start_utc, day_end_utc):
+    """Return today's session rows for one kid, served from the TTL cache when fresh."""
+    kid_key = str(kid_id)
+    cache_key = (kid_key, day_start_utc)
+    cached = _today_session_rows_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _TODAY_SESSION_ROWS_CACHE_TTL:
+        return cached[1]
+
+    with _today_session_rows_cache_lock:
+        kid_lock = _today_session_rows_kid_locks.setdefault(kid_key, threading.Lock())
+    # Per-kid lock so concurrent polls for one kid run the query once.
+    with kid_lock:
+        cached = _today_session_rows_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _TODAY_SESSION_ROWS_CACHE_TTL:
+            return cached[1]
+        generation = _today_session_rows_generation[kid_key]
+        rows = conn.execute(
+            _TODAY_SESSION_ROWS_SQL,
+            [
+                day_start_utc,
+                day_end_utc,
+                day_start_utc,
+                day_end_utc,
+                day_start_utc,
+                day_end_utc,
+                day_start_utc,
+                day_end_utc,
+            ]
+        ).fetchall()
+        now = time.monotonic()
+        with _today_session_rows_cache_lock:
+            # A write that landed mid-query bumped the generation; don't
+            # cache rows that may predate it.
+            if _today_session_rows_generation[kid_key] == generation:
+                for key in [
+                    key for key, (ts, _) in _today_session_rows_cache.items()
+                    if now - ts >= _TODAY_SESSION_ROWS_CACHE_TTL
+                ]:
+                    del _today_session_rows_cache[key]
+                _today_session_rows_cache[cache_key] = (now, rows)
+    return rows
+
+
 def get_kid_dashboard_stats(
     kid,
     *,
@@ -104,8 +243,13 @@ def get_kid_dashboard_stats(
     include_ungraded_count=True,
     conn=None,
     family_timezone=None,
+    day_bounds_utc=None,
 ):
-    """Get today's dashboard counts + latest session progress by category in one connection."""
+    """Get today's dashboard counts + latest session progress by category in one connection.
+
+    `day_bounds_utc` lets multi-kid callers pass the family's precomputed
+    (start, end) instead of re-deriving it per kid.
+    """
     default_counts = defaultdict(int)
     default_started_counts = defaultdict(int)
     default_star_tiers = defaultdict(list)
@@ -133,17 +277,15 @@ def get_kid_dashboard_stats(
 
     try:
         family_id = str(kid.get('familyId') or '')
-        effective_family_timezone = (
-            str(family_timezone).strip()
-            if str(family_timezone or '').strip()
-            else metadata.get_family_timezone(family_id)
-        )
         is_super = is_super_family_id(family_id)
-        tzinfo = ZoneInfo(effective_family_timezone)
-        day_start_local = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end_local = day_start_local + timedelta(days=1)
-        day_start_utc = day_start_local.astimezone(timezone.utc).replace(tzinfo=None)
-        day_end_utc = day_end_local.astimezone(timezone.utc).replace(tzinfo=None)
+        if day_bounds_utc is None:
+            effective_family_timezone = (
+                str(family_timezone).strip()
+                if str(family_timezone or '').strip()
+                else metadata.get_family_timezone(family_id)
+            )
+            day_bounds_utc = get_today_bounds_utc_for_timezone(effective_family_timezone)
+        day_start_utc, day_end_utc = day_bounds_utc
         effective_category_meta_by_key = (
             category_meta_by_key
             if isinstance(category_meta_by_key, dict)
@@ -154,78 +296,7 @@ def get_kid_dashboard_stats(
             }
         )
 
-        rows = local_conn.execute(
-            """
-            WITH todays_sessions AS (
-                SELECT
-                    id,
-                    type,
-                    planned_count,
-                    completed_at,
-                    started_at,
-                    CASE
-                        WHEN completed_at IS NOT NULL
-                         AND completed_at >= ?
-                         AND completed_at < ?
-                        THEN 1 ELSE 0
-                    END AS completed_today,
-                    CASE
-                        WHEN started_at IS NOT NULL
-                         AND started_at >= ?
-                         AND started_at < ?
-                        THEN 1 ELSE 0
-                    END AS started_today
-                FROM sessions
-                WHERE (
-                    completed_at IS NOT NULL
-                    AND completed_at >= ?
-                    AND completed_at < ?
-                ) OR (
-                    started_at IS NOT NULL
-                    AND started_at >= ?
-                    AND started_at < ?
-                )
-            ),
-            unresolved_counts AS (
-                SELECT sr.session_id, COUNT(*) AS unresolved_count
-                FROM session_results sr
-                JOIN todays_sessions ts ON ts.id = sr.session_id
-                WHERE sr.card_id IS NOT NULL
-                  AND (sr.correct = -1 OR sr.correct = 2)
-                GROUP BY sr.session_id
-            )
-            SELECT
-                s.type,
-                COALESCE(s.planned_count, 0) AS planned_count,
-                COUNT(sr.id) AS answer_count,
-                COALESCE(uc.unresolved_count, 0) AS unresolved_count,
-                s.completed_today,
-                s.started_today
-            FROM todays_sessions s
-            LEFT JOIN session_results sr ON sr.session_id = s.id
-            LEFT JOIN unresolved_counts uc ON uc.session_id = s.id
-            GROUP BY
-                s.id,
-                s.type,
-                s.planned_count,
-                s.completed_at,
-                s.started_at,
-                s.completed_today,
-                s.started_today,
-                uc.unresolved_count
-            ORDER BY COALESCE(s.completed_at, s.started_at) ASC, s.id ASC
-            """,
-            [
-                day_start_utc,
-                day_end_utc,
-                day_start_utc,
-                day_end_utc,
-                day_start_utc,
-                day_end_utc,
-                day_start_utc,
-                day_end_utc,
-            ]
-        ).fetchall()
+        rows = _get_today_session_rows(local_conn, kid.get('id'), day_start_utc, day_end_utc)
 
         today_counts = defaultdict(int)
         today_started_counts = defaultdict(int)
@@ -440,6 +511,7 @@ def get_kid_today_session_status_by_deck_category(
     shared_conn=None,
     family_id=None,
     category_meta_by_key=None,
+    day_bounds_utc=None,
 ):
     keys = [normalize_shared_deck_tag(key) for key in list(opted_in_category_keys or [])]
     keys = [key for key in keys if key]
@@ -469,16 +541,14 @@ def get_kid_today_session_status_by_deck_category(
 
     try:
         family_id = str(kid.get('familyId') or '')
-        effective_family_timezone = (
-            str(family_timezone).strip()
-            if str(family_timezone or '').strip()
-            else metadata.get_family_timezone(family_id)
-        )
-        tzinfo = ZoneInfo(effective_family_timezone)
-        day_start_local = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end_local = day_start_local + timedelta(days=1)
-        day_start_utc = day_start_local.astimezone(timezone.utc).replace(tzinfo=None)
-        day_end_utc = day_end_local.astimezone(timezone.utc).replace(tzinfo=None)
+        if day_bounds_utc is None:
+            effective_family_timezone = (
+                str(family_timezone).strip()
+                if str(family_timezone or '').strip()
+                else metadata.get_family_timezone(family_id)
+            )
+            day_bounds_utc = get_today_bounds_utc_for_timezone(effective_family_timezone)
+        day_start_utc, day_end_utc = day_bounds_utc
         points_by_key = _get_today_in_app_points_by_deck_category(
             local_conn,
             shared_conn,
@@ -664,39 +734,28 @@ def get_kid_daily_completed_by_deck_category(kid, opted_in_category_keys, today_
         return counts
 
     counts = {key: 0 for key in keys}
-    conn = None
     try:
-        conn = get_kid_connection_for(kid, read_only=True)
-        family_id = str(kid.get('familyId') or '')
-        family_timezone = metadata.get_family_timezone(family_id)
-        tzinfo = ZoneInfo(family_timezone)
-        day_start_local = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end_local = day_start_local + timedelta(days=1)
-        day_start_utc = day_start_local.astimezone(timezone.utc).replace(tzinfo=None)
-        day_end_utc = day_end_local.astimezone(timezone.utc).replace(tzinfo=None)
-
+        day_start_utc, day_end_utc = get_kid_today_bounds_utc(kid)
         placeholders = ', '.join(['?'] * len(keys))
-        rows = conn.execute(
-            f"""
-            SELECT s.type, COUNT(*)
-            FROM sessions s
-            WHERE s.completed_at IS NOT NULL
-              AND s.completed_at >= ?
-              AND s.completed_at < ?
-              AND s.type IN ({placeholders})
-            GROUP BY s.type
-            """,
-            [day_start_utc, day_end_utc, *keys],
-        ).fetchall()
-        for row in rows:
-            key = normalize_shared_deck_tag(row[0])
-            if key in counts:
-                counts[key] = int(row[1] or 0)
+        with closing(get_kid_connection_for(kid, read_only=True)) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT s.type, COUNT(*)
+                FROM sessions s
+                WHERE s.completed_at IS NOT NULL
+                  AND s.completed_at >= ?
+                  AND s.completed_at < ?
+                  AND s.type IN ({placeholders})
+                GROUP BY s.type
+                """,
+                [day_start_utc, day_end_utc, *keys],
+            ).fetchall()
     except Exception:
-        counts = {key: 0 for key in keys}
-    finally:
-        if conn is not None:
-            conn.close()
+        return counts
+    for row in rows:
+        key = normalize_shared_deck_tag(row[0])
+        if key in counts:
+            counts[key] = int(row[1] or 0)
     return counts
 
 
@@ -793,25 +852,27 @@ def get_kid_practice_target_by_deck_category(
     targets = {}
     keys = [normalize_shared_deck_tag(key) for key in list(opted_in_category_keys or [])]
     owned_conn = None
-    for key in keys:
-        if not key:
-            continue
-        category_meta = category_meta_by_key.get(key) if isinstance(category_meta_by_key, dict) else None
-        behavior_type = str((category_meta or {}).get('behavior_type') or '').strip().lower()
-        if behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_IV:
-            target_conn = conn
-            if target_conn is None:
-                if owned_conn is None:
-                    owned_conn = get_kid_connection_for(kid, read_only=True)
-                target_conn = owned_conn
-            targets[key] = int(get_type_iv_total_daily_target_for_category(target_conn, kid, key))
-            continue
-        if behavior_type in DECK_CATEGORY_BEHAVIOR_TYPES:
-            targets[key] = int(get_category_session_card_count_for_kid(kid, key))
-            continue
-        targets[key] = 0
-    if owned_conn is not None:
-        owned_conn.close()
+    try:
+        for key in keys:
+            if not key:
+                continue
+            category_meta = category_meta_by_key.get(key) if isinstance(category_meta_by_key, dict) else None
+            behavior_type = str((category_meta or {}).get('behavior_type') or '').strip().lower()
+            if behavior_type == DECK_CATEGORY_BEHAVIOR_TYPE_IV:
+                target_conn = conn
+                if target_conn is None:
+                    if owned_conn is None:
+                        owned_conn = get_kid_connection_for(kid, read_only=True)
+                    target_conn = owned_conn
+                targets[key] = int(get_type_iv_total_daily_target_for_category(target_conn, kid, key))
+                continue
+            if behavior_type in DECK_CATEGORY_BEHAVIOR_TYPES:
+                targets[key] = int(get_category_session_card_count_for_kid(kid, key))
+                continue
+            targets[key] = 0
+    finally:
+        if owned_conn is not None:
+            owned_conn.close()
     return targets
 
 
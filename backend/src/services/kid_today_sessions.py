@@ -35,10 +35,11 @@ from src.services.shared_deck_normalize import (
 # === 1. Today UTC bounds + latest retry-source session lookup
 # =====================================================================
 
-def get_kid_today_bounds_utc(kid):
-    """Return today's [start, end) UTC bounds for one kid's family timezone."""
-    family_id = str(kid.get('familyId') or '')
-    family_timezone = metadata.get_family_timezone(family_id)
+def get_today_bounds_utc_for_timezone(family_timezone):
+    """Return today's [start, end) naive-UTC bounds for one IANA timezone.
+
+    Every kid in a family shares these, so multi-kid callers compute them once.
+    """
     tzinfo = ZoneInfo(family_timezone)
     day_start_local = datetime.now(tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
     day_end_local = day_start_local + timedelta(days=1)
@@ -47,6 +48,12 @@ def get_kid_today_bounds_utc(kid):
     return day_start_utc, day_end_utc
 
 
+def get_kid_today_bounds_utc(kid):
+    """Return today's [start, end) UTC bounds for one kid's family timezone."""
+    family_id = str(kid.get('familyId') or '')
+    return get_today_bounds_utc_for_timezone(metadata.get_family_timezone(family_id))
+
+
 def get_latest_retry_source_session_for_today(conn, kid, session_type):
     """Return latest non-perfect session for today (type-I/type-II only), else None."""
     session_key = normalize_shared_deck_tag(session_type)
@@ -35,10 +35,10 @@ def _find_kid(data, kid_key):
     return None
 
 
-def _pop_expired_claim(kid):
+def _live_claim(kid):
+    """Return the kid's unexpired claim, or None, without mutating `kid`."""
     claim = kid.get(_CLAIM_FIELD)
     if not isinstance(claim, dict):
-        kid.pop(_CLAIM_FIELD, None)
         return None
     try:
         raw = str(claim.get('expiresAtUtc') or '').replace('Z', '+00:00')
@@ -48,11 +48,17 @@ def _pop_expired_claim(kid):
     except Exception:
         exp = None
     if exp is None or exp <= datetime.now(timezone.utc).replace(tzinfo=None):
-        kid.pop(_CLAIM_FIELD, None)
         return None
     return claim
 
 
+def _pop_expired_claim(kid):
+    claim = _live_claim(kid)
+    if claim is None:
+        kid.pop(_CLAIM_FIELD, None)
+    return claim
+
+
 def get_lock(kid_id):
     kid_key = str(kid_id or '').strip()
     if not kid_key:
@@ -68,11 +74,26 @@ def get_lock(kid_id):
     return _mutate_metadata(_op)
 
 
-def get_locks_for_family(family_id):
+def get_locks_for_family(family_id, kids=None):
+    """Return live locks for one family.
+
+    `kids` is an already-loaded roster; it is read as-is (no metadata
+    write lock) unless it holds a stale claim that needs clearing.
+    """
     fid = str(family_id or '')
     if not fid:
         return []
 
+    if kids is not None:
+        family_kids = [kid for kid in kids if str(kid.get('familyId') or '') == fid]
+        if not any(_CLAIM_FIELD in kid and _live_claim(kid) is None for kid in family_kids):
+            locks = []
+            for kid in family_kids:
+                claim = _live_claim(kid)
+                if claim:
+                    locks.append(_public_lock_dict(kid, claim))
+            return locks
+
     def _op(data):
         out = []
         for kid in data.get('kids', []):
@@ -17,21 +17,30 @@ from src.services.writing_audio import cleanup_type3_pending_audio_files_by_payl
 
 _PENDING_SESSIONS = {}
 _PENDING_SESSIONS_LOCK = threading.Lock()
+_EPOCH_MS_RE = re.compile(r'\d+(\.\d+)?')
 
 
-def _cleanup_expired_pending_sessions():
-    now = time.time()
-    expired_keys = [
-        key for key, payload in _PENDING_SESSIONS.items()
-        if now - float(payload.get('created_at_ts', 0)) > PENDING_SESSION_TTL_SECONDS
-    ]
-    for key in expired_keys:
-        payload = _PENDING_SESSIONS.pop(key, None)
-        if not payload:
-            continue
-        if not is_type_iii_session_type(payload.get('session_type')):
-            continue
-        cleanup_type3_pending_audio_files_by_payload(payload)
+def _pop_expired_pending_sessions():
+    """Pop expired entries and return their payloads; caller holds the lock.
+
+    Tokens are appended once, stamped with the insert time, so dict order
+    is creation order and the scan stops at the first live one. (Offline
+    sync re-inserts client-stamped records but pops them in the same request.)
+    """
+    cutoff = time.time() - PENDING_SESSION_TTL_SECONDS
+    expired_keys = []
+    for key, payload in _PENDING_SESSIONS.items():
+        if float(payload.get('created_at_ts', 0)) >= cutoff:
+            break
+        expired_keys.append(key)
+    return [_PENDING_SESSIONS.pop(key) for key in expired_keys]
+
+
+def _cleanup_expired_pending_payloads(payloads):
+    """Delete scratch audio owned by expired type-III payloads (outside the lock)."""
+    for payload in payloads:
+        if is_type_iii_session_type(payload.get('session_type')):
+            cleanup_type3_pending_audio_files_by_payload(payload)
 
 
 def create_pending_session(kid_id, session_type, payload):
@@ -44,8 +53,9 @@ def create_pending_session(kid_id, session_type, payload):
         'created_at_ts': time.time(),
     }
     with _PENDING_SESSIONS_LOCK:
-        _cleanup_expired_pending_sessions()
+        expired_payloads = _pop_expired_pending_sessions()
         _PENDING_SESSIONS[token] = record
+    _cleanup_expired_pending_payloads(expired_payloads)
     return token
 
 
@@ -54,8 +64,9 @@ def pop_pending_session(token, kid_id, session_type):
     if not token:
         return None
     with _PENDING_SESSIONS_LOCK:
-        _cleanup_expired_pending_sessions()
+        expired_payloads = _pop_expired_pending_sessions()
         payload = _PENDING_SESSIONS.pop(str(token), None)
+    _cleanup_expired_pending_payloads(expired_payloads)
     if not payload:
         return None
     if str(payload.get('kid_id')) != str(kid_id):
@@ -74,15 +85,16 @@ def get_pending_session(token, kid_id, session_type):
     if not token:
         return None
     with _PENDING_SESSIONS_LOCK:
-        _cleanup_expired_pending_sessions()
+        expired_payloads = _pop_expired_pending_sessions()
         payload = _PENDING_SESSIONS.get(str(token))
-        if not payload:
-            return None
-        if str(payload.get('kid_id')) != str(kid_id):
-            return None
-        if str(payload.get('session_type')) != str(session_type):
-            return None
-        return payload
+    _cleanup_expired_pending_payloads(expired_payloads)
+    if not payload:
+        return None
+    if str(payload.get('kid_id')) != str(kid_id):
+        return None
+    if str(payload.get('session_type')) != str(session_type):
+        return None
+    return payload
 
 
 def parse_client_started_at(raw_started_at, pending=None):
@@ -98,7 +110,7 @@ def parse_client_started_at(raw_started_at, pending=None):
         text = raw_started_at.strip()
         if text:
             try:
-                if re.fullmatch(r'\d+(\.\d+)?', text):
+                if _EPOCH_MS_RE.fullmatch(text):
                     dt = datetime.fromtimestamp(float(text) / 1000.0, tz=timezone.utc)
                 else:
                     normalized = text.replace('Z', '+00:00')
@@ -983,15 +983,14 @@ def get_reward_bucket_totals(kid_conn, shared_conn, family_id):
 
 
 def delete_point_event(kid_conn, event_id):
-    row = kid_conn.execute(
+    deleted_count = kid_conn.execute(
         """
         DELETE FROM point_event
         WHERE event_id = ?
-        RETURNING event_id
         """,
         [int(event_id or 0)],
-    ).fetchone()
-    return bool(row)
+    ).fetchone()[0]
+    return deleted_count > 0
 
 
 def apply_direct_rule_event(kid_conn, shared_conn, family_id, rule_id, *, points_delta=None, note=None):
@@ -1266,12 +1265,11 @@ def delete_in_app_chore_events_for_session(kid_conn, shared_conn, family_id, ses
     if not rule_ids:
         return 0
     placeholders = ', '.join(['?'] * len(rule_ids))
-    rows = kid_conn.execute(
+    # DuckDB DELETE yields a single deleted-row count; no need to return ids.
+    return int(kid_conn.execute(
         f"""
         DELETE FROM point_event
         WHERE created_at = ? AND rule_id IN ({placeholders})
-        RETURNING event_id
         """,
         [completed_at, *rule_ids],
-    ).fetchall()
-    return len(rows)
+    ).fetchone()[0])
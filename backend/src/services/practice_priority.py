@@ -82,13 +82,11 @@ def build_practice_priority_preview_for_decks(
 
     excluded_ids = normalize_positive_int_list(excluded_card_ids)
 
-    deck_placeholders = ','.join(['?'] * len(normalized_deck_ids))
     exclude_clause = ''
-    params = [*normalized_deck_ids]
+    params = [normalized_deck_ids]
     if excluded_ids:
-        excluded_placeholders = ','.join(['?'] * len(excluded_ids))
-        exclude_clause = f" AND c.id NOT IN ({excluded_placeholders})"
-        params.extend(excluded_ids)
+        exclude_clause = " AND c.id NOT IN (SELECT UNNEST(?::INTEGER[]))"
+        params.append(excluded_ids)
     params.append(session_type)
 
     slow_weight = (
@@ -119,7 +117,7 @@ def build_practice_priority_preview_for_decks(
                                        COALESCE(c.correct_time_ema_count, 0)))
                 END AS correct_time_ema
             FROM cards c
-            WHERE c.deck_id IN ({deck_placeholders})
+            WHERE c.deck_id IN (SELECT UNNEST(?::INTEGER[]))
               AND COALESCE(c.skip_practice, FALSE) = FALSE
               {exclude_clause}
         ),
@@ -44,15 +44,12 @@ def get_practice_candidate_cards_for_decks(conn, deck_ids, excluded_card_ids=Non
     if not normalized_deck_ids:
         return {}, []
 
-    excluded_set = set(excluded_card_ids or [])
-    excluded_ids = sorted(excluded_set)
+    excluded_ids = sorted(set(excluded_card_ids or []))
     exclude_clause = ""
-    deck_placeholders = ','.join(['?'] * len(normalized_deck_ids))
-    params = [*normalized_deck_ids]
+    params = [normalized_deck_ids]
     if len(excluded_ids) > 0:
-        placeholders = ','.join(['?'] * len(excluded_ids))
-        exclude_clause = f" AND c.id NOT IN ({placeholders})"
-        params.extend(excluded_ids)
+        exclude_clause = " AND c.id NOT IN (SELECT UNNEST(?::INTEGER[]))"
+        params.append(excluded_ids)
 
     rows = conn.execute(
         f"""
@@ -63,7 +60,7 @@ def get_practice_candidate_cards_for_decks(conn, deck_ids, excluded_card_ids=Non
             c.back,
             c.created_at
         FROM cards c
-        WHERE c.deck_id IN ({deck_placeholders}) AND COALESCE(c.skip_practice, FALSE) = FALSE
+        WHERE c.deck_id IN (SELECT UNNEST(?::INTEGER[])) AND COALESCE(c.skip_practice, FALSE) = FALSE
         {exclude_clause}
         ORDER BY c.id ASC
         """,
@@ -87,15 +84,8 @@ def get_practice_candidate_cards_for_decks(conn, deck_ids, excluded_card_ids=Non
     return cards_by_id, candidate_ids
 
 
-def preview_deck_practice_order_for_decks(conn, kid, deck_ids, session_type, excluded_card_ids=None):
-    """Preview merged queue order across multiple decks."""
-    _, candidate_ids = get_practice_candidate_cards_for_decks(
-        conn,
-        deck_ids,
-        excluded_card_ids=excluded_card_ids,
-    )
-    if len(candidate_ids) == 0:
-        return []
+def _order_candidate_ids_by_priority(conn, deck_ids, session_type, candidate_ids, excluded_card_ids=None):
+    """Order already-fetched candidate ids by practice priority, unranked ids last."""
     priority_preview = build_practice_priority_preview_for_decks(
         conn,
         deck_ids,
@@ -118,6 +108,24 @@ def preview_deck_practice_order_for_decks(conn, kid, deck_ids, session_type, exc
     return ordered_ids
 
 
+def preview_deck_practice_order_for_decks(conn, kid, deck_ids, session_type, excluded_card_ids=None):
+    """Preview merged queue order across multiple decks."""
+    _, candidate_ids = get_practice_candidate_cards_for_decks(
+        conn,
+        deck_ids,
+        excluded_card_ids=excluded_card_ids,
+    )
+    if len(candidate_ids) == 0:
+        return []
+    return _order_candidate_ids_by_priority(
+        conn,
+        deck_ids,
+        session_type,
+        candidate_ids,
+        excluded_card_ids=excluded_card_ids,
+    )
+
+
 def plan_deck_practice_selection_for_decks(conn, kid, deck_ids, session_type, excluded_card_ids=None):
     """Build deterministic merged session selection across multiple decks."""
     cards_by_id, candidate_ids = get_practice_candidate_cards_for_decks(
@@ -127,11 +135,11 @@ def plan_deck_practice_selection_for_decks(conn, kid, deck_ids, session_type, ex
     )
     if len(candidate_ids) == 0:
         return cards_by_id, []
-    ordered_ids = preview_deck_practice_order_for_decks(
+    ordered_ids = _order_candidate_ids_by_priority(
         conn,
-        kid,
         deck_ids,
         session_type,
+        candidate_ids,
         excluded_card_ids=excluded_card_ids,
     )
     target_count = min(
@@ -168,11 +176,11 @@ def build_continue_selected_cards_for_decks(
     if len(candidate_ids) == 0:
         return []
 
-    ordered_ids = preview_deck_practice_order_for_decks(
+    ordered_ids = _order_candidate_ids_by_priority(
         conn,
-        kid,
         normalized_deck_ids,
         session_type,
+        candidate_ids,
         excluded_card_ids=excluded_card_ids,
     )
 
@@ -238,16 +246,15 @@ def build_retry_selected_cards_for_sources(conn, source_by_deck_id, wrong_card_i
         return []
 
     unique_ids = list(dict.fromkeys(ordered_ids))
-    placeholders = ', '.join(['?'] * len(unique_ids))
     rows = conn.execute(
-        f"""
+        """
         SELECT id, deck_id, front, back, created_at
         FROM cards
-        WHERE id IN ({placeholders})
+        WHERE id IN (SELECT UNNEST(?::INTEGER[]))
           AND COALESCE(skip_practice, FALSE) = FALSE
         ORDER BY id ASC
         """,
-        unique_ids,
+        [unique_ids],
     ).fetchall()
     row_by_card_id = {int(row[0]): row for row in rows}
 
@@ -280,14 +287,13 @@ def build_type_i_multiple_choice_pool_cards(conn, source_by_deck_id, card_ids):
     if not normalized_ids:
         return []
 
-    placeholders = ', '.join(['?'] * len(normalized_ids))
     rows = conn.execute(
-        f"""
+        """
         SELECT id, deck_id, front, back
         FROM cards
-        WHERE id IN ({placeholders})
+        WHERE id IN (SELECT UNNEST(?::INTEGER[]))
         """,
-        normalized_ids,
+        [normalized_ids],
     ).fetchall()
     row_by_card_id = {int(row[0]): row for row in rows}
 
@@ -63,12 +63,6 @@ def delete_session_with_recompute(conn, session_id, *, kid_audio_dir=None):
             if name and name == os.path.basename(name):
                 audio_file_names.append(name)
 
-    result_id_rows = conn.execute(
-        "SELECT id FROM session_results WHERE session_id = ?",
-        [session_id_int],
-    ).fetchall()
-    removed_count = len(result_id_rows)
-
     conn.execute(
         """
         DELETE FROM type1_result_item
@@ -96,10 +90,11 @@ def delete_session_with_recompute(conn, session_id, *, kid_audio_dir=None):
         """,
         [session_id_int],
     )
-    conn.execute(
+    # DuckDB DELETE yields a single deleted-row count.
+    removed_count = int(conn.execute(
         "DELETE FROM session_results WHERE session_id = ?",
         [session_id_int],
-    )
+    ).fetchone()[0])
     conn.execute(
         "DELETE FROM sessions WHERE id = ?",
         [session_id_int],
@@ -118,30 +113,21 @@ def delete_session_with_recompute(conn, session_id, *, kid_audio_dir=None):
 
 def _recompute_correct_time_ema_for_cards(conn, card_ids):
     """Reset and replay correct_time_ema for one or more cards from remaining rows."""
+    card_ids = [int(card_id) for card_id in dict.fromkeys(card_ids or [])]
     if not card_ids:
         return
-    placeholders = ','.join(['?'] * len(card_ids))
-    conn.execute(
-        f"""
-        UPDATE cards
-        SET correct_time_ema = NULL,
-            correct_time_ema_count = 0
-        WHERE id IN ({placeholders})
-        """,
-        list(card_ids),
-    )
 
     alpha = float(PRACTICE_PRIORITY_CORRECT_TIME_EMA_ALPHA)
     rows = conn.execute(
-        f"""
+        """
         SELECT card_id, COALESCE(response_time_ms, 0) AS rt
         FROM session_results
-        WHERE card_id IN ({placeholders})
+        WHERE card_id IN (SELECT UNNEST(?::INTEGER[]))
           AND (correct = 1 OR correct <= -2)
           AND COALESCE(response_time_ms, 0) > 0
         ORDER BY COALESCE(timestamp, CURRENT_TIMESTAMP) ASC, id ASC
         """,
-        list(card_ids),
+        [card_ids],
     ).fetchall()
 
     ema_by_card = {}
@@ -155,20 +141,27 @@ def _recompute_correct_time_ema_for_cards(conn, card_ids):
         ema_by_card[card_id] = alpha * float(rt_ms) + (1.0 - alpha) * prior
         count_by_card[card_id] = count_by_card.get(card_id, 0) + 1
 
-    for card_id in card_ids:
-        ema_value = ema_by_card.get(card_id)
-        count_value = count_by_card.get(card_id, 0)
-        if ema_value is None or count_value <= 0:
-            continue
-        conn.execute(
-            """
-            UPDATE cards
-            SET correct_time_ema = ?,
-                correct_time_ema_count = ?
-            WHERE id = ?
-            """,
-            [float(ema_value), int(count_value), int(card_id)],
-        )
+    # One UPDATE..FROM writes every card: replayed cards get their new EMA,
+    # cards with no remaining attempts are reset to NULL / 0.
+    conn.execute(
+        """
+        UPDATE cards
+        SET correct_time_ema = stats.ema,
+            correct_time_ema_count = stats.ema_count
+        FROM (
+            SELECT
+                UNNEST(?::INTEGER[]) AS card_id,
+                UNNEST(?::DOUBLE[]) AS ema,
+                UNNEST(?::INTEGER[]) AS ema_count
+        ) AS stats
+        WHERE cards.id = stats.card_id
+        """,
+        [
+            card_ids,
+            [ema_by_card.get(card_id) for card_id in card_ids],
+            [count_by_card.get(card_id, 0) for card_id in card_ids],
+        ],
+    )
 
 
 # =====================================================================
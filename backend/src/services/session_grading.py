@@ -26,16 +26,30 @@ def update_card_correct_time_ema(conn, card_id, correct, response_time_ms):
     Bias correction is applied at read time as `raw / (1 - (1-α)^count)`.
     Skips updates for wrong attempts or non-positive response times.
     """
-    try:
-        card_id_int = int(card_id)
-        correct_int = int(correct or 0)
-        rt_ms = int(response_time_ms or 0)
-    except (TypeError, ValueError):
-        return
-    if card_id_int <= 0 or correct_int <= 0 or rt_ms <= 0:
-        return
+    update_cards_correct_time_ema(conn, [(card_id, correct, response_time_ms)])
+
+
+def update_cards_correct_time_ema(conn, attempts):
+    """Apply `update_card_correct_time_ema` for many (card_id, correct, response_time_ms) attempts.
+
+    Qualifying attempts go through one executemany, in the given order, so
+    repeated cards fold into the EMA exactly as sequential calls would.
+    """
     alpha = float(PRACTICE_PRIORITY_CORRECT_TIME_EMA_ALPHA)
-    conn.execute(
+    update_rows = []
+    for card_id, correct, response_time_ms in attempts:
+        try:
+            card_id_int = int(card_id)
+            correct_int = int(correct or 0)
+            rt_ms = int(response_time_ms or 0)
+        except (TypeError, ValueError):
+            continue
+        if card_id_int <= 0 or correct_int <= 0 or rt_ms <= 0:
+            continue
+        update_rows.append([alpha, float(rt_ms), alpha, card_id_int])
+    if not update_rows:
+        return
+    conn.executemany(
         """
         UPDATE cards
         SET
@@ -43,7 +57,7 @@ def update_card_correct_time_ema(conn, card_id, correct, response_time_ms):
             correct_time_ema_count = COALESCE(correct_time_ema_count, 0) + 1
         WHERE id = ?
         """,
-        [alpha, float(rt_ms), alpha, card_id_int],
+        update_rows,
     )
 
 
@@ -172,22 +186,32 @@ def insert_type4_result_item(conn, result_id, pending_item, submitted_answer, gr
 
 def insert_type1_result_item(conn, result_id, answer, grade):
     """Insert one optional type-I multiple-choice sidecar row."""
-    payload = build_type1_result_item_payload(answer, grade)
-    if payload is None:
-        return False
-    conn.execute(
-        """
-        INSERT INTO type1_result_item (result_id, distractor_answers, submitted_answers, submitted_grades)
-        VALUES (?, ?, ?, ?)
-        """,
-        [
+    return insert_type1_result_items(conn, [(result_id, answer, grade)]) > 0
+
+
+def insert_type1_result_items(conn, graded_results):
+    """Insert type-I sidecar rows for many (result_id, answer, grade); return rows written."""
+    item_rows = []
+    for result_id, answer, grade in graded_results:
+        payload = build_type1_result_item_payload(answer, grade)
+        if payload is None:
+            continue
+        item_rows.append([
             int(result_id),
             list(payload['distractor_answers']),
             [payload['submitted_answer']],
             [int(payload['grade'])],
-        ],
+        ])
+    if not item_rows:
+        return 0
+    conn.executemany(
+        """
+        INSERT INTO type1_result_item (result_id, distractor_answers, submitted_answers, submitted_grades)
+        VALUES (?, ?, ?, ?)
+        """,
+        item_rows,
     )
-    return True
+    return len(item_rows)
 
 
 # =====================================================================
@@ -65,15 +65,14 @@ def update_shared_cards_skip_bulk_internal(kid, card_ids, skipped, *, category_k
 
     conn = get_kid_connection_for(kid)
     try:
-        placeholders = ','.join(['?'] * len(unique_card_ids))
         card_rows = conn.execute(
-            f"""
+            """
             SELECT c.id, c.deck_id, d.name, d.tags
             FROM cards c
             JOIN decks d ON d.id = c.deck_id
-            WHERE c.id IN ({placeholders})
+            WHERE c.id IN (SELECT UNNEST(?::INTEGER[]))
             """,
-            unique_card_ids
+            [unique_card_ids]
         ).fetchall()
         row_by_id = {int(row[0]): row for row in card_rows}
         missing_ids = [card_id for card_id in unique_card_ids if card_id not in row_by_id]
@@ -92,8 +91,8 @@ def update_shared_cards_skip_bulk_internal(kid, card_ids, skipped, *, category_k
                 return {'error': f'Card does not belong to a shared {deck_label} or orphan deck'}, 400
 
         conn.execute(
-            f"UPDATE cards SET skip_practice = ? WHERE id IN ({placeholders})",
-            [bool(skipped), *unique_card_ids]
+            "UPDATE cards SET skip_practice = ? WHERE id IN (SELECT UNNEST(?::INTEGER[]))",
+            [bool(skipped), unique_card_ids]
         )
     finally:
         conn.close()
@@ -25,6 +25,14 @@ from src.routes.kids_constants import (
     MAX_TYPE_IV_GENERATOR_CODE_LENGTH,
 )
 
+# Separator-run patterns collapse whitespace and `_` (plus `-` for
+# behavior types) into a single `_` in one pass.
+_TRAILING_TAG_COMMENT_RE = re.compile(r'\([^()]*\)\s*$')
+_TAG_WITH_COMMENT_RE = re.compile(r'^(.*?)(?:\(([^()]*)\))?$')
+_TAG_SEPARATOR_RUN_RE = re.compile(r'[\s_]+')
+_BEHAVIOR_SEPARATOR_RUN_RE = re.compile(r'[\s\-_]+')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
 
 # =====================================================================
 # === 1. Single-tag normalize/parse/format
@@ -34,12 +42,10 @@ def normalize_shared_deck_tag(raw_tag):
     text = str(raw_tag or '').strip().lower()
     if not text:
         return ''
-    text = re.sub(r'\([^()]*\)\s*$', '', text).strip()
+    text = _TRAILING_TAG_COMMENT_RE.sub('', text).strip()
     if not text:
         return ''
-    text = re.sub(r'\s+', '_', text)
-    text = re.sub(r'_+', '_', text).strip('_')
-    return text
+    return _TAG_SEPARATOR_RUN_RE.sub('_', text).strip('_')
 
 
 def parse_shared_deck_tag_with_comment(raw_tag):
@@ -48,13 +54,13 @@ def parse_shared_deck_tag_with_comment(raw_tag):
     text = str(raw_tag or '').strip()
     if not text:
         return '', ''
-    match = re.match(r'^(.*?)(?:\(([^()]*)\))?$', text)
+    match = _TAG_WITH_COMMENT_RE.match(text)
     if not match:
         return normalize_shared_deck_tag(text), ''
     base = str(match.group(1) or '').strip()
     raw_comment = str(match.group(2) or '').strip()
     tag = normalize_shared_deck_tag(base)
-    comment = re.sub(r'\s+', ' ', raw_comment).strip()
+    comment = _WHITESPACE_RUN_RE.sub(' ', raw_comment).strip()
     return tag, comment
 
 
@@ -63,7 +69,7 @@ def format_shared_deck_tag_display_label(tag, comment):
     key = normalize_shared_deck_tag(tag)
     if not key:
         return ''
-    text = re.sub(r'\s+', ' ', str(comment or '').strip()).strip()
+    text = _WHITESPACE_RUN_RE.sub(' ', str(comment or '').strip()).strip()
     if not text:
         return key
     return f"{key}({text})"
@@ -90,8 +96,7 @@ def extract_shared_deck_tags_and_labels(raw_tags):
 def normalize_shared_deck_category_behavior(raw_behavior):
     """Normalize behavior input to canonical type_i/type_ii/type_iii/type_iv."""
     text = str(raw_behavior or '').strip().lower()
-    text = re.sub(r'[\s\-]+', '_', text)
-    text = re.sub(r'_+', '_', text).strip('_')
+    text = _BEHAVIOR_SEPARATOR_RUN_RE.sub('_', text).strip('_')
     if text in DECK_CATEGORY_BEHAVIOR_TYPES:
         return text
     return ''
@@ -30,6 +30,7 @@ from src.db.shared_deck_db import get_shared_decks_connection
 from src.routes.kids_constants import DEFAULT_TYPE_IV_DAILY_TARGET_COUNT
 from src.services.family_auth import get_kid_connection_for
 from src.services.kid_card_queries import get_kid_card_fronts_for_deck_ids
+from src.services.kid_daily_progress import invalidate_today_session_rows_cache
 from src.services.kid_category_config import (
     get_category_orphan_deck_name,
     get_or_create_category_orphan_deck,
@@ -726,102 +727,111 @@ def opt_out_shared_decks_internal(
 
         removed = []
         already_opted_out = []
-        for shared_deck_id in deck_ids:
-            local_entry = local_by_shared_id.get(shared_deck_id)
-            if not local_entry:
-                already_opted_out.append({'shared_deck_id': int(shared_deck_id)})
-                continue
+        # One transaction for every deck's detach/delete instead of one
+        # autocommit per statement; a failure leaves no half-removed deck.
+        kid_conn.execute("BEGIN TRANSACTION")
+        try:
+            for shared_deck_id in deck_ids:
+                local_entry = local_by_shared_id.get(shared_deck_id)
+                if not local_entry:
+                    already_opted_out.append({'shared_deck_id': int(shared_deck_id)})
+                    continue
 
-            local_deck_id = int(local_entry['local_deck_id'])
-            local_name = str(local_entry['local_name'])
-            card_rows = kid_conn.execute(
-                "SELECT id FROM cards WHERE deck_id = ?",
-                [local_deck_id]
-            ).fetchall()
-            card_ids = [int(row[0]) for row in card_rows]
-            card_count = len(card_ids)
-
-            practiced_card_ids = []
-            if card_ids:
-                placeholders = ','.join(['?'] * len(card_ids))
-                practiced_rows = kid_conn.execute(
-                    f"SELECT DISTINCT card_id FROM session_results WHERE card_id IN ({placeholders})",
-                    card_ids
-                ).fetchall()
-                practiced_card_ids = [int(row[0]) for row in practiced_rows]
-            had_practice_sessions = len(practiced_card_ids) > 0
-
-            if had_practice_sessions:
-                orphan_deck_id = get_or_create_orphan_deck(
-                    kid_conn,
-                    orphan_deck_name,
-                    first_tag,
-                )
-                practiced_placeholders = ','.join(['?'] * len(practiced_card_ids))
-                practiced_cards = kid_conn.execute(
-                    f"""
-                    SELECT id, front, back, skip_practice, created_at
-                    FROM cards
-                    WHERE id IN ({practiced_placeholders})
-                    """,
-                    practiced_card_ids
+                local_deck_id = int(local_entry['local_deck_id'])
+                local_name = str(local_entry['local_name'])
+                card_rows = kid_conn.execute(
+                    "SELECT id FROM cards WHERE deck_id = ?",
+                    [local_deck_id]
                 ).fetchall()
-                if practiced_cards:
-                    kid_conn.execute(
-                        f"DELETE FROM cards WHERE id IN ({practiced_placeholders})",
-                        practiced_card_ids
+                card_ids = [int(row[0]) for row in card_rows]
+                card_count = len(card_ids)
+
+                practiced_card_ids = []
+                if card_ids:
+                    placeholders = ','.join(['?'] * len(card_ids))
+                    practiced_rows = kid_conn.execute(
+                        f"SELECT DISTINCT card_id FROM session_results WHERE card_id IN ({placeholders})",
+                        card_ids
+                    ).fetchall()
+                    practiced_card_ids = [int(row[0]) for row in practiced_rows]
+                had_practice_sessions = len(practiced_card_ids) > 0
+
+                if had_practice_sessions:
+                    orphan_deck_id = get_or_create_orphan_deck(
+                        kid_conn,
+                        orphan_deck_name,
+                        first_tag,
                     )
-                    kid_conn.executemany(
-                        """
-                        INSERT INTO cards (id, deck_id, front, back, skip_practice, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
+                    practiced_placeholders = ','.join(['?'] * len(practiced_card_ids))
+                    practiced_cards = kid_conn.execute(
+                        f"""
+                        SELECT id, front, back, skip_practice, created_at
+                        FROM cards
+                        WHERE id IN ({practiced_placeholders})
                         """,
-                        [
+                        practiced_card_ids
+                    ).fetchall()
+                    if practiced_cards:
+                        kid_conn.execute(
+                            f"DELETE FROM cards WHERE id IN ({practiced_placeholders})",
+                            practiced_card_ids
+                        )
+                        kid_conn.executemany(
+                            """
+                            INSERT INTO cards (id, deck_id, front, back, skip_practice, created_at)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                            """,
                             [
-                                int(row[0]),
-                                orphan_deck_id,
-                                row[1],
-                                row[2],
-                                bool(row[3]),
-                                row[4],
+                                [
+                                    int(row[0]),
+                                    orphan_deck_id,
+                                    row[1],
+                                    row[2],
+                                    bool(row[3]),
+                                    row[4],
+                                ]
+                                for row in practiced_cards
                             ]
-                            for row in practiced_cards
-                        ]
-                    )
+                        )
 
-                practiced_card_id_set = set(practiced_card_ids)
-                unpracticed_ids = [card_id for card_id in card_ids if card_id not in practiced_card_id_set]
-                if unpracticed_ids:
+                    practiced_card_id_set = set(practiced_card_ids)
+                    unpracticed_ids = [card_id for card_id in card_ids if card_id not in practiced_card_id_set]
+                    if unpracticed_ids:
+                        delete_shared_deck_related_rows(
+                            kid_conn,
+                            unpracticed_ids,
+                            delete_type3_audio=delete_type3_audio,
+                        )
+                        unpracticed_placeholders = ','.join(['?'] * len(unpracticed_ids))
+                        kid_conn.execute(
+                            f"DELETE FROM cards WHERE id IN ({unpracticed_placeholders})",
+                            unpracticed_ids
+                        )
+                else:
                     delete_shared_deck_related_rows(
                         kid_conn,
-                        unpracticed_ids,
+                        card_ids,
                         delete_type3_audio=delete_type3_audio,
                     )
-                    unpracticed_placeholders = ','.join(['?'] * len(unpracticed_ids))
-                    kid_conn.execute(
-                        f"DELETE FROM cards WHERE id IN ({unpracticed_placeholders})",
-                        unpracticed_ids
-                    )
-            else:
-                delete_shared_deck_related_rows(
-                    kid_conn,
-                    card_ids,
-                    delete_type3_audio=delete_type3_audio,
-                )
-                kid_conn.execute("DELETE FROM cards WHERE deck_id = ?", [local_deck_id])
-
-            kid_conn.execute("DELETE FROM decks WHERE id = ?", [local_deck_id])
-            removed.append({
-                'shared_deck_id': int(shared_deck_id),
-                'deck_id': local_deck_id,
-                'materialized_name': local_name,
-                'had_practice_sessions': had_practice_sessions,
-                'cards_removed': card_count - len(practiced_card_ids),
-                'cards_detached': len(practiced_card_ids),
-            })
+                    kid_conn.execute("DELETE FROM cards WHERE deck_id = ?", [local_deck_id])
+
+                kid_conn.execute("DELETE FROM decks WHERE id = ?", [local_deck_id])
+                removed.append({
+                    'shared_deck_id': int(shared_deck_id),
+                    'deck_id': local_deck_id,
+                    'materialized_name': local_name,
+                    'had_practice_sessions': had_practice_sessions,
+                    'cards_removed': card_count - len(practiced_card_ids),
+                    'cards_detached': len(practiced_card_ids),
+                })
+            kid_conn.execute("COMMIT")
+        except Exception:
+            kid_conn.execute("ROLLBACK")
+            raise
     finally:
         if kid_conn is not None:
             kid_conn.close()
+        invalidate_today_session_rows_cache(kid.get('id'))
 
     return {
         'requested_count': len(deck_ids),
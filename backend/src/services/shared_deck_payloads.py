@@ -75,21 +75,26 @@ from src.services.type4_session import (
 # =====================================================================
 # === 1. Deck/source summary helpers
 # =====================================================================
-def build_orphan_deck_payload(conn, orphan_deck_id, default_orphan_name):
-    """Build one orphan deck summary payload."""
+def build_orphan_deck_payload(conn, orphan_deck_id, default_orphan_name, *, card_counts=None):
+    """Build one orphan deck summary payload.
+
+    Pass `card_counts` (one `get_card_count_summary_by_deck_ids` entry) when the
+    caller already counted the orphan deck alongside others.
+    """
     orphan_row = conn.execute(
         "SELECT id, name, COALESCE(daily_target_count, 0) FROM decks WHERE id = ? LIMIT 1",
         [orphan_deck_id]
     ).fetchone()
     orphan_name = str(orphan_row[1] or default_orphan_name) if orphan_row else str(default_orphan_name)
     orphan_daily_target_count = int(orphan_row[2] or 0) if orphan_row and len(orphan_row) >= 3 else 0
-    counts = get_card_count_summary_by_deck_ids(conn, [orphan_deck_id]).get(int(orphan_deck_id)) or {}
+    if card_counts is None:
+        card_counts = get_card_count_summary_by_deck_ids(conn, [orphan_deck_id]).get(int(orphan_deck_id)) or {}
     return {
         'deck_id': orphan_deck_id,
         'name': orphan_name,
-        'card_count': int(counts.get('card_count') or 0),
-        'active_card_count': int(counts.get('active_card_count') or 0),
-        'skipped_card_count': int(counts.get('skipped_card_count') or 0),
+        'card_count': int(card_counts.get('card_count') or 0),
+        'active_card_count': int(card_counts.get('active_card_count') or 0),
+        'skipped_card_count': int(card_counts.get('skipped_card_count') or 0),
         'daily_target_count': orphan_daily_target_count,
     }
 
@@ -151,47 +156,30 @@ def build_type_i_shared_decks_payload(
                 local_by_shared_id[shared_deck_id] = entry
 
         local_deck_ids = [int(deck_id) for deck_id in materialized_by_local_id.keys()]
-        if local_deck_ids:
-            placeholders = ','.join(['?'] * len(local_deck_ids))
-            card_count_rows = kid_conn.execute(
-                f"""
-                SELECT deck_id, COUNT(*) AS card_count
-                FROM cards
-                WHERE deck_id IN ({placeholders})
-                GROUP BY deck_id
-                """,
-                local_deck_ids
-            ).fetchall()
-            local_card_count_by_deck_id = {
-                int(row[0]): int(row[1] or 0)
-                for row in card_count_rows
-            }
-
         orphan_deck_name = get_category_orphan_deck_name(category_key)
         orphan_deck_id = get_category_orphan_deck(kid_conn, category_key)
+        # One grouped count covers every materialized deck plus the orphan deck.
+        card_counts_by_deck_id = get_card_count_summary_by_deck_ids(
+            kid_conn,
+            [*local_deck_ids, orphan_deck_id],
+        )
+        local_card_count_by_deck_id = {
+            deck_id: int((card_counts_by_deck_id.get(deck_id) or {}).get('card_count') or 0)
+            for deck_id in local_deck_ids
+        }
+
         orphan_row = kid_conn.execute(
             "SELECT id, name, tags FROM decks WHERE id = ? LIMIT 1",
             [orphan_deck_id]
         ).fetchone()
         orphan_name = str(orphan_row[1] or orphan_deck_name) if orphan_row else orphan_deck_name
-        orphan_total = int(kid_conn.execute(
-            "SELECT COUNT(*) FROM cards WHERE deck_id = ?",
-            [orphan_deck_id]
-        ).fetchone()[0] or 0)
-        orphan_active = int(kid_conn.execute(
-            "SELECT COUNT(*) FROM cards WHERE deck_id = ? AND COALESCE(skip_practice, FALSE) = FALSE",
-            [orphan_deck_id]
-        ).fetchone()[0] or 0)
-        orphan_skipped = int(kid_conn.execute(
-            "SELECT COUNT(*) FROM cards WHERE deck_id = ? AND COALESCE(skip_practice, FALSE) = TRUE",
-            [orphan_deck_id]
-        ).fetchone()[0] or 0)
+        orphan_counts = card_counts_by_deck_id.get(int(orphan_deck_id)) or {}
         orphan_deck_payload = {
             'deck_id': orphan_deck_id,
             'name': orphan_name,
-            'card_count': orphan_total,
-            'active_card_count': orphan_active,
-            'skipped_card_count': orphan_skipped,
+            'card_count': int(orphan_counts.get('card_count') or 0),
+            'active_card_count': int(orphan_counts.get('active_card_count') or 0),
+            'skipped_card_count': int(orphan_counts.get('skipped_card_count') or 0),
         }
     finally:
         if kid_conn is not None:
@@ -876,24 +864,22 @@ def build_shared_decks_listing_payload(
                 local_by_shared_id[shared_deck_id] = entry
 
         local_deck_ids = [int(deck_id) for deck_id in materialized_by_local_id.keys()]
-        if local_deck_ids:
-            placeholders = ','.join(['?'] * len(local_deck_ids))
-            card_count_rows = kid_conn.execute(
-                f"""
-                SELECT deck_id, COUNT(*) AS card_count
-                FROM cards
-                WHERE deck_id IN ({placeholders})
-                GROUP BY deck_id
-                """,
-                local_deck_ids
-            ).fetchall()
-            local_card_count_by_deck_id = {
-                int(row[0]): int(row[1] or 0)
-                for row in card_count_rows
-            }
-
         orphan_deck_id = get_orphan_deck(kid_conn, orphan_deck_name)
-        orphan_deck_payload = build_orphan_deck_payload(kid_conn, orphan_deck_id, orphan_deck_name)
+        # One grouped count covers every materialized deck plus the orphan deck.
+        card_counts_by_deck_id = get_card_count_summary_by_deck_ids(
+            kid_conn,
+            [*local_deck_ids, orphan_deck_id],
+        )
+        local_card_count_by_deck_id = {
+            deck_id: int((card_counts_by_deck_id.get(deck_id) or {}).get('card_count') or 0)
+            for deck_id in local_deck_ids
+        }
+        orphan_deck_payload = build_orphan_deck_payload(
+            kid_conn,
+            orphan_deck_id,
+            orphan_deck_name,
+            card_counts=card_counts_by_deck_id.get(int(orphan_deck_id)) or {},
+        )
     finally:
         if kid_conn is not None:
             kid_conn.close()
@@ -15,6 +15,7 @@ import mimetypes
 import os
 import re
 import uuid
+from functools import lru_cache
 from urllib.parse import quote
 
 from src.routes.kids_constants import (
@@ -26,6 +27,8 @@ from src.routes.kids_constants import (
     WRITING_TTS_LANGUAGE_ZH,
 )
 
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
 
 # =====================================================================
 # === 1. Shared writing-audio dir + text/language normalizers
@@ -45,7 +48,7 @@ def ensure_shared_writing_audio_dir():
 
 def normalize_writing_audio_text(front_text):
     """Normalize card front text used for deterministic TTS filenames."""
-    text = re.sub(r'\s+', ' ', str(front_text or '').strip())
+    text = _WHITESPACE_RUN_RE.sub(' ', str(front_text or '').strip())
     return text
 
 
@@ -135,6 +138,20 @@ def build_shared_type1_prompt_audio_file_name(front_text):
 # === 4. Meta + payload builders (writing + Type-I Chinese)
 # =====================================================================
 
+# Every writing audio file name ends in WRITING_AUDIO_EXTENSION.
+_WRITING_AUDIO_MIME_TYPE = mimetypes.guess_type(f"tts{WRITING_AUDIO_EXTENSION}")[0] or 'audio/mpeg'
+
+
+def _writing_audio_url_parts(kid_id, category_key):
+    """Return the (url prefix, query suffix) shared by one kid/category's writing audio URLs."""
+    query = (
+        f"?categoryKey={quote(str(category_key).strip(), safe='')}"
+        if str(category_key or '').strip()
+        else ''
+    )
+    return f"/api/kids/{kid_id}/type2/audio/", query
+
+
 def build_writing_audio_meta_for_card(
     kid_id,
     front_text,
@@ -151,17 +168,11 @@ def build_writing_audio_meta_for_card(
             'audio_url': None,
         }
 
-    mime_type = mimetypes.guess_type(file_name)[0] or 'audio/mpeg'
-    query = (
-        f"?categoryKey={quote(str(category_key).strip(), safe='')}"
-        if str(category_key or '').strip()
-        else ''
-    )
-    encoded_file_name = quote(file_name, safe='')
+    url_prefix, query = _writing_audio_url_parts(kid_id, category_key)
     return {
         'audio_file_name': file_name,
-        'audio_mime_type': mime_type,
-        'audio_url': f"/api/kids/{kid_id}/type2/audio/{encoded_file_name}{query}",
+        'audio_mime_type': _WRITING_AUDIO_MIME_TYPE,
+        'audio_url': f"{url_prefix}{quote(file_name, safe='')}{query}",
     }
 
 
@@ -188,6 +199,23 @@ def build_writing_prompt_audio_payload(
     }
 
 
+def add_writing_prompt_audio_to_cards(kid_id, cards, *, category_key):
+    """Set writing prompt audio fields on each card dict in place; returns `cards`.
+
+    Batch form of `build_writing_prompt_audio_payload`: the URL prefix and
+    category query are built once instead of per card.
+    """
+    url_prefix, query = _writing_audio_url_parts(kid_id, category_key)
+    for card in cards:
+        file_name = build_shared_writing_audio_file_name(card.get('front'), card.get('back'))
+        audio_url = f"{url_prefix}{quote(file_name, safe='')}{query}" if file_name else None
+        card['audio_file_name'] = file_name or None
+        card['audio_mime_type'] = _WRITING_AUDIO_MIME_TYPE if file_name else None
+        card['audio_url'] = audio_url
+        card['prompt_audio_url'] = audio_url
+    return cards
+
+
 def build_type_i_chinese_audio_meta_for_front(
     kid_id,
     front_text,
@@ -287,12 +315,14 @@ def synthesize_shared_writing_audio(
 # === 6. Type-III per-kid audio dir + pending/uncommitted cleanup
 # =====================================================================
 
+@lru_cache(maxsize=256)
+def _kid_type3_audio_dir(family_id, kid_id):
+    return os.path.join(FAMILIES_ROOT, f'family_{family_id}', 'lesson_reading_audio', f'kid_{kid_id}')
+
+
 def get_kid_type3_audio_dir(kid):
     """Get filesystem directory for kid type-III recording files."""
-    family_id = str(kid.get('familyId') or '')
-    kid_id = kid.get('id')
-    family_root = os.path.join(FAMILIES_ROOT, f'family_{family_id}')
-    return os.path.join(family_root, 'lesson_reading_audio', f'kid_{kid_id}')
+    return _kid_type3_audio_dir(str(kid.get('familyId') or ''), str(kid.get('id')))
 
 
 def ensure_type3_audio_dir(kid):
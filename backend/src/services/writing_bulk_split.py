@@ -7,21 +7,17 @@ whitespace or commas. No DB or module state.
 """
 import re
 
+_CHINESE_RUN_RE = re.compile(r'[\u3400-\u9FFF\uF900-\uFAFF]+')
+
 
 def split_writing_bulk_text(raw_text):
     """Split bulk writing input by non-Chinese chars, preserving Chinese phrase chunks."""
     text = str(raw_text or '')
     # Match contiguous Chinese runs; separators are any non-Chinese chars.
-    chunks = re.findall(r'[\u3400-\u9FFF\uF900-\uFAFF]+', text)
-    deduped = []
-    seen = set()
-    for chunk in chunks:
-        token = chunk.strip()
-        if not token or token in seen:
-            continue
-        deduped.append(token)
-        seen.add(token)
-    return deduped
+    # Runs are non-empty and never contain whitespace, so they need no
+    # strip/filter pass; dict.fromkeys keeps first-seen order while dropping
+    # repeats.
+    return list(dict.fromkeys(_CHINESE_RUN_RE.findall(text)))
 
 
 def split_type2_bulk_rows(raw_text, has_chinese_specific_logic):
@@ -64,13 +60,7 @@ def split_type2_bulk_rows(raw_text, has_chinese_specific_logic):
         tokens = split_writing_bulk_text(raw_text)
         return [(token, token) for token in tokens]
 
-    rows = []
-    seen_front = set()
-    for line in non_empty_lines:
-        for token in line.split():
-            tok = str(token or '').strip()
-            if not tok or tok in seen_front:
-                continue
-            seen_front.add(tok)
-            rows.append((tok, tok))
-    return rows
+    tokens = dict.fromkeys(
+        token for line in non_empty_lines for token in line.split()
+    )
+    return [(token, token) for token in tokens]
@@ -21,6 +21,67 @@ from src.services.normalize_inputs import (
 # === 1. Writing-candidate row + id readers (newly-added or latest-failed)
 # =====================================================================
 
+# Eligible deck cards are resolved first so `latest` only aggregates history
+# for those cards instead of every card ever practiced. `latest` keeps each
+# card's most recent result with one hash aggregate (arg_max) rather than a
+# sorted ROW_NUMBER window; the `seen_at IS NOT NULL` lead keeps NULL times
+# ranked last, matching ORDER BY ... DESC, and `sr.id` breaks ties.
+_WRITING_CANDIDATE_SQL_TEMPLATE = """
+WITH deck_cards AS (
+    SELECT id, front, back, created_at
+    FROM cards
+    WHERE deck_id IN (SELECT UNNEST(?::INTEGER[]))
+      AND COALESCE(skip_practice, FALSE) = FALSE
+      {exclude_clause}
+),
+seen AS (
+    SELECT
+        sr.id,
+        sr.card_id,
+        sr.correct,
+        COALESCE(s.completed_at, s.started_at, sr.timestamp) AS seen_at
+    FROM session_results sr
+    JOIN deck_cards dc ON dc.id = sr.card_id
+    JOIN sessions s ON s.id = sr.session_id
+    WHERE s.type = ?
+),
+latest AS (
+    SELECT
+        card_id,
+        arg_max(correct, (seen_at IS NOT NULL, seen_at, id)) AS correct,
+        MAX(seen_at) AS latest_seen_at
+    FROM seen
+    GROUP BY card_id
+)
+SELECT
+    c.id,
+    c.front,
+    c.back,
+    l.correct,
+    l.latest_seen_at
+FROM deck_cards c
+LEFT JOIN latest l ON l.card_id = c.id
+WHERE l.card_id IS NULL OR l.correct < 0
+ORDER BY
+  CASE WHEN l.card_id IS NULL THEN 1 ELSE 0 END DESC,
+  COALESCE(l.latest_seen_at, c.created_at) DESC,
+  c.id DESC
+{limit_clause}
+"""
+
+# Keyed by (has excluded ids, has limit). Pending-card exclusion is one
+# list-typed parameter, so the SQL text is fixed however many cards are
+# pending and DuckDB plans it as a hash anti-join.
+_WRITING_CANDIDATE_SQL_BY_VARIANT = {
+    (has_excluded, has_limit): _WRITING_CANDIDATE_SQL_TEMPLATE.format(
+        exclude_clause='AND id NOT IN (SELECT UNNEST(?::INTEGER[]))' if has_excluded else '',
+        limit_clause='LIMIT ?' if has_limit else '',
+    )
+    for has_excluded in (False, True)
+    for has_limit in (False, True)
+}
+
+
 def get_writing_candidate_rows(conn, deck_ids, session_type, excluded_card_ids=None, limit=None):
     """Return ordered candidate cards for writing sheets: newly-added (never-seen) or latest-failed."""
     normalized_deck_ids = normalize_positive_int_list(deck_ids)
@@ -38,54 +99,15 @@ def get_writing_candidate_rows(conn, deck_ids, session_type, excluded_card_ids=N
         if parsed_limit > 0:
             safe_limit = parsed_limit
 
-    deck_placeholders = ','.join(['?'] * len(normalized_deck_ids))
-    params = [*normalized_deck_ids]
-    exclude_clause = ''
+    params = [normalized_deck_ids]
     if excluded:
-        excluded_placeholders = ','.join(['?'] * len(excluded))
-        exclude_clause = f"AND c.id NOT IN ({excluded_placeholders})"
-        params.extend(excluded)
-
-    limit_clause = ''
+        params.append(excluded)
+    params.append(str(session_type))
     if safe_limit is not None:
-        limit_clause = 'LIMIT ?'
         params.append(safe_limit)
 
-    return conn.execute(
-        f"""
-        WITH latest AS (
-            SELECT
-                sr.card_id,
-                sr.correct,
-                COALESCE(s.completed_at, s.started_at, sr.timestamp) AS latest_seen_at,
-                ROW_NUMBER() OVER (
-                    PARTITION BY sr.card_id
-                    ORDER BY COALESCE(s.completed_at, s.started_at, sr.timestamp) DESC, sr.id DESC
-                ) AS rn
-            FROM session_results sr
-            JOIN sessions s ON s.id = sr.session_id
-            WHERE s.type = ?
-        )
-        SELECT
-            c.id,
-            c.front,
-            c.back,
-            l.correct,
-            l.latest_seen_at
-        FROM cards c
-        LEFT JOIN latest l ON l.card_id = c.id AND l.rn = 1
-        WHERE c.deck_id IN ({deck_placeholders})
-          AND COALESCE(c.skip_practice, FALSE) = FALSE
-          AND (l.card_id IS NULL OR l.correct < 0)
-          {exclude_clause}
-        ORDER BY
-          CASE WHEN l.card_id IS NULL THEN 1 ELSE 0 END DESC,
-          COALESCE(l.latest_seen_at, c.created_at) DESC,
-          c.id DESC
-        {limit_clause}
-        """,
-        [str(session_type), *params]
-    ).fetchall()
+    sql = _WRITING_CANDIDATE_SQL_BY_VARIANT[(bool(excluded), safe_limit is not None)]
+    return conn.execute(sql, params).fetchall()
 
 
 def get_writing_candidate_card_ids(conn, deck_ids, session_type, excluded_card_ids=None, limit=None):
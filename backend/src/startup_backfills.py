@@ -1,8 +1,12 @@
 """Startup tasks for kid DBs."""
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.db import kid_db
 
+# Kid DBs are independent DuckDB files, so the startup schema sync fans out.
+_STARTUP_SCHEMA_SYNC_MAX_WORKERS = 8
+
 
 def _iter_kid_db_paths():
     """Yield all kid DB files currently present on disk."""
@@ -17,12 +21,22 @@ def ensure_kid_db_schema(logger):
     updated_paths = []
     errors = []
 
-    for db_path in _iter_kid_db_paths() or []:
+    def _ensure_one(db_path):
         try:
             kid_db.ensure_kid_database_schema_by_path(str(db_path))
-            updated_paths.append(str(db_path))
         except Exception as exc:
-            errors.append(f'{db_path}: {exc}')
+            return f'{db_path}: {exc}'
+        return None
+
+    db_paths = list(_iter_kid_db_paths() or [])
+    if db_paths:
+        max_workers = min(_STARTUP_SCHEMA_SYNC_MAX_WORKERS, len(db_paths))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='kid-schema-sync') as executor:
+            for db_path, error in zip(db_paths, executor.map(_ensure_one, db_paths)):
+                if error:
+                    errors.append(error)
+                else:
+                    updated_paths.append(str(db_path))
 
     if updated_paths:
         logger.info(
@@ -4,6 +4,7 @@ import ast
 import math
 import random
 from fractions import Fraction
+from functools import lru_cache
 
 TYPE4_PREVIEW_MAX_SAMPLES = 10
 TYPE4_RUNTIME_MAX_SAMPLES = 5000
@@ -100,25 +101,32 @@ def _normalize_type4_sample(raw_result, index):
     return result
 
 
-def _load_type4_generate_function(generator_code):
-    """Compile one generator snippet and return its generate(rng) callable."""
-    code = str(generator_code or '').replace('\r\n', '\n').replace('\r', '\n').strip()
-    if not code:
-        raise ValueError('generatorCode is required')
-
+@lru_cache(maxsize=128)
+def _compile_type4_generator_code(code):
+    """Parse, validate and compile one normalized snippet (cached per source text)."""
     try:
         tree = ast.parse(code, mode='exec')
     except SyntaxError as exc:
         raise ValueError(f'Python syntax error on line {exc.lineno}: {exc.msg}') from exc
     _validate_type4_tree(tree)
+    return compile(tree, '<type4_generator>', 'exec')
+
+
+def _load_type4_generate_function(generator_code):
+    """Compile one generator snippet and return its generate(rng) callable."""
+    code = str(generator_code or '').replace('\r\n', '\n').replace('\r', '\n').strip()
+    if not code:
+        raise ValueError('generatorCode is required')
 
+    compiled = _compile_type4_generator_code(code)
+    # Fresh globals per load so snippets never share module-level state.
     env = {
         '__builtins__': TYPE4_ALLOWED_BUILTINS,
         'Fraction': Fraction,
         'math': math,
     }
     try:
-        exec(compile(tree, '<type4_generator>', 'exec'), env, env)
+        exec(compiled, env, env)
     except Exception as exc:
         raise ValueError(f'Failed to load generator: {exc}') from exc
 